@@ -0,0 +1,62 @@
+"""Benchmark de l'accélérateur compilé (Cython) contre le Python pur.
+
+Chaque opération est mesurée avec timeit sur les deux implémentations de
+Fraction ; le gain est le rapport des temps. L'accélérateur doit d'abord
+être compilé avec `python build_accelerator.py`.
+
+Usage : python benchmarks/bench_accelerator.py [nombre_d_itérations]
+"""
+import importlib.util
+import os
+import sys
+import timeit
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "../"))
+sys.path.append(ROOT)
+
+OPERATIONS = {
+    "construction": "F(6, 8)",
+    "addition": "a + b",
+    "soustraction": "a - b",
+    "multiplication": "a * b",
+    "division": "a / b",
+    "égalité": "a == b",
+    "comparaison": "a < b",
+    "addition (grands)": "x + y",
+    "multiplication (grands)": "x * y",
+}
+
+
+def load_pure():
+    """Charge fraction.py sous un autre nom : l'accélérateur n'est pas utilisé."""
+    spec = importlib.util.spec_from_file_location("fraction_pure", os.path.join(ROOT, "fraction.py"))
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def measure(module, statement, number):
+    F = module.Fraction
+    namespace = {"F": F, "a": F(3, 7), "b": F(-5, 11),
+                 "x": F(3**80 + 1, 2**90 + 7), "y": F(5**60 - 2, 7**50)}
+    return min(timeit.repeat(statement, globals=namespace, number=number, repeat=5)) / number
+
+
+def main():
+    number = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    pure = load_pure()
+    # Même contrôle qu'à l'import de fraction : extension voisine et à jour
+    _fraction_accel = pure._load_accelerator(os.path.join(ROOT, "fraction.py"))
+    if _fraction_accel is None:
+        print("Accélérateur absent ou périmé : lancer d'abord python build_accelerator.py")
+        sys.exit(1)
+    print(f"{'opération':<25} {'Python (ns)':>12} {'Cython (ns)':>12} {'gain':>7}")
+    for name, statement in OPERATIONS.items():
+        t_pure = measure(pure, statement, number)
+        t_fast = measure(_fraction_accel, statement, number)
+        print(f"{name:<25} {t_pure * 1e9:>12.0f} {t_fast * 1e9:>12.0f} "
+              f"{t_pure / t_fast:>6.2f}x")
+
+
+if __name__ == "__main__":
+    main()
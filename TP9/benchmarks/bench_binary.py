@@ -0,0 +1,60 @@
+"""Comparaison du format binaire compact avec le format texte.
+
+Mesure la taille des fichiers, le temps d'écriture, le temps d'ouverture
+(mmap, indépendant du nombre de fractions) et le temps de lecture complète.
+
+Usage : python benchmarks/bench_binary.py [nombre_de_fractions]
+"""
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../")))
+from fraction import Fraction
+from fraction_binary import open_binary, write_binary
+from fraction_io import read_fractions, write_fractions
+
+
+def timed(func):
+    start = time.perf_counter()
+    result = func()
+    return result, time.perf_counter() - start
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    rng = random.Random(0)
+    values = [Fraction(rng.randint(-10**12, 10**12), rng.randint(1, 10**12))
+              for _ in range(count)]
+
+    with tempfile.TemporaryDirectory() as directory:
+        text_path = os.path.join(directory, "fractions.txt")
+        binary_path = os.path.join(directory, "fractions.bin")
+
+        with open(text_path, "w", encoding="utf-8") as file:
+            _, t_text_write = timed(lambda: write_fractions(file, values))
+        with open(binary_path, "wb") as file:
+            _, t_bin_write = timed(lambda: write_binary(file, values))
+
+        with open(text_path, "rb") as file:
+            _, t_text_read = timed(lambda: sum(1 for _ in read_fractions(file)))
+        reader, t_open = timed(lambda: open_binary(binary_path))
+        with reader:
+            _, t_bin_read = timed(lambda: sum(1 for _ in reader))
+            _, t_scan = timed(lambda: sum(reader.denominators))
+
+        print(f"{count} fractions")
+        print(f"  taille texte      {os.path.getsize(text_path) / 1e6:10.1f} Mo")
+        print(f"  taille binaire    {os.path.getsize(binary_path) / 1e6:10.1f} Mo")
+        print(f"  écriture texte    {t_text_write * 1e3:10.1f} ms")
+        print(f"  écriture binaire  {t_bin_write * 1e3:10.1f} ms")
+        print(f"  lecture texte     {t_text_read * 1e3:10.1f} ms")
+        print(f"  ouverture binaire {t_open * 1e3:10.3f} ms")
+        print(f"  lecture binaire   {t_bin_read * 1e3:10.1f} ms (objets Fraction)")
+        print(f"  parcours memoryview des dénominateurs {t_scan * 1e3:10.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
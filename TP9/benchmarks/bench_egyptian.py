@@ -0,0 +1,46 @@
+"""Benchmark des requêtes de voisinage : AdjacencyIndex contre un parcours
+complet avec `Fraction.is_adjacent_to`.
+
+Pour un ensemble de N fractions tirées au hasard, chaque requête « quelles
+fractions sont voisines de x ? » est résolue par un parcours de tout
+l'ensemble, puis par l'index (progression arithmétique ou fenêtre triée).
+
+Usage : python benchmarks/bench_egyptian.py [nombre_de_fractions] [requêtes]
+"""
+import os
+import random
+import sys
+import time
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../")))
+from fraction import Fraction
+from fraction_egyptian import AdjacencyIndex
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    queries = int(sys.argv[2]) if len(sys.argv) > 2 else 200
+    rng = random.Random(0)
+    values = [Fraction(rng.randint(-1000, 1000), rng.randint(1, 1000)) for _ in range(count)]
+    targets = rng.sample(values, queries)
+
+    start = time.perf_counter()
+    scan = [[f for f in values if f.is_adjacent_to(x)] for x in targets]
+    t_scan = time.perf_counter() - start
+
+    start = time.perf_counter()
+    index = AdjacencyIndex(values)
+    t_build = time.perf_counter() - start
+    start = time.perf_counter()
+    found = [index.neighbours(x) for x in targets]
+    t_index = time.perf_counter() - start
+
+    assert [sorted(set(r)) for r in scan] == found
+    print(f"{count} fractions, {queries} requêtes")
+    print(f"parcours complet : {t_scan:8.3f} s")
+    print(f"index (création) : {t_build:8.3f} s")
+    print(f"index (requêtes) : {t_index:8.3f} s   gain {t_scan / t_index:.0f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+"""Débit (lignes par seconde) de la lecture et de l'écriture de fractions.
+
+Compare read_fractions sur un fichier binaire, un fichier texte et un mmap
+avec une lecture naïve ligne par ligne (`split('/')`), puis mesure
+write_fractions dans les deux formats.
+
+Usage : python benchmarks/bench_io.py [nombre_de_lignes]
+"""
+import mmap
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../")))
+from fraction import Fraction
+from fraction_io import read_fractions, write_fractions
+
+
+def naive_read(path):
+    with open(path, encoding="utf-8") as file:
+        for line in file:
+            parts = line.strip().split("/")
+            yield Fraction(int(parts[0]), int(parts[1]) if len(parts) > 1 else 1)
+
+
+def timed(label, count, func):
+    start = time.perf_counter()
+    func()
+    elapsed = time.perf_counter() - start
+    print(f"{label:<32} {count / elapsed:14,.0f} lignes/s")
+
+
+def consume(iterator):
+    for _ in iterator:
+        pass
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 500_000
+    rng = random.Random(0)
+    values = [Fraction(rng.randint(-10**6, 10**6), rng.randint(1, 10**4))
+              for _ in range(count)]
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "fractions.txt")
+        mixed_path = os.path.join(directory, "mixtes.txt")
+
+        with open(path, "w", encoding="utf-8") as file:
+            timed("write_fractions (n/d)", count, lambda: write_fractions(file, values))
+        with open(mixed_path, "w", encoding="utf-8") as file:
+            timed("write_fractions (mixte)", count,
+                  lambda: write_fractions(file, values, mixed=True))
+
+        timed("lecture naïve split('/')", count, lambda: consume(naive_read(path)))
+        with open(path, encoding="utf-8") as file:
+            timed("read_fractions (texte)", count, lambda: consume(read_fractions(file)))
+        with open(path, "rb") as file:
+            timed("read_fractions (binaire)", count, lambda: consume(read_fractions(file)))
+        with open(path, "rb") as file, \
+                mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            timed("read_fractions (mmap)", count, lambda: consume(read_fractions(mapped)))
+        with open(mixed_path, "rb") as file:
+            timed("read_fractions (mixte, binaire)", count,
+                  lambda: consume(read_fractions(file)))
+
+
+if __name__ == "__main__":
+    main()
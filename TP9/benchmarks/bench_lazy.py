@@ -0,0 +1,76 @@
+"""Benchmark de la simplification différée (LazyFraction) contre Fraction.
+
+Chaque scénario est une longue chaîne de calcul dont seul le résultat
+final est observé. Le rapport indique où la simplification différée
+est rentable, et où elle ne l'est pas :
+- produits de termes premiers entre eux, sommes à dénominateur commun :
+  les PGCD calculés par Fraction à chaque étape simplifient peu,
+  LazyFraction gagne ;
+- somme harmonique : sans simplification, les dénominateurs croissent
+  comme une factorielle au lieu du PPCM, LazyFraction perd dès que
+  la chaîne dépasse quelques centaines de termes.
+
+Usage : python benchmarks/bench_lazy.py [longueur_des_chaînes]
+"""
+import os
+import random
+import sys
+import timeit
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../")))
+from fraction import Fraction
+from lazy_fraction import LazyFraction
+
+
+def common_denominator_sum(cls, n):
+    rng = random.Random(1)
+    total = cls(0)
+    for _ in range(n):
+        total = total + cls(rng.randint(-1000, 1000), 1024)
+    return str(total)
+
+
+def coprime_product(cls, n):
+    total = cls(1)
+    for k in range(1, n + 1):
+        total = total * cls(2 * k + 1, 2 * k + 3)
+    return str(total)
+
+
+def mixed_chain(cls, n):
+    rng = random.Random(2)
+    total = cls(1)
+    for _ in range(n):
+        f = cls(rng.randint(1, 50), rng.randint(1, 50))
+        total = total * f + f
+    return str(total)
+
+
+def harmonic_sum(cls, n):
+    total = cls(0)
+    for k in range(1, n + 1):
+        total = total + cls(1, k)
+    return str(total)
+
+
+SCENARIOS = [
+    ("somme, dénominateur commun", common_denominator_sum),
+    ("produit télescopique", coprime_product),
+    ("chaîne a*f + f", mixed_chain),
+    ("somme harmonique", harmonic_sum),
+]
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    print(f"{'scénario':<28} {'Fraction (ms)':>14} {'Lazy (ms)':>10} {'gain':>6}")
+    for name, scenario in SCENARIOS:
+        assert scenario(Fraction, n) == scenario(LazyFraction, n)
+        t_eager = min(timeit.repeat(lambda: scenario(Fraction, n), number=1, repeat=5))
+        t_lazy = min(timeit.repeat(lambda: scenario(LazyFraction, n), number=1, repeat=5))
+        print(f"{name:<28} {t_eager * 1e3:14.2f} {t_lazy * 1e3:10.2f} "
+              f"{t_eager / t_lazy:5.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""Benchmark de mise à l'échelle de FractionMatrix (élimination de Bareiss).
+
+Compare le déterminant et la résolution d'un système par Bareiss avec une
+élimination de Gauss naïve qui crée une Fraction à chaque opération sur
+une case, pour des matrices de 10 x 10 à 200 x 200.
+
+Usage : python benchmarks/bench_matrix.py [taille_max] [taille_max_naïf]
+"""
+import os
+import random
+import sys
+import time
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../")))
+from fraction import Fraction
+from fraction_matrix import FractionMatrix
+
+SIZES = (10, 25, 50, 100, 200)
+
+
+def naive_solve(rows, b):
+    """Élimination de Gauss-Jordan sur des objets Fraction."""
+    n = len(rows)
+    m = [list(row) + [value] for row, value in zip(rows, b)]
+    for col in range(n):
+        pivot = next(r for r in range(col, n) if not m[r][col].is_zero())
+        m[col], m[pivot] = m[pivot], m[col]
+        inverse = Fraction(1) / m[col][col]
+        m[col] = [value * inverse for value in m[col]]
+        for r in range(n):
+            if r != col and not m[r][col].is_zero():
+                factor = m[r][col]
+                m[r] = [a - factor * p for a, p in zip(m[r], m[col])]
+    return [row[n] for row in m]
+
+
+def timed(func):
+    start = time.perf_counter()
+    result = func()
+    return result, time.perf_counter() - start
+
+
+def main():
+    max_size = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    max_naive = int(sys.argv[2]) if len(sys.argv) > 2 else 50
+    rng = random.Random(0)
+    print(f"{'taille':>6} {'det (s)':>9} {'solve (s)':>10} {'Gauss naïf (s)':>15} {'gain':>7}")
+    for n in SIZES:
+        if n > max_size:
+            break
+        rows = [[Fraction(rng.randint(-9, 9), rng.randint(1, 9)) for _ in range(n)]
+                for _ in range(n)]
+        b = [Fraction(rng.randint(-9, 9), rng.randint(1, 9)) for _ in range(n)]
+        matrix = FractionMatrix(rows)
+        _, t_det = timed(matrix.determinant)
+        x, t_solve = timed(lambda: matrix.solve(b))
+        if n <= max_naive:
+            expected, t_naive = timed(lambda: naive_solve(rows, b))
+            assert x == expected
+            print(f"{n:>6} {t_det:>9.3f} {t_solve:>10.3f} {t_naive:>15.3f} "
+                  f"{t_naive / t_solve:>6.1f}x")
+        else:
+            print(f"{n:>6} {t_det:>9.3f} {t_solve:>10.3f} {'-':>15} {'-':>7}")
+
+
+if __name__ == "__main__":
+    main()
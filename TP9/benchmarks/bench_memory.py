@@ -0,0 +1,93 @@
+"""Mesure de l'empreinte mémoire de la classe Fraction.
+
+Compare la Fraction à `__slots__` de ce TP avec l'ancienne version à
+`__dict__` (identique à celle du TP7) et avec `fractions.Fraction`. La
+même classe sans les emplacements de cache (_float, _hash) donne le coût
+de ces caches.
+
+Usage : python benchmarks/bench_memory.py [nombre_de_fractions]
+"""
+import fractions
+import gc
+import os
+import sys
+import tracemalloc
+from math import gcd
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../")))
+from fraction import Fraction
+
+
+class DictFraction:
+    """Stockage de l'ancienne Fraction : num/den dans un __dict__.
+
+    La réduction est la même que celle de Fraction : les deux classes
+    gardent les mêmes objets entiers, seul le stockage de l'instance diffère.
+    """
+
+    def __init__(self, num=0, den=1):
+        pgcd = gcd(num, den)
+        if pgcd != 1:
+            num //= pgcd
+            den //= pgcd
+        if den < 0:
+            num, den = -num, -den
+        self.num = num
+        self.den = den
+
+
+class UncachedFraction:
+    """Fraction à `__slots__` sans les caches de __float__ et __hash__."""
+
+    __slots__ = ("num", "den")
+
+    def __init__(self, num=0, den=1):
+        pgcd = gcd(num, den)
+        if pgcd != 1:
+            num //= pgcd
+            den //= pgcd
+        if den < 0:
+            num, den = -num, -den
+        self.num = num
+        self.den = den
+
+
+def measure(factory, count):
+    """
+    Retourne le nombre moyen d'octets alloués par instance.
+
+    PRE : factory(num, den) construit une fraction, count > 0
+    POST : Retourne la mémoire allouée divisée par count
+    """
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    # Numérateurs premiers avec 1_000_003 : aucun partage d'objets réduits
+    values = [factory(i, 1_000_003) for i in range(1, count + 1)]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    # La liste elle-même n'est pas comptée
+    used = after - before - sys.getsizeof(values)
+    del values
+    return used / count
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    results = [
+        ("Fraction (__slots__)", measure(Fraction, count)),
+        ("Fraction (__dict__)", measure(DictFraction, count)),
+        ("fractions.Fraction", measure(fractions.Fraction, count)),
+        ("Fraction sans cache", measure(UncachedFraction, count)),
+    ]
+    print(f"Mémoire par instance ({count} fractions) :")
+    for name, per_instance in results:
+        print(f"  {name:<22} {per_instance:8.1f} octets")
+    saving = results[1][1] - results[0][1]
+    print(f"Gain de __slots__ sur __dict__ : {saving:.1f} octets par instance "
+          f"({saving / results[1][1]:.0%})")
+    print(f"Coût des caches _float et _hash : {results[0][1] - results[3][1]:.1f} octets par instance")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,44 @@
+"""Benchmark du coût de l'instrumentation (fraction_metrics).
+
+Mesure une boucle d'additions et de multiplications avant activation,
+pendant l'instrumentation, puis après désactivation (qui doit retrouver
+le temps de départ : les méthodes d'origine sont remises en place).
+
+Usage : python benchmarks/bench_metrics.py [nombre_d_opérations]
+"""
+import os
+import sys
+import timeit
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../")))
+from fraction import Fraction
+import fraction_metrics
+
+
+def workload(count):
+    total = Fraction(0)
+    step = Fraction(1, 7)
+    for i in range(count):
+        total = total + step * Fraction(i % 5 + 1, 3)
+    return total
+
+
+def measure(count):
+    return min(timeit.repeat(lambda: workload(count), number=1, repeat=5))
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 20_000
+    before = measure(count)
+    fraction_metrics.enable()
+    enabled = measure(count)
+    fraction_metrics.disable()
+    after = measure(count)
+    print(f"désactivée (avant) : {before:.4f} s")
+    print(f"activée            : {enabled:.4f} s   ({enabled / before:.2f}x)")
+    print(f"désactivée (après) : {after:.4f} s   ({after / before:.2f}x)")
+    print(fraction_metrics.to_prometheus().split("# HELP fraction_operand_bits")[0])
+
+
+if __name__ == "__main__":
+    main()
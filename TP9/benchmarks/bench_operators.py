@@ -0,0 +1,79 @@
+"""Micro-benchmark des opérateurs arithmétiques de Fraction.
+
+Compare, pour chaque opérateur, l'implémentation actuelle (constructeur
+interne + formules de Henrici) avec l'ancienne approche qui développait
+les produits puis repassait par `Fraction(num, den)` et un PGCD complet.
+
+Usage : python benchmarks/bench_operators.py [nombre_de_répétitions]
+"""
+import os
+import random
+import sys
+import timeit
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../")))
+from fraction import Fraction
+
+
+def naive_add(a, b):
+    return Fraction(a.num * b.den + b.num * a.den, a.den * b.den)
+
+
+def naive_sub(a, b):
+    return Fraction(a.num * b.den - b.num * a.den, a.den * b.den)
+
+
+def naive_mul(a, b):
+    return Fraction(a.num * b.num, a.den * b.den)
+
+
+def naive_truediv(a, b):
+    return Fraction(a.num * b.den, a.den * b.num)
+
+
+OPERATORS = [
+    ("+", lambda a, b: a + b, naive_add),
+    ("-", lambda a, b: a - b, naive_sub),
+    ("*", lambda a, b: a * b, naive_mul),
+    ("/", lambda a, b: a / b, naive_truediv),
+]
+
+
+def operands(digits, count=64, seed=0):
+    """
+    Génère des paires de fractions dont les termes ont `digits` chiffres.
+
+    Les dénominateurs partagent un facteur commun, comme c'est le cas
+    dans les longues chaînes de calcul.
+    """
+    rng = random.Random(seed)
+    low, high = 10 ** (digits - 1), 10 ** digits
+    common = rng.randrange(low, high)
+    pairs = []
+    for _ in range(count):
+        a = Fraction(rng.randrange(low, high), common * rng.randrange(1, 1000))
+        b = Fraction(rng.randrange(low, high), common * rng.randrange(1, 1000))
+        pairs.append((a, b))
+    return pairs
+
+
+def bench(func, pairs, number):
+    timer = timeit.Timer(lambda: [func(a, b) for a, b in pairs])
+    return min(timer.repeat(repeat=5, number=number)) / (number * len(pairs))
+
+
+def main():
+    number = int(sys.argv[1]) if len(sys.argv) > 1 else 50
+    print(f"{'chiffres':>8} {'op':>3} {'naïf (µs)':>11} {'rapide (µs)':>12} {'gain':>6}")
+    for digits in (2, 20, 200, 2000):
+        pairs = operands(digits)
+        reps = max(1, number // digits) if digits > 20 else number
+        for symbol, fast, naive in OPERATORS:
+            t_naive = bench(naive, pairs, reps) * 1e6
+            t_fast = bench(fast, pairs, reps) * 1e6
+            print(f"{digits:>8} {symbol:>3} {t_naive:>11.2f} {t_fast:>12.2f} "
+                  f"{t_naive / t_fast:>5.2f}x")
+
+
+if __name__ == "__main__":
+    main()
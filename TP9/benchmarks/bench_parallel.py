@@ -0,0 +1,60 @@
+"""Benchmark de mise à l'échelle de parallel_sum / parallel_prod.
+
+Mesure le temps pour 1 à N processus (N = nombre de processeurs par
+défaut) et affiche l'accélération par rapport au calcul séquentiel
+(Fraction.sum et produit de gauche à droite). Le pool de processus est
+créé avant la mesure, comme dans un programme qui le réutilise.
+
+Usage : python benchmarks/bench_parallel.py [nombre_de_fractions] [N]
+"""
+import os
+import random
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../")))
+from fraction import Fraction
+from fraction_parallel import parallel_prod, parallel_sum
+
+
+def timed(func):
+    start = time.perf_counter()
+    result = func()
+    return result, time.perf_counter() - start
+
+
+def sequential_prod(values):
+    total = Fraction(1)
+    for f in values:
+        total = total * f
+    return total
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    max_workers = int(sys.argv[2]) if len(sys.argv) > 2 else os.cpu_count() or 1
+    rng = random.Random(0)
+    values = [Fraction(rng.randint(-10**6, 10**6), rng.randint(1, 10**6))
+              for _ in range(count)]
+    # Le produit fait grossir les termes très vite : liste plus courte
+    factors = values[:count // 20]
+
+    expected_sum, t_sum = timed(lambda: Fraction.sum(values))
+    expected_prod, t_prod = timed(lambda: sequential_prod(factors))
+    print(f"séquentiel : somme {t_sum:.3f} s, produit {t_prod:.3f} s")
+    print(f"{'processus':>9} {'somme (s)':>10} {'gain':>6} {'produit (s)':>12} {'gain':>6}")
+    for workers in range(1, max_workers + 1):
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            # Démarrage des processus hors mesure
+            list(pool.map(abs, range(workers)))
+            result, t_psum = timed(lambda: parallel_sum(values, workers, pool))
+            assert result == expected_sum
+            result, t_pprod = timed(lambda: parallel_prod(factors, workers, pool))
+            assert result == expected_prod
+        print(f"{workers:>9} {t_psum:>10.3f} {t_sum / t_psum:>5.2f}x "
+              f"{t_pprod:>12.3f} {t_prod / t_pprod:>5.2f}x")
+
+
+if __name__ == "__main__":
+    main()
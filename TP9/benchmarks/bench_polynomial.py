@@ -0,0 +1,72 @@
+"""Benchmark de FractionPolynomial contre le calcul naïf avec Fraction.
+
+- évaluation : Horner sur des entiers contre Horner avec des Fraction ;
+- évaluation en lot : evaluate_many sur des points de même dénominateur ;
+- multiplication : Karatsuba sur les numérateurs entiers contre le
+  produit naïf case par case avec des Fraction.
+
+Usage : python benchmarks/bench_polynomial.py
+"""
+import os
+import random
+import sys
+import time
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../")))
+from fraction import Fraction
+from fraction_polynomial import FractionPolynomial
+
+
+def naive_eval(coefficients, x):
+    result = Fraction(0)
+    for c in reversed(coefficients):
+        result = result * x + c
+    return result
+
+
+def naive_mul(a, b):
+    result = [Fraction(0)] * (len(a) + len(b) - 1)
+    for i, x in enumerate(a):
+        for j, y in enumerate(b):
+            result[i + j] = result[i + j] + x * y
+    return result
+
+
+def timed(func):
+    start = time.perf_counter()
+    result = func()
+    return result, time.perf_counter() - start
+
+
+def main():
+    rng = random.Random(0)
+    print(f"{'degré':>6} {'opération':<14} {'naïf (ms)':>10} {'polynôme (ms)':>14} {'gain':>7}")
+    for degree in (10, 50, 200, 800):
+        coefficients = [Fraction(rng.randint(-99, 99), rng.randint(1, 99))
+                        for _ in range(degree + 1)]
+        other = [Fraction(rng.randint(-99, 99), rng.randint(1, 99))
+                 for _ in range(degree + 1)]
+        points = [Fraction(rng.randint(-99, 99), 64) for _ in range(50)]
+        p = FractionPolynomial(coefficients)
+        q = FractionPolynomial(other)
+
+        rows = [
+            ("évaluation", lambda: [naive_eval(coefficients, x) for x in points],
+             lambda: [p(x) for x in points]),
+            ("évaluation lot", lambda: [naive_eval(coefficients, x) for x in points],
+             lambda: p.evaluate_many(points)),
+        ]
+        if degree <= 200:
+            rows.append(("multiplication",
+                         lambda: FractionPolynomial(naive_mul(coefficients, other)),
+                         lambda: p * q))
+        for name, naive, fast in rows:
+            expected, t_naive = timed(naive)
+            result, t_fast = timed(fast)
+            assert result == expected
+            print(f"{degree:>6} {name:<14} {t_naive * 1e3:>10.2f} {t_fast * 1e3:>14.2f} "
+                  f"{t_naive / t_fast:>6.1f}x")
+
+
+if __name__ == "__main__":
+    main()
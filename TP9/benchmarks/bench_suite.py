@@ -0,0 +1,217 @@
+"""Suite de benchmarks de référence pour la classe Fraction.
+
+Mesure la construction, `_simplify`, chaque opérateur, `as_mixed_number`,
+`__str__` et `is_adjacent_to` pour des opérandes de 1 à 10 000 chiffres,
+avec `fractions.Fraction` comme référence. Les opérandes sont tirés avec
+une graine fixe : deux exécutions (sur deux versions du code) mesurent
+exactement les mêmes calculs et leurs fichiers JSON sont comparables.
+
+Usage :
+    python benchmarks/bench_suite.py -o avant.json [--filter add] [--quick]
+    python benchmarks/bench_suite.py -o apres.json
+    python benchmarks/bench_suite.py --compare avant.json apres.json
+
+    # Avec pyperf (processus isolés, format JSON de pyperf) :
+    python benchmarks/bench_suite.py --pyperf -o resultats.json
+    python -m pyperf compare_to avant.json apres.json
+"""
+import argparse
+import fractions
+import json
+import os
+import platform
+import random
+import statistics
+import sys
+import time
+import timeit
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../")))
+from fraction import Fraction
+
+SIZES = (1, 10, 100, 1000, 10000)
+QUICK_SIZES = (1, 100)
+SEED = 2021
+
+# Écart relatif au-delà duquel --compare signale une régression
+REGRESSION_THRESHOLD = 0.10
+
+
+def make_unreduced(cls, num, den):
+    """
+    Construit une fraction non simplifiée, pour mesurer `_simplify` seul.
+
+    Fonctionne avec la Fraction à `__slots__` comme avec l'ancienne
+    version à `__dict__`, afin de comparer des versions différentes.
+    """
+    obj = object.__new__(cls)
+    try:
+        cls.num.__set__(obj, num)
+        cls.den.__set__(obj, den)
+    except AttributeError:
+        obj.__dict__.update(num=num, den=den)
+    return obj
+
+
+def random_int(rng, digits):
+    return rng.randrange(10 ** (digits - 1), 10 ** digits) if digits > 1 \
+        else rng.randrange(1, 10)
+
+
+def cases(sizes):
+    """
+    Génère les cas de benchmark (nom, fonction sans argument).
+
+    Les noms ont la forme `<implémentation>/<opération>/<chiffres>d`.
+    """
+    rng = random.Random(SEED)
+    for digits in sizes:
+        n1, d1, n2, d2, k = (random_int(rng, digits) for _ in range(5))
+        # Fraction impropre (partie entière non nulle) et négative
+        n1 = -(n1 + 2 * d1)
+        for impl, cls in (("fraction", Fraction), ("stdlib", fractions.Fraction)):
+            a = cls(n1, d1)
+            b = cls(n2, d2)
+            prefix = f"{impl}/"
+            suffix = f"/{digits}d"
+            nk, dk = n1 * k, d1 * k
+            yield prefix + "init" + suffix, lambda cls=cls, nk=nk, dk=dk: cls(nk, dk)
+            if impl == "fraction":
+                yield prefix + "simplify" + suffix, \
+                    lambda cls=cls, nk=nk, dk=dk: make_unreduced(cls, nk, dk)._simplify()
+            yield prefix + "add" + suffix, lambda a=a, b=b: a + b
+            yield prefix + "sub" + suffix, lambda a=a, b=b: a - b
+            yield prefix + "mul" + suffix, lambda a=a, b=b: a * b
+            yield prefix + "truediv" + suffix, lambda a=a, b=b: a / b
+            yield prefix + "pow" + suffix, lambda a=a: a ** 3
+            yield prefix + "eq" + suffix, lambda a=a, b=b: a == b
+            yield prefix + "lt" + suffix, lambda a=a, b=b: a < b
+            yield prefix + "str" + suffix, lambda a=a: str(a)
+            if impl == "fraction":
+                yield prefix + "as_mixed_number" + suffix, lambda a=a: a.as_mixed_number()
+                yield prefix + "is_adjacent_to" + suffix, lambda a=a, b=b: a.is_adjacent_to(b)
+
+
+def supported(func):
+    """Retourne False si l'opération n'existe pas dans cette version."""
+    try:
+        func()
+    except (TypeError, AttributeError, ValueError):
+        return False
+    return True
+
+
+def time_case(func, repeat):
+    """
+    Mesure une fonction avec timeit.
+
+    POST : Retourne la liste des durées par appel (en secondes),
+        une valeur par répétition
+    """
+    timer = timeit.Timer(func)
+    loops, _ = timer.autorange()
+    return [t / loops for t in timer.repeat(repeat=repeat, number=loops)]
+
+
+def run_timeit(args):
+    sizes = QUICK_SIZES if args.quick else SIZES
+    results = {}
+    for name, func in cases(sizes):
+        if args.filter and args.filter not in name:
+            continue
+        if not supported(func):
+            print(f"{name:<40} non supporté")
+            continue
+        values = time_case(func, args.repeat)
+        results[name] = {
+            "mean": statistics.fmean(values),
+            "stdev": statistics.stdev(values) if len(values) > 1 else 0.0,
+            "min": min(values),
+            "values": values,
+        }
+        print(f"{name:<40} {results[name]['mean'] * 1e6:12.3f} µs")
+
+    if args.output:
+        document = {
+            "meta": {
+                "python": platform.python_version(),
+                "platform": platform.platform(),
+                "date": time.strftime("%Y-%m-%dT%H:%M:%S"),
+                "seed": SEED,
+            },
+            "benchmarks": results,
+        }
+        with open(args.output, "w", encoding="utf-8") as file:
+            json.dump(document, file, indent=1)
+
+
+def run_pyperf():
+    import pyperf
+
+    def add_cmdline_args(cmd, args):
+        cmd.append("--pyperf")
+        if args.filter:
+            cmd.extend(("--filter", args.filter))
+        if args.quick:
+            cmd.append("--quick")
+
+    runner = pyperf.Runner(add_cmdline_args=add_cmdline_args)
+    runner.argparser.add_argument("--filter")
+    runner.argparser.add_argument("--quick", action="store_true")
+    args = runner.parse_args()
+    for name, func in cases(QUICK_SIZES if args.quick else SIZES):
+        if args.filter and args.filter not in name:
+            continue
+        if supported(func):
+            runner.bench_func(name, func)
+
+
+def compare(old_path, new_path):
+    """
+    Compare deux fichiers JSON produits par cette suite.
+
+    POST : Affiche le rapport nouveau/ancien de chaque benchmark commun et
+        retourne le nombre de régressions (> REGRESSION_THRESHOLD)
+    """
+    with open(old_path, encoding="utf-8") as file:
+        old = json.load(file)["benchmarks"]
+    with open(new_path, encoding="utf-8") as file:
+        new = json.load(file)["benchmarks"]
+
+    regressions = 0
+    print(f"{'benchmark':<40} {'avant (µs)':>12} {'après (µs)':>12} {'rapport':>8}")
+    for name in sorted(old.keys() & new.keys()):
+        before, after = old[name]["min"], new[name]["min"]
+        ratio = after / before
+        flag = ""
+        if ratio > 1 + REGRESSION_THRESHOLD:
+            flag = "  RÉGRESSION"
+            regressions += 1
+        print(f"{name:<40} {before * 1e6:12.3f} {after * 1e6:12.3f} {ratio:7.2f}x{flag}")
+    for name in sorted(old.keys() ^ new.keys()):
+        print(f"{name:<40} présent dans un seul fichier")
+    return regressions
+
+
+def main():
+    if "--pyperf" in sys.argv:
+        sys.argv.remove("--pyperf")
+        run_pyperf()
+        return
+
+    parser = argparse.ArgumentParser(description="Benchmarks de la classe Fraction")
+    parser.add_argument("-o", "--output", help="Fichier JSON de résultats")
+    parser.add_argument("--filter", help="Ne lancer que les benchmarks dont le nom contient ce texte")
+    parser.add_argument("--quick", action="store_true", help="Tailles réduites (1 et 100 chiffres)")
+    parser.add_argument("--repeat", type=int, default=5, help="Nombre de répétitions")
+    parser.add_argument("--compare", nargs=2, metavar=("AVANT", "APRES"),
+                        help="Comparer deux fichiers de résultats")
+    args = parser.parse_args()
+
+    if args.compare:
+        sys.exit(1 if compare(*args.compare) else 0)
+    run_timeit(args)
+
+
+if __name__ == "__main__":
+    main()
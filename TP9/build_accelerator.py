@@ -0,0 +1,70 @@
+"""Compile l'accélérateur optionnel de la classe Fraction avec Cython.
+
+Le source compilé est `fraction.py` lui-même (aucun code dupliqué) : il est
+copié sous le nom `_fraction_accel.py`, traduit en C par Cython puis
+compilé en une extension placée à côté de `fraction.py`. Au prochain
+import, `fraction` utilise automatiquement cette extension ; il suffit de
+la supprimer (ou de définir FRACTION_PURE_PYTHON=1) pour revenir au
+Python pur. L'empreinte SHA-256 de `fraction.py` est inscrite dans
+l'extension : après toute modification du source, l'extension est
+ignorée (avec un avertissement) jusqu'à la prochaine compilation.
+
+Prérequis : Cython et un compilateur C.
+
+Usage : python build_accelerator.py
+"""
+import hashlib
+import os
+import sys
+import tempfile
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+MODULE = "_fraction_accel"
+
+
+def build() -> str:
+    """
+    Compile fraction.py en extension `_fraction_accel`.
+
+    PRE : Cython et setuptools sont installés, un compilateur C est disponible
+    POST : L'extension est écrite dans le dossier de fraction.py ;
+        retourne son chemin
+    RAISES : ImportError si Cython ou setuptools est absent
+    """
+    from Cython.Build import cythonize
+    from setuptools import Distribution, Extension
+
+    with tempfile.TemporaryDirectory() as tmp:
+        source = os.path.join(tmp, MODULE + ".py")
+        with open(os.path.join(HERE, "fraction.py"), "rb") as file:
+            code = file.read()
+        # Empreinte vérifiée à l'import par fraction._load_accelerator
+        with open(source, "wb") as file:
+            file.write(code + f'\n_SOURCE_HASH = "{hashlib.sha256(code).hexdigest()}"\n'.encode())
+        # Sans typage par les annotations : le code compilé garde
+        # exactement la sémantique Python (int de taille quelconque, etc.).
+        # binding=False : méthodes compilées appelées sans objet intermédiaire
+        extensions = cythonize(
+            [Extension(MODULE, [source])], build_dir=tmp, quiet=True,
+            compiler_directives={"language_level": 3, "annotation_typing": False,
+                                 "binding": False})
+        distribution = Distribution({"ext_modules": extensions})
+        command = distribution.get_command_obj("build_ext")
+        command.build_lib = HERE
+        command.build_temp = tmp
+        command.ensure_finalized()
+        command.run()
+        return command.get_ext_fullpath(MODULE)
+
+
+def main():
+    try:
+        path = build()
+    except ImportError:
+        print("Cython et setuptools sont nécessaires : pip install cython setuptools")
+        sys.exit(1)
+    print(f"Accélérateur compilé : {path}")
+
+
+if __name__ == "__main__":
+    main()
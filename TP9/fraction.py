@@ -1,5 +1,29 @@
+import hashlib
+import importlib.machinery
+import importlib.util
+import numbers
+import operator
+import os
+import sys
+import warnings
+from collections import OrderedDict
+from decimal import Decimal
 from math import gcd
 
+# Table d'internement (désactivée par défaut, voir configure_interning) :
+# toutes les fractions n/d avec |n|, |d| <= 16 sont partagées en
+# permanence, les autres valeurs fréquentes passent par un cache LRU borné.
+_INTERN_SMALL_LIMIT = 16
+_INTERN_MAXSIZE = 1024
+
+# Fraction.sum : simplification des sommes partielles tous les 2**4 termes
+_SUM_REDUCE_LEVEL = 4
+
+# Hash numérique de CPython : valeur modulo le nombre premier P
+# (voir « Hashing of numeric types » dans la documentation de Python)
+_HASH_MODULUS = sys.hash_info.modulus
+_HASH_INF = sys.hash_info.inf
+
 
 class Fraction:
     """Class representing a fraction and operations on it
@@ -7,13 +31,29 @@ class Fraction:
     Author : V. Van den Schrieck
     Date : October 2021
     This class allows fraction manipulations through several operations.
+
+    Les instances sont immuables et stockées dans des `__slots__` (pas de
+    `__dict__` par instance) : elles peuvent donc servir de clés de
+    dictionnaire ou d'éléments d'ensemble.
     """
 
-    def __init__(self, num: int = 0, den: int = 1) -> None:
+    # _float, _hash : valeurs mémorisées au premier appel de __float__ / __hash__.
+    # Ces deux emplacements coûtent 16 octets par instance (64 au lieu de 48,
+    # mesuré par benchmarks/bench_memory.py ; un seul coûterait autant, les
+    # blocs alloués allant par 16 octets), mais un hash mémorisé est environ
+    # 6 fois plus rapide que l'inverse modulaire recalculé à chaque
+    # recherche dans un dict ou un set.
+    __slots__ = ("num", "den", "_float", "_hash")
+
+    def __new__(cls, num: int = 0, den: int = 1) -> 'Fraction':
         """
-        Initialise une fraction avec un numérateur et un dénominateur.
+        Crée une fraction avec un numérateur et un dénominateur.
+
+        Si la table d'internement est active, une valeur déjà connue est
+        renvoyée sous forme d'instance partagée (sans allocation ni PGCD).
 
-        PRE : den != 0 (le dénominateur ne doit pas être égal à zéro)
+        PRE : den != 0 (le dénominateur ne doit pas être égal à zéro) ;
+            `num` est un entier ou un numbers.Rational (Fraction(r) == r)
         POST : La fraction est créée et simplifiée
         (par exemple, 4/8 devient 1/2)
         RAISES : ValueError si le dénominateur est égal à zéro
@@ -21,10 +61,28 @@ class Fraction:
         if den == 0:
             raise ValueError(
                 "Le dénominateur ne peut pas être zéro.")
-
-        self.num = num
-        self.den = den
-        self._simplify()
+        if type(num) is not int and isinstance(num, numbers.Rational):
+            num, den = num.numerator, num.denominator * den
+
+        table = _intern
+        if table.enabled and cls is Fraction \
+                and type(num) is int and type(den) is int:
+            key = (num, den)
+            obj = table.lookup(key)
+            if obj is not None:
+                return obj
+            obj = object.__new__(cls)
+            _set_num(obj, num)
+            _set_den(obj, den)
+            obj._simplify()
+            table.store(key, obj)
+            return obj
+
+        obj = object.__new__(cls)
+        _set_num(obj, num)
+        _set_den(obj, den)
+        obj._simplify()
+        return obj
 
     def _simplify(self):
         """
@@ -34,14 +92,52 @@ class Fraction:
         PRE : num et den sont des entiers, den != 0
         POST : num et den sont simplifiés
         """
-        pgcd = gcd(self.num, self.den)
-        self.num //= pgcd
-        self.den //= pgcd
+        num = self.num
+        den = self.den
+        pgcd = gcd(num, den)
+        # Cas le plus courant (fraction déjà réduite) : pas de nouveaux entiers
+        if pgcd != 1:
+            num //= pgcd
+            den //= pgcd
 
         # Etre sûr que le dénominateur est toujours positif
-        if self.den < 0:
-            self.num = -self.num
-            self.den = -self.den
+        if den < 0:
+            num = -num
+            den = -den
+
+        # Seul endroit (avec __init__) où les slots sont écrits
+        _set_num(self, num)
+        _set_den(self, den)
+
+    def __setattr__(self, name, value):
+        """
+        Interdit toute modification d'une fraction après sa création.
+
+        PRE : Aucune
+        POST : Aucune (la fraction n'est jamais modifiée)
+        RAISES : AttributeError dans tous les cas
+        """
+        raise AttributeError("Une fraction est immuable.")
+
+    def __delattr__(self, name):
+        """
+        Interdit la suppression des attributs d'une fraction.
+
+        PRE : Aucune
+        POST : Aucune (la fraction n'est jamais modifiée)
+        RAISES : AttributeError dans tous les cas
+        """
+        raise AttributeError("Une fraction est immuable.")
+
+    def __reduce__(self):
+        """
+        Permet la sérialisation (pickle, copy) d'une fraction immuable.
+
+        PRE : Aucune
+        POST : Retourne le constructeur et ses arguments (num, den)
+        RAISES : Aucune
+        """
+        return (Fraction, (self.num, self.den))
 
     @property
     def numerator(self) -> int:
@@ -106,129 +202,174 @@ class Fraction:
 
 # ------------------ Operators overloading ------------------
 
-    def __add__(self, other: 'Fraction') -> 'Fraction':
+    def __add__(self, other) -> 'Fraction':
         """
         Surcharge de l'opérateur + pour l'addition de fractions.
 
         PRE :
-        - `other` doit être une instance de la classe Fraction.
-        - Les dénominateurs des fractions doivent être non nuls.
+        - `other` doit être une Fraction, un entier, un float, un Decimal
+        ou un autre nombre rationnel (numbers.Rational).
 
         POST :
         - Retourne une nouvelle fraction simplifiée
-        représentant la somme des deux fractions.
-        - Ne modifie pas les fractions initiales (`self` et `other`).
+        représentant la somme exacte des deux opérandes.
+        - Ne modifie pas les opérandes initiaux (`self` et `other`).
 
         RAISES :
-        - TypeError si `other` n'est pas une instance de Fraction.
-        - ValueError si le dénominateur de l'une des fractions est nul.
+        - TypeError si `other` n'est pas d'un type supporté.
+        - ValueError / OverflowError si `other` est un float
+        ou un Decimal non fini (nan, inf).
         """
-        if not isinstance(other, Fraction):
-            raise TypeError(
-                "L'opérande doit être une instance de la classe Fraction.")
-        if self.den == 0 or other.den == 0:
-            raise ValueError(
-                "Le dénominateur ne peut pas être égal à zéro.")
-
-        # Calcul de la somme en utilisant un dénominateur commun
-        num = self.num * other.den + other.num * self.den
-        den = self.den * other.den
-
-        return Fraction(num, den)
-
-    def __sub__(self, other: 'Fraction') -> 'Fraction':
+        if isinstance(other, Fraction):
+            # Les opérandes sont déjà réduits : algorithme de Henrici
+            return Fraction._add(self.num, self.den, other.num, other.den)
+        if isinstance(other, int):
+            # gcd(num + n*den, den) = gcd(num, den) = 1 : déjà réduite
+            return Fraction._from_reduced(self.num + other * self.den, self.den)
+        pair = _as_pair(other)
+        if pair is None:
+            return NotImplemented
+        return Fraction._add(self.num, self.den, pair[0], pair[1])
+
+    # L'addition est commutative
+    __radd__ = __add__
+
+    def __sub__(self, other) -> 'Fraction':
         """
         Surcharge de l'opérateur - pour la soustraction de fractions.
 
         PRE :
-        - `other` doit être une instance de la classe Fraction.
-        - Les dénominateurs des fractions doivent être non nuls.
+        - `other` doit être une Fraction, un entier, un float, un Decimal
+        ou un autre nombre rationnel (numbers.Rational).
 
         POST :
         - Retourne une nouvelle fraction simplifiée
-        représentant la différence entre les deux fractions.
-        - Ne modifie pas les fractions initiales (`self` et `other`).
+        représentant la différence exacte entre les deux opérandes.
+        - Ne modifie pas les opérandes initiaux (`self` et `other`).
 
         RAISES :
-        - TypeError si `other` n'est pas une instance de Fraction.
-        - ValueError si le dénominateur de l'une des fractions est nul.
+        - TypeError si `other` n'est pas d'un type supporté.
+        - ValueError / OverflowError si `other` est un float
+        ou un Decimal non fini (nan, inf).
         """
-        if not isinstance(other, Fraction):
-            raise TypeError(
-                "L'opérande doit être une instance de la classe Fraction.")
-        if self.den == 0 or other.den == 0:
-            raise ValueError(
-                "Le dénominateur ne peut pas être égal à zéro.")
-
-        # Calcul de la différence en utilisant un dénominateur commun
-        num = self.num * other.den - other.num * self.den
-        den = self.den * other.den
-
-        return Fraction(num, den)
+        if isinstance(other, Fraction):
+            return Fraction._add(self.num, self.den, -other.num, other.den)
+        if isinstance(other, int):
+            return Fraction._from_reduced(self.num - other * self.den, self.den)
+        pair = _as_pair(other)
+        if pair is None:
+            return NotImplemented
+        return Fraction._add(self.num, self.den, -pair[0], pair[1])
+
+    def __rsub__(self, other) -> 'Fraction':
+        """
+        Soustraction `other - self` lorsque `other` n'est pas une Fraction.
 
-    def __mul__(self, other: 'Fraction') -> 'Fraction':
+        PRE : `other` est un entier, un float, un Decimal ou un numbers.Rational
+        POST : Retourne une nouvelle fraction simplifiée
+        RAISES : Voir __sub__
+        """
+        if isinstance(other, int):
+            return Fraction._from_reduced(other * self.den - self.num, self.den)
+        pair = _as_pair(other)
+        if pair is None:
+            return NotImplemented
+        return Fraction._add(pair[0], pair[1], -self.num, self.den)
+
+    def __mul__(self, other) -> 'Fraction':
         """
         Surcharge de l'opérateur * pour la multiplication de fractions.
 
         PRE :
-        - `other` doit être une instance de la classe Fraction.
-        - Les dénominateurs des fractions doivent être non nuls.
+        - `other` doit être une Fraction, un entier, un float, un Decimal
+        ou un autre nombre rationnel (numbers.Rational).
 
         POST :
         - Retourne une nouvelle fraction simplifiée
-        représentant le produit des deux fractions.
-        - Ne modifie pas les fractions initiales (`self` et `other`).
+        représentant le produit exact des deux opérandes.
+        - Ne modifie pas les opérandes initiaux (`self` et `other`).
 
         RAISES :
-        - TypeError si `other` n'est pas une instance de Fraction.
-        - ValueError si le dénominateur de l'une des fractions est nul.
+        - TypeError si `other` n'est pas d'un type supporté.
+        - ValueError / OverflowError si `other` est un float
+        ou un Decimal non fini (nan, inf).
         """
-        if not isinstance(other, Fraction):
-            raise TypeError(
-                "L'opérande doit être une instance de la classe Fraction.")
-        if self.den == 0 or other.den == 0:
-            raise ValueError("Le dénominateur ne peut pas être égal à zéro.")
-
-        # Calcul du produit
-        num = self.num * other.num
-        den = self.den * other.den
-
-        return Fraction(num, den)
-
-    def __truediv__(self, other: 'Fraction') -> 'Fraction':
+        if isinstance(other, Fraction):
+            return Fraction._mul(self.num, self.den, other.num, other.den)
+        if isinstance(other, int):
+            # Un seul PGCD suffit : le numérateur est déjà premier avec den
+            pgcd = gcd(other, self.den)
+            return Fraction._from_reduced(
+                self.num * (other // pgcd), self.den // pgcd)
+        pair = _as_pair(other)
+        if pair is None:
+            return NotImplemented
+        return Fraction._mul(self.num, self.den, pair[0], pair[1])
+
+    # La multiplication est commutative
+    __rmul__ = __mul__
+
+    def __truediv__(self, other) -> 'Fraction':
         """
         Surcharge de l'opérateur / pour la division de fractions.
 
         PRE :
-        - `other` doit être une instance de la classe Fraction.
-        - Le numérateur de `other` ne doit pas être égal à zéro.
-        - Les dénominateurs des fractions doivent être non nuls.
+        - `other` doit être une Fraction, un entier, un float, un Decimal
+        ou un autre nombre rationnel (numbers.Rational).
+        - `other` ne doit pas être nul.
 
         POST :
         - Retourne une nouvelle fraction
-        simplifiée représentant le quotient des deux fractions.
-        - Ne modifie pas les fractions initiales (`self` et `other`).
+        simplifiée représentant le quotient exact des deux opérandes.
+        - Ne modifie pas les opérandes initiaux (`self` et `other`).
 
         RAISES :
-        - TypeError si `other` n'est pas une instance de Fraction.
-        - ZeroDivisionError si le numérateur de `other` est zéro.
-        - ValueError si le dénominateur de l'une des fractions est nul.
+        - TypeError si `other` n'est pas d'un type supporté.
+        - ZeroDivisionError si `other` est nul.
+        - ValueError / OverflowError si `other` est un float
+        ou un Decimal non fini (nan, inf).
         """
-        if not isinstance(other, Fraction):
-            raise TypeError(
-                "L'opérande doit être une instance de la classe Fraction.")
-        if other.num == 0:
+        if isinstance(other, Fraction):
+            num, den = other.num, other.den
+        elif isinstance(other, int):
+            num, den = other, 1
+        else:
+            pair = _as_pair(other)
+            if pair is None:
+                return NotImplemented
+            num, den = pair
+        if num == 0:
             raise ZeroDivisionError(
                 "Division par une fraction avec un numérateur égal à zéro.")
-        if self.den == 0 or other.den == 0:
-            raise ValueError(
-                "Le dénominateur ne peut pas être égal à zéro.")
 
-        # Calcul du quotient
-        num = self.num * other.den
-        den = self.den * other.num
+        # a/b / c/d = a/b * d/c, en gardant le dénominateur positif
+        if num < 0:
+            return Fraction._mul(self.num, self.den, -den, -num)
+        return Fraction._mul(self.num, self.den, den, num)
+
+    def __rtruediv__(self, other) -> 'Fraction':
+        """
+        Division `other / self` lorsque `other` n'est pas une Fraction.
+
+        PRE :
+        - `other` est un entier, un float, un Decimal ou un numbers.Rational.
+        - Le numérateur de `self` ne doit pas être égal à zéro.
 
-        return Fraction(num, den)
+        POST : Retourne une nouvelle fraction simplifiée
+        RAISES : Voir __truediv__
+        """
+        if isinstance(other, int):
+            pair = (other, 1)
+        else:
+            pair = _as_pair(other)
+            if pair is None:
+                return NotImplemented
+        if self.num == 0:
+            raise ZeroDivisionError(
+                "Division par une fraction avec un numérateur égal à zéro.")
+        if self.num < 0:
+            return Fraction._mul(pair[0], pair[1], -self.den, -self.num)
+        return Fraction._mul(pair[0], pair[1], self.den, self.num)
 
     def __pow__(self, other):
         """
@@ -236,8 +377,7 @@ class Fraction:
 
         PRE :
         - `other` doit être un entier (positif, négatif ou nul).
-        - Le numérateur et le dénominateur de
-        la fraction ne doivent pas être nuls.
+        - Si `other` est négatif, le numérateur ne doit pas être nul.
 
         POST :
         - Retourne une nouvelle fraction représentant
@@ -247,62 +387,729 @@ class Fraction:
 
         RAISES :
         - TypeError si `other` n'est pas un entier.
-        - ValueError si le dénominateur de `self` est zéro.
+        - ValueError si `other` est négatif et que la fraction est nulle.
         """
         if not isinstance(other, int):
             raise TypeError("La puissance doit être un entier.")
-        if self.den == 0:
-            raise ValueError(
-                "Le dénominateur ne peut pas être égal à zéro.")
 
-        # Calcul de la puissance
+        # Les puissances de nombres premiers entre eux restent premières
+        # entre elles : aucune simplification n'est nécessaire.
         if other >= 0:
-            return Fraction(self.num ** other, self.den ** other)
-        else:
-            return Fraction(
-                self.den ** abs(other), self.num ** abs(other))
+            return Fraction._from_reduced(self.num ** other, self.den ** other)
+        if self.num == 0:
+            raise ValueError(
+                "Le dénominateur ne peut pas être zéro.")
+        if self.num < 0:
+            return Fraction._from_reduced(
+                (-self.den) ** -other, (-self.num) ** -other)
+        return Fraction._from_reduced(
+            self.den ** -other, self.num ** -other)
 
-    def __eq__(self, other: 'Fraction') -> bool:
+# ------------------ Exact conversions ------------------
+
+    @classmethod
+    def from_float(cls, value: float) -> 'Fraction':
         """
-        Surcharge de l'opérateur == pour comparer deux fractions.
+        Convertit exactement un float (ou un entier) en fraction.
 
-        PRE :
-        - `other` doit être une instance de la classe Fraction.
+        PRE : `value` est un float fini ou un entier
+        POST : Retourne la fraction égale à la valeur binaire de `value`
+            (par exemple 0.1 donne 3602879701896397/36028797018963968)
+        RAISES :
+        - TypeError si `value` n'est ni un float ni un entier
+        - ValueError si `value` est nan, OverflowError si `value` est infini
+        """
+        if isinstance(value, int):
+            return cls(value)
+        if not isinstance(value, float):
+            raise TypeError("La valeur doit être un float ou un entier.")
+        # as_integer_ratio renvoie déjà une fraction réduite, den > 0
+        return cls._from_reduced(*value.as_integer_ratio())
+
+    @classmethod
+    def from_decimal(cls, value: Decimal) -> 'Fraction':
+        """
+        Convertit exactement un Decimal (ou un entier) en fraction.
 
-        POST :
-        - Retourne True si les deux fractions
-        sont égales après simplification, sinon False.
+        PRE : `value` est un Decimal fini ou un entier
+        POST : Retourne la fraction égale à `value` (Decimal("1.25") donne 5/4)
+        RAISES :
+        - TypeError si `value` n'est ni un Decimal ni un entier
+        - ValueError si `value` est nan, OverflowError si `value` est infini
+        """
+        if isinstance(value, int):
+            return cls(value)
+        if not isinstance(value, Decimal):
+            raise TypeError("La valeur doit être un Decimal ou un entier.")
+        return cls._from_reduced(*value.as_integer_ratio())
+
+    @classmethod
+    def from_string(cls, text) -> 'Fraction':
+        """
+        Construit une fraction à partir de sa représentation textuelle.
+
+        Accepte les formats produits par `__str__` ("3/4", "-7") et par
+        `as_mixed_number` ("2 1/3"). Un nombre mixte "E r/d" vaut E + r/d,
+        comme dans `as_mixed_number` ("-3 2/3" vaut -7/3).
+
+        PRE : `text` est une chaîne (str ou bytes)
+        POST : Retourne la fraction simplifiée correspondante
+        RAISES : ValueError si le texte n'est pas une fraction valide
+            ou si le dénominateur est nul
+        """
+        num, den = _parse_pair(text)
+        return cls(num, den)
+
+# ------------------ Continued fractions ------------------
+
+    def as_continued_fraction(self):
+        """
+        Générateur des termes du développement en fraction continue.
 
+        Produit a0, a1, ..., an tels que la fraction vaut
+        a0 + 1/(a1 + 1/(... + 1/an)), avec a0 = partie entière (arrondie
+        vers le bas) et a1, ..., an > 0. Les termes sont calculés à la
+        demande par l'algorithme d'Euclide, uniquement sur des entiers.
+
+        PRE : Aucune
+        POST : Produit au moins un terme ; le dernier est > 1 s'il y en a plusieurs
+        RAISES : Aucune
+        """
+        num, den = self.num, self.den
+        while den:
+            q = num // den
+            yield q
+            num, den = den, num - q * den
+
+    @classmethod
+    def from_continued_fraction(cls, terms) -> 'Fraction':
+        """
+        Construit une fraction à partir des termes de sa fraction continue.
+
+        PRE : `terms` est un itérable non vide d'entiers
+        POST : Retourne a0 + 1/(a1 + 1/(... + 1/an)), simplifiée
         RAISES :
-        - TypeError si `other` n'est pas une instance de la classe Fraction.
+        - ValueError si `terms` est vide ou si un dénominateur
+          intermédiaire s'annule
+        - TypeError si un terme n'est pas un entier
         """
-        if not isinstance(other, Fraction):
-            raise TypeError(
-                "La comparaison n est que possible avec une autre fraction."
-            )
+        h0, h1 = 0, 1
+        k0, k1 = 1, 0
+        empty = True
+        for a in terms:
+            if not isinstance(a, int):
+                raise TypeError("Les termes doivent être des entiers.")
+            h0, h1 = h1, a * h1 + h0
+            k0, k1 = k1, a * k1 + k0
+            empty = False
+        if empty:
+            raise ValueError("La fraction continue doit avoir au moins un terme.")
+        if k1 == 0:
+            raise ValueError(
+                "Le dénominateur ne peut pas être zéro.")
+        # h1 * k0 - h0 * k1 = ±1 : h1 et k1 sont premiers entre eux
+        if k1 < 0:
+            return cls._from_reduced(-h1, -k1)
+        return cls._from_reduced(h1, k1)
+
+    def convergents(self):
+        """
+        Générateur des réduites (convergents) de la fraction continue.
+
+        PRE : Aucune
+        POST : Produit des fractions de plus en plus proches de `self`,
+            la dernière étant égale à `self`
+        RAISES : Aucune
+        """
+        h0, h1 = 0, 1
+        k0, k1 = 1, 0
+        for a in self.as_continued_fraction():
+            h0, h1 = h1, a * h1 + h0
+            k0, k1 = k1, a * k1 + k0
+            yield Fraction._from_reduced(h1, k1)
+
+    def limit_denominator(self, max_den: int = 1_000_000) -> 'Fraction':
+        """
+        Retourne la fraction la plus proche de `self` dont le dénominateur
+        ne dépasse pas `max_den`.
+
+        Permet de borner la taille des termes dans les longs calculs
+        itératifs. Le résultat est la dernière réduite admissible ou la
+        meilleure réduite intermédiaire (calcul sur des entiers uniquement).
+
+        PRE : max_den >= 1
+        POST : Retourne une fraction de dénominateur <= max_den, la plus
+            proche possible de `self` (`self` lui-même si son dénominateur
+            convient déjà)
+        RAISES : ValueError si max_den < 1
+        """
+        if max_den < 1:
+            raise ValueError("Le dénominateur maximal doit être au moins 1.")
+        if self.den <= max_den:
+            return self
+
+        p0, q0, p1, q1 = 0, 1, 1, 0
+        num, den = self.num, self.den
+        while True:
+            a = num // den
+            q2 = q0 + a * q1
+            if q2 > max_den:
+                break
+            p0, q0, p1, q1 = p1, q1, p0 + a * p1, q2
+            num, den = den, num - a * den
+
+        # Meilleure réduite intermédiaire et dernière réduite admissible
+        k = (max_den - q0) // q1
+        p2, q2 = p0 + k * p1, q0 + k * q1
+        # |p/q - x| = |p*den - num*q| / (q*den) : comparaison sur des entiers
+        error1 = abs(p1 * self.den - self.num * q1)
+        error2 = abs(p2 * self.den - self.num * q2)
+        if error1 * q2 <= error2 * q1:
+            return Fraction._from_reduced(p1, q1)
+        return Fraction._from_reduced(p2, q2)
+
+# ------------------ Bulk operations ------------------
+
+    @classmethod
+    def sum(cls, fractions) -> 'Fraction':
+        """
+        Retourne la somme exacte d'un itérable de fractions.
+
+        Les sommes partielles sont des couples d'entiers (num, den) combinés
+        par paires, comme un arbre binaire : les termes additionnés gardent
+        des tailles équilibrées. Le PGCD n'est calculé que périodiquement
+        puis une seule fois à la fin. L'itérable est parcouru une seule fois
+        (un générateur convient) avec une mémoire en O(log n).
+
+        PRE : `fractions` est un itérable d'instances de Fraction
+        POST : Retourne une nouvelle fraction simplifiée (0 si l'itérable est vide)
+        RAISES : TypeError si un élément n'est pas une instance de Fraction
+        """
+        return cls(*_sum_pairs(_checked_pairs(fractions)))
+
+# ------------------ Interning ------------------
+
+    @staticmethod
+    def configure_interning(enabled: bool = True,
+                            maxsize: int = _INTERN_MAXSIZE) -> None:
+        """
+        Active, désactive ou redimensionne la table d'internement.
+
+        PRE : maxsize >= 0 (0 conserve uniquement les petites fractions)
+        POST : La table est reconfigurée, son cache LRU et
+            ses compteurs sont remis à zéro
+        RAISES : ValueError si maxsize est négatif
+        """
+        if maxsize < 0:
+            raise ValueError("La taille du cache ne peut pas être négative.")
+        _intern.enabled = enabled
+        _intern.maxsize = maxsize
+        _intern.clear()
+
+    @staticmethod
+    def interning_info() -> dict:
+        """
+        Retourne l'état de la table d'internement.
+
+        PRE : Aucune
+        POST : Retourne un dictionnaire avec les clés `enabled`, `hits`,
+            `misses`, `size` (entrées du cache LRU) et `maxsize`
+        RAISES : Aucune
+        """
+        return {
+            "enabled": _intern.enabled,
+            "hits": _intern.hits,
+            "misses": _intern.misses,
+            "size": len(_intern.lru),
+            "maxsize": _intern.maxsize,
+        }
+
+# ------------------ Fast internal constructors ------------------
+
+    @classmethod
+    def _from_reduced(cls, num: int, den: int) -> 'Fraction':
+        """
+        Construit une fraction sans vérification ni simplification.
+
+        Réservé aux calculs internes dont le résultat est déjà réduit.
+
+        PRE : num et den sont des entiers premiers entre eux, den > 0
+        POST : Retourne une fraction num/den (aucun appel à gcd)
+        RAISES : Aucune
+        """
+        obj = object.__new__(cls)
+        _set_num(obj, num)
+        _set_den(obj, den)
+        return obj
+
+    @staticmethod
+    def _add(na: int, da: int, nb: int, db: int) -> 'Fraction':
+        """
+        Additionne na/da et nb/db (algorithme de Henrici).
+
+        Le PGCD est calculé sur les dénominateurs, plus petits que les
+        produits croisés ; quand il vaut 1, le résultat est déjà réduit.
+
+        PRE : na/da et nb/db sont réduites, da > 0, db > 0
+        POST : Retourne la fraction réduite na/da + nb/db
+        RAISES : Aucune
+        """
+        g = gcd(da, db)
+        if g == 1:
+            return Fraction._from_reduced(na * db + da * nb, da * db)
+        s = da // g
+        t = na * (db // g) + nb * s
+        g2 = gcd(t, g)
+        if g2 == 1:
+            return Fraction._from_reduced(t, s * db)
+        return Fraction._from_reduced(t // g2, s * (db // g2))
+
+    @staticmethod
+    def _mul(na: int, da: int, nb: int, db: int) -> 'Fraction':
+        """
+        Multiplie na/da par nb/db en simplifiant les termes croisés.
 
-        # Comparaison après simplification
-        return self.num * other.den == self.den * other.num
+        PRE : na/da et nb/db sont réduites, da > 0, db > 0
+        POST : Retourne la fraction réduite (na*nb)/(da*db)
+        RAISES : Aucune
+        """
+        g1 = gcd(na, db)
+        if g1 > 1:
+            na //= g1
+            db //= g1
+        g2 = gcd(nb, da)
+        if g2 > 1:
+            nb //= g2
+            da //= g2
+        return Fraction._from_reduced(na * nb, da * db)
+
+    def __eq__(self, other) -> bool:
+        """
+        Surcharge de l'opérateur == pour comparer une fraction à un nombre.
+
+        PRE : Aucune
+
+        POST :
+        - Retourne True si `other` (Fraction, int, float, Decimal ou tout
+        numbers.Rational) a exactement la même valeur, sinon False.
+        - Un flottant infini ou NaN n'est égal à aucune fraction.
+        - Retourne NotImplemented pour un type non numérique, afin que
+        Python essaie la comparaison inverse (puis l'identité).
+
+        RAISES : Aucune
+        """
+        if isinstance(other, Fraction):
+            # Les fractions sont toujours réduites avec un dénominateur
+            # positif : cette forme est unique, aucun produit n'est nécessaire
+            return self.num == other.num and self.den == other.den
+        try:
+            pair = _as_pair(other)
+        except (ValueError, OverflowError):
+            return False
+        if pair is None:
+            if isinstance(other, numbers.Complex) and other.imag == 0:
+                return self == other.real
+            return NotImplemented
+        return self.num == pair[0] and self.den == pair[1]
+
+    def __hash__(self) -> int:
+        """
+        Retourne le hash de la fraction, identique à celui de CPython pour
+        les nombres de même valeur (int, float, fractions.Fraction, Decimal).
+
+        Le hash vaut num * den^-1 modulo P = sys.hash_info.modulus ; il est
+        calculé une seule fois (inverse modulaire), puis mémorisé.
+
+        PRE : Aucune
+        POST : hash(Fraction(n)) == hash(n), hash(Fraction(1, 2)) == hash(0.5),
+            et deux fractions égales ont le même hash
+        RAISES : Aucune
+        """
+        try:
+            return self._hash
+        except AttributeError:
+            pass
+        try:
+            inverse = pow(self.den, -1, _HASH_MODULUS)
+        except ValueError:
+            # den multiple de P : pas d'inverse, même convention que CPython
+            value = _HASH_INF
+        else:
+            value = hash(hash(abs(self.num)) * inverse)
+        if self.num < 0:
+            value = -value
+        if value == -1:
+            value = -2
+        _set_hash(self, value)
+        return value
 
     def __float__(self) -> float:
         """
         Retourne la valeur décimale de la fraction.
 
-        PRE :
-        - Le numérateur et le dénominateur doivent être des entiers valides.
+        La division entière vraie de Python est correctement arrondie quelle
+        que soit la taille des entiers (elle travaille sur les bits de poids
+        fort). La fraction étant immuable, le résultat est mémorisé.
+
+        PRE : Aucune
 
         POST :
-        - Retourne un nombre à virgule flottante représentant la fraction.
+        - Retourne le flottant le plus proche de la fraction.
 
         RAISES :
-        - ZeroDivisionError si le dénominateur est égal à zéro.
+        - OverflowError si la valeur dépasse la capacité d'un flottant.
         """
-        if self.den == 0:
-            raise ZeroDivisionError(
-                "Le dénominateur ne peut pas être zéro.")
-        return self.num / self.den
+        try:
+            return self._float
+        except AttributeError:
+            pass
+        try:
+            value = self.num / self.den
+        except OverflowError:
+            raise OverflowError(
+                "La fraction est trop grande pour un flottant.") from None
+        _set_float(self, value)
+        return value
+
+# ------------------ numbers.Rational protocol ------------------
+
+    def __neg__(self) -> 'Fraction':
+        """
+        Opposé de la fraction (opérateur - unaire).
+
+        PRE : Aucune
+        POST : Retourne une nouvelle fraction de même dénominateur
+        RAISES : Aucune
+        """
+        return Fraction._from_reduced(-self.num, self.den)
+
+    def __pos__(self) -> 'Fraction':
+        """
+        Opérateur + unaire.
+
+        PRE : Aucune
+        POST : Retourne la fraction elle-même (elle est immuable)
+        RAISES : Aucune
+        """
+        return self
+
+    def __abs__(self) -> 'Fraction':
+        """
+        Valeur absolue de la fraction.
 
-# TODO : [BONUS] You can overload other operators if you wish (ex : <, >, ...)
+        PRE : Aucune
+        POST : Retourne une fraction positive ou nulle
+        RAISES : Aucune
+        """
+        return self if self.num >= 0 else Fraction._from_reduced(-self.num, self.den)
+
+    def __bool__(self) -> bool:
+        """
+        Valeur de vérité de la fraction.
+
+        PRE : Aucune
+        POST : Retourne False pour la fraction nulle, True sinon
+        RAISES : Aucune
+        """
+        return self.num != 0
+
+    @property
+    def real(self) -> 'Fraction':
+        """
+        Partie réelle (protocole numbers.Complex).
+
+        PRE : Aucune
+        POST : Retourne la fraction elle-même
+        RAISES : Aucune
+        """
+        return self
+
+    @property
+    def imag(self) -> int:
+        """
+        Partie imaginaire (protocole numbers.Complex).
+
+        PRE : Aucune
+        POST : Retourne 0
+        RAISES : Aucune
+        """
+        return 0
+
+    def conjugate(self) -> 'Fraction':
+        """
+        Conjugué (protocole numbers.Complex).
+
+        PRE : Aucune
+        POST : Retourne la fraction elle-même
+        RAISES : Aucune
+        """
+        return self
+
+    def __complex__(self) -> complex:
+        """
+        Conversion en nombre complexe de partie imaginaire nulle.
+
+        PRE : Aucune
+        POST : Retourne complex(float(self))
+        RAISES : OverflowError si la fraction est trop grande pour un flottant
+        """
+        return complex(float(self))
+
+    def as_integer_ratio(self) -> tuple:
+        """
+        Retourne le couple (numérateur, dénominateur), comme
+        int.as_integer_ratio et float.as_integer_ratio.
+
+        PRE : Aucune
+        POST : Retourne (num, den) réduit, avec den > 0
+        RAISES : Aucune
+        """
+        return self.num, self.den
+
+    def __trunc__(self) -> int:
+        """
+        Partie entière de la fraction, arrondie vers zéro.
+
+        PRE : Aucune
+        POST : Retourne un entier (int(Fraction(-7, 2)) == -3)
+        RAISES : Aucune
+        """
+        if self.num < 0:
+            return -(-self.num // self.den)
+        return self.num // self.den
+
+    __int__ = __trunc__
+
+    def __floor__(self) -> int:
+        """
+        Plus grand entier inférieur ou égal à la fraction (math.floor).
+
+        PRE : Aucune
+        POST : Retourne un entier (math.floor(Fraction(-7, 2)) == -4)
+        RAISES : Aucune
+        """
+        return self.num // self.den
+
+    def __ceil__(self) -> int:
+        """
+        Plus petit entier supérieur ou égal à la fraction (math.ceil).
+
+        PRE : Aucune
+        POST : Retourne un entier (math.ceil(Fraction(-7, 2)) == -3)
+        RAISES : Aucune
+        """
+        return -(-self.num // self.den)
+
+    def __round__(self, ndigits: int = None):
+        """
+        Arrondi au plus proche, les cas exactement à mi-chemin allant vers
+        le nombre pair (comme round() pour int et float).
+
+        PRE : `ndigits` est None ou un entier
+        POST : Retourne un entier si `ndigits` vaut None, sinon une Fraction
+            arrondie à 10**-ndigits près
+        RAISES : Aucune
+        """
+        if ndigits is None:
+            quotient, remainder = divmod(self.num, self.den)
+            if remainder * 2 < self.den:
+                return quotient
+            if remainder * 2 > self.den:
+                return quotient + 1
+            return quotient if quotient % 2 == 0 else quotient + 1
+        shift = 10 ** abs(ndigits)
+        if ndigits > 0:
+            return Fraction(round(self * shift), shift)
+        return Fraction(round(self / shift) * shift)
+
+    def __divmod__(self, other) -> tuple:
+        """
+        Division euclidienne exacte : (self // other, self % other).
+
+        PRE : `other` est une Fraction, un entier, un float, un Decimal ou
+            un numbers.Rational non nul
+        POST : Retourne (q, r) avec q entier, r Fraction du signe de
+            `other`, et q * other + r == self
+        RAISES :
+        - TypeError si `other` n'est pas d'un type supporté.
+        - ZeroDivisionError si `other` est nul.
+        """
+        pair = (other.num, other.den) if isinstance(other, Fraction) else _as_pair(other)
+        if pair is None:
+            return NotImplemented
+        return _divmod(self.num, self.den, *pair)
+
+    def __rdivmod__(self, other) -> tuple:
+        """
+        Division euclidienne exacte de `other` par la fraction.
+
+        PRE : `other` est un entier, un float, un Decimal ou un
+            numbers.Rational
+        POST : Retourne (other // self, other % self) (voir __divmod__)
+        RAISES : ZeroDivisionError si la fraction est nulle
+        """
+        pair = _as_pair(other)
+        if pair is None:
+            return NotImplemented
+        return _divmod(pair[0], pair[1], self.num, self.den)
+
+    def __floordiv__(self, other) -> int:
+        """
+        Surcharge de l'opérateur // (quotient de la division euclidienne).
+
+        PRE : voir __divmod__
+        POST : Retourne l'entier self // other
+        RAISES : voir __divmod__
+        """
+        result = self.__divmod__(other)
+        return result if result is NotImplemented else result[0]
+
+    def __rfloordiv__(self, other) -> int:
+        """
+        Surcharge de l'opérateur // lorsque la fraction est à droite.
+
+        PRE : voir __rdivmod__
+        POST : Retourne l'entier other // self
+        RAISES : voir __rdivmod__
+        """
+        result = self.__rdivmod__(other)
+        return result if result is NotImplemented else result[0]
+
+    def __mod__(self, other) -> 'Fraction':
+        """
+        Surcharge de l'opérateur % (reste de la division euclidienne).
+
+        PRE : voir __divmod__
+        POST : Retourne la fraction self % other, du signe de `other`
+        RAISES : voir __divmod__
+        """
+        result = self.__divmod__(other)
+        return result if result is NotImplemented else result[1]
+
+    def __rmod__(self, other) -> 'Fraction':
+        """
+        Surcharge de l'opérateur % lorsque la fraction est à droite.
+
+        PRE : voir __rdivmod__
+        POST : Retourne la fraction other % self, du signe de la fraction
+        RAISES : voir __rdivmod__
+        """
+        result = self.__rdivmod__(other)
+        return result if result is NotImplemented else result[1]
+
+    def __rpow__(self, other):
+        """
+        Puissance `other ** self` lorsque `other` n'est pas une Fraction.
+
+        PRE : `other` est un nombre
+        POST : Retourne le résultat exact (Fraction) si `self` est entier et
+            `other` rationnel, sinon other ** float(self)
+        RAISES : Comme l'opérateur ** de `other`
+        """
+        if self.den == 1:
+            pair = _as_pair(other) if not isinstance(other, float) else None
+            if pair is not None:
+                return Fraction._from_reduced(*pair) ** self.num
+            return other ** self.num
+        return other ** float(self)
+
+# ------------------ Ordering ------------------
+
+    def __lt__(self, other) -> bool:
+        """
+        Surcharge de l'opérateur < pour comparer une fraction à un nombre.
+
+        PRE : `other` est une Fraction, un entier, un float, un Decimal ou
+            un numbers.Rational
+        POST : Retourne True si `self` est strictement inférieure à `other` (toujours
+            False face à NaN)
+        RAISES : TypeError si `other` n'est pas d'un type supporté
+        """
+        if isinstance(other, Fraction):
+            # Dénominateurs lus une seule fois : moins d'accès aux attributs une fois compilé
+            da = self.den
+            db = other.den
+            if da == db:
+                return self.num < other.num
+            return self.num * db < other.num * da
+        return _compare(self, other, operator.lt)
+
+    def __le__(self, other) -> bool:
+        """
+        Surcharge de l'opérateur <= pour comparer une fraction à un nombre.
+
+        PRE : `other` est une Fraction, un entier, un float, un Decimal ou
+            un numbers.Rational
+        POST : Retourne True si `self` est inférieure ou égale à `other` (toujours
+            False face à NaN)
+        RAISES : TypeError si `other` n'est pas d'un type supporté
+        """
+        if isinstance(other, Fraction):
+            # Dénominateurs lus une seule fois : moins d'accès aux attributs une fois compilé
+            da = self.den
+            db = other.den
+            if da == db:
+                return self.num <= other.num
+            return self.num * db <= other.num * da
+        return _compare(self, other, operator.le)
+
+    def __gt__(self, other) -> bool:
+        """
+        Surcharge de l'opérateur > pour comparer une fraction à un nombre.
+
+        PRE : `other` est une Fraction, un entier, un float, un Decimal ou
+            un numbers.Rational
+        POST : Retourne True si `self` est strictement supérieure à `other` (toujours
+            False face à NaN)
+        RAISES : TypeError si `other` n'est pas d'un type supporté
+        """
+        if isinstance(other, Fraction):
+            # Dénominateurs lus une seule fois : moins d'accès aux attributs une fois compilé
+            da = self.den
+            db = other.den
+            if da == db:
+                return self.num > other.num
+            return self.num * db > other.num * da
+        return _compare(self, other, operator.gt)
+
+    def __ge__(self, other) -> bool:
+        """
+        Surcharge de l'opérateur >= pour comparer une fraction à un nombre.
+
+        PRE : `other` est une Fraction, un entier, un float, un Decimal ou
+            un numbers.Rational
+        POST : Retourne True si `self` est supérieure ou égale à `other` (toujours
+            False face à NaN)
+        RAISES : TypeError si `other` n'est pas d'un type supporté
+        """
+        if isinstance(other, Fraction):
+            # Dénominateurs lus une seule fois : moins d'accès aux attributs une fois compilé
+            da = self.den
+            db = other.den
+            if da == db:
+                return self.num >= other.num
+            return self.num * db >= other.num * da
+        return _compare(self, other, operator.ge)
+
+    def sort_key(self) -> tuple:
+        """
+        Retourne une clé de tri exacte et peu coûteuse à comparer.
+
+        La clé est le couple (approximation flottante, fraction). L'arrondi
+        vers un flottant est croissant : deux fractions d'approximations
+        différentes sont donc déjà ordonnées, et le produit croisé exact
+        n'est calculé qu'en cas d'égalité des flottants.
+        Usage : sorted(fractions, key=Fraction.sort_key)
+
+        PRE : Aucune
+        POST : Retourne un tuple comparable avec les clés d'autres fractions
+        RAISES : Aucune
+        """
+        try:
+            approx = float(self)
+        except OverflowError:
+            approx = float("inf") if self.num > 0 else float("-inf")
+        return (approx, self)
 
 # ------------------ Properties checking  ------------------
 
@@ -415,4 +1222,294 @@ class Fraction:
         return difference == 1
 
 
+def fsum_exact(fractions) -> Fraction:
+    """
+    Retourne la somme exacte d'un itérable de fractions (voir Fraction.sum).
+
+    PRE : `fractions` est un itérable d'instances de Fraction
+    POST : Retourne une nouvelle fraction simplifiée
+    RAISES : TypeError si un élément n'est pas une instance de Fraction
+    """
+    return Fraction.sum(fractions)
+
+
+def _parse_pair(text) -> tuple:
+    """
+    Découpe "n", "n/d" ou "E r/d" en un couple d'entiers (num, den).
+
+    PRE : `text` est une chaîne (str ou bytes)
+    POST : Retourne (num, den), non simplifié ; den peut être nul
+    RAISES : ValueError si le texte n'est pas une fraction valide
+    """
+    if isinstance(text, bytes):
+        slash, space = b"/", b" "
+    else:
+        slash, space = "/", " "
+    try:
+        head, sep, den = text.strip().rpartition(slash)
+        if not sep:
+            return int(den), 1
+        den = int(den)
+        whole, sep, num = head.strip().rpartition(space)
+        if not sep:
+            return int(num), den
+        num = int(num)
+        if num < 0 or den <= 0:
+            raise ValueError
+        return int(whole) * den + num, den
+    except ValueError:
+        raise ValueError(f"Fraction invalide : {text!r}") from None
+
+
+def _as_pair(other):
+    """
+    Convertit exactement un opérande non-Fraction en couple (num, den).
+
+    PRE : Aucune
+    POST : Retourne (num, den) réduit avec den > 0, ou None si le type
+        de `other` n'est pas supporté
+    RAISES : ValueError / OverflowError pour un float ou Decimal non fini
+    """
+    if isinstance(other, int):
+        return other, 1
+    if isinstance(other, (float, Decimal)):
+        return other.as_integer_ratio()
+    if isinstance(other, numbers.Rational):
+        num, den = int(other.numerator), int(other.denominator)
+        pgcd = gcd(num, den)
+        if den < 0:
+            pgcd = -pgcd
+        return num // pgcd, den // pgcd
+    return None
+
+
+def _compare(f: Fraction, other, op) -> bool:
+    """
+    Compare exactement une fraction à un opérande non-Fraction.
+
+    PRE : `op` est une fonction de comparaison du module operator
+    POST : Retourne op(f, other) ; NaN n'est ni inférieur ni supérieur à
+        une fraction, ±inf est au-delà de toutes les fractions
+    RAISES : Aucune (retourne NotImplemented pour un type non supporté)
+    """
+    try:
+        pair = _as_pair(other)
+    except (ValueError, OverflowError):
+        if other != other:
+            return False
+        return op(0, 1 if other > 0 else -1)
+    if pair is None:
+        return NotImplemented
+    if f.den == pair[1]:
+        return op(f.num, pair[0])
+    return op(f.num * pair[1], pair[0] * f.den)
+
+
+def _divmod(na: int, da: int, nb: int, db: int) -> tuple:
+    """Division euclidienne de na/da par nb/db : (quotient entier, reste)."""
+    if nb == 0:
+        raise ZeroDivisionError("Division par une fraction avec un numérateur égal à zéro.")
+    quotient, remainder = divmod(na * db, da * nb)
+    return quotient, Fraction(remainder, da * db)
+
+
+def _checked_pairs(fractions):
+    """Produit les couples (num, den) d'un itérable de fractions."""
+    for f in fractions:
+        if not isinstance(f, Fraction):
+            raise TypeError(
+                "L'opérande doit être une instance de la classe Fraction.")
+        yield f.num, f.den
+
+
+def _sum_pairs(pairs) -> tuple:
+    """
+    Additionne des couples (num, den) par paires (voir Fraction.sum).
+
+    PRE : `pairs` est un itérable de couples d'entiers avec den > 0
+    POST : Retourne la somme (num, den), den > 0, pas forcément simplifiée
+    RAISES : Aucune
+    """
+    # Pile de sommes partielles (num, den, niveau) : un niveau k
+    # représente la somme de 2**k fractions consécutives.
+    stack = []
+    for num, den in pairs:
+        level = 0
+        while stack and stack[-1][2] == level:
+            n, d, _ = stack.pop()
+            num, den = _raw_add(n, d, num, den)
+            level += 1
+            if level % _SUM_REDUCE_LEVEL == 0:
+                pgcd = gcd(num, den)
+                if pgcd > 1:
+                    num //= pgcd
+                    den //= pgcd
+        stack.append((num, den, level))
+
+    # Les niveaux restants sont combinés du plus petit au plus grand
+    num, den = 0, 1
+    while stack:
+        n, d, _ = stack.pop()
+        num, den = _raw_add(n, d, num, den)
+    return num, den
+
+
+def _raw_add(na: int, da: int, nb: int, db: int) -> tuple:
+    """
+    Additionne na/da et nb/db sans simplification.
+
+    PRE : da > 0, db > 0
+    POST : Retourne le couple (num, den) de la somme, den > 0
+    RAISES : Aucune
+    """
+    if da == db:
+        return na + nb, da
+    return na * db + nb * da, da * db
+
+
+# Écriture directe dans les slots, sans passer par __setattr__
+_set_num = Fraction.num.__set__
+_set_den = Fraction.den.__set__
+_set_float = Fraction._float.__set__
+_set_hash = Fraction._hash.__set__
+
+
+class _InternTable:
+    """Table d'internement des fractions, indexée par (num, den) bruts.
+
+    `small` contient toutes les petites fractions, non simplifiées
+    comprises, et n'est jamais vidée ; `lru` garde les `maxsize` autres
+    valeurs les plus récemment construites.
+    """
+
+    __slots__ = ("enabled", "maxsize", "small", "lru", "hits", "misses")
 
+    def __init__(self, maxsize: int) -> None:
+        self.enabled = False
+        self.maxsize = maxsize
+        self.small = {}
+        self.lru = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def lookup(self, key: tuple):
+        """
+        Cherche une fraction déjà construite pour le couple `key`.
+
+        PRE : key est un couple d'entiers (num, den), den != 0
+        POST : Retourne l'instance partagée ou None, met à jour les compteurs
+        RAISES : Aucune
+        """
+        f = self.small.get(key)
+        if f is None:
+            f = self.lru.get(key)
+            if f is None:
+                self.misses += 1
+                return None
+            self.lru.move_to_end(key)
+        self.hits += 1
+        return f
+
+    def store(self, key: tuple, f: Fraction) -> None:
+        """
+        Ajoute une fraction au cache LRU en évinçant la plus ancienne.
+
+        PRE : f est la fraction construite à partir de key
+        POST : Le cache contient au plus `maxsize` entrées
+        RAISES : Aucune
+        """
+        if self.maxsize:
+            self.lru[key] = f
+            if len(self.lru) > self.maxsize:
+                self.lru.popitem(last=False)
+
+    def clear(self) -> None:
+        self.lru.clear()
+        self.hits = 0
+        self.misses = 0
+
+
+def _fill_small_table(table: _InternTable) -> None:
+    """Construit une seule instance par petite valeur et l'associe à
+    toutes les écritures (num, den) qui s'y réduisent."""
+    limit = _INTERN_SMALL_LIMIT
+    for den in range(-limit, limit + 1):
+        if den == 0:
+            continue
+        for num in range(-limit, limit + 1):
+            pgcd = gcd(num, den)
+            reduced = (num // pgcd, den // pgcd)
+            if reduced[1] < 0:
+                reduced = (-reduced[0], -reduced[1])
+            f = table.small.get(reduced)
+            if f is None:
+                f = Fraction._from_reduced(*reduced)
+                table.small[reduced] = f
+            table.small[(num, den)] = f
+
+
+_intern = _InternTable(_INTERN_MAXSIZE)
+_fill_small_table(_intern)
+
+# Fraction implémente tout le protocole numbers.Rational (opérateurs
+# arithmétiques, ordre, conversions int/round/floor, real et imag)
+numbers.Rational.register(Fraction)
+
+
+# ------------------ Optional compiled backend ------------------
+
+# build_accelerator.py compile ce fichier avec Cython sous le nom
+# _fraction_accel. S'il est présent (et si la variable d'environnement
+# FRACTION_PURE_PYTHON n'est pas définie), ses définitions remplacent
+# celles de ce module : `from fraction import Fraction` donne alors la
+# version compilée, sans autre changement. Sinon, tout reste en Python.
+ACCELERATOR = "_fraction_accel"
+
+
+def _load_accelerator(source: str):
+    """
+    Charge l'extension compilée placée à côté du fichier `source`.
+
+    Seul le dossier de `source` est consulté (pas tout sys.path), et
+    l'extension doit avoir été compilée depuis ce fichier exactement :
+    build_accelerator.py y inscrit l'empreinte SHA-256 du source
+    (_SOURCE_HASH), comparée ici à celle de `source`.
+
+    PRE : `source` est le chemin de fraction.py
+    POST : Retourne le module compilé, ou None s'il est absent, s'il ne
+        peut pas être chargé ou s'il a été compilé depuis une autre
+        version de fraction.py (avec un avertissement dans ces deux cas)
+    RAISES : Aucune
+    """
+    folder = os.path.dirname(os.path.abspath(source))
+    finder = importlib.machinery.FileFinder(
+        folder, (importlib.machinery.ExtensionFileLoader, importlib.machinery.EXTENSION_SUFFIXES))
+    spec = finder.find_spec(ACCELERATOR)
+    if spec is None:
+        return None
+    with open(source, "rb") as file:
+        digest = hashlib.sha256(file.read()).hexdigest()
+    module = sys.modules.get(ACCELERATOR)
+    if module is None or getattr(module, "__file__", None) != spec.origin:
+        try:
+            module = importlib.util.module_from_spec(spec)
+            spec.loader.exec_module(module)
+        except ImportError as error:
+            warnings.warn(f"Accélérateur {spec.origin} ignoré : {error}")
+            return None
+    if getattr(module, "_SOURCE_HASH", None) != digest:
+        warnings.warn(f"Accélérateur {spec.origin} ignoré : il a été compilé depuis une "
+                      "autre version de fraction.py (relancer build_accelerator.py)")
+        return None
+    # Enregistré sous son nom : pickle retrouve les classes compilées
+    sys.modules[ACCELERATOR] = module
+    return module
+
+
+BACKEND = "python"
+if __name__ == "fraction" and not os.environ.get("FRACTION_PURE_PYTHON"):
+    _accelerator = _load_accelerator(__file__)
+    if _accelerator is not None:
+        globals().update((name, value) for name, value in vars(_accelerator).items()
+                         if not name.startswith("__"))
+        BACKEND = "cython"
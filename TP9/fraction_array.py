@@ -0,0 +1,562 @@
+import numpy as np
+
+from fraction import Fraction
+
+# |a|, |b|, |c|, |d| < 2**31  =>  a*d + c*b tient dans un int64
+_SAFE = 1 << 31
+_INT64_MIN = int(np.iinfo(np.int64).min)
+_INT64_MAX = int(np.iinfo(np.int64).max)
+# Tout entier de valeur absolue <= 2**53 est exactement représentable en float64
+_EXACT_FLOAT = 1 << 53
+
+
+class FractionArray:
+    """Tableau de fractions stocké sous forme de deux tableaux NumPy.
+
+    Les numérateurs et les dénominateurs sont conservés dans deux tableaux
+    `int64` de même forme. Chaque élément respecte les mêmes règles qu'une
+    `Fraction` : forme réduite, dénominateur strictement positif (le signe
+    est porté par le numérateur).
+    Lorsqu'un calcul risque de dépasser la capacité d'un int64, il est
+    effectué sur des entiers Python (dtype `object`) ; le résultat revient
+    en int64 dès qu'il y tient à nouveau.
+    """
+
+    __slots__ = ("num", "den")
+
+    # Empêche NumPy de traiter `ndarray + FractionArray` élément par élément
+    __array_ufunc__ = None
+
+    def __init__(self, num, den=1) -> None:
+        """
+        Initialise un tableau de fractions à partir des numérateurs
+        et des dénominateurs (diffusés selon les règles de NumPy).
+
+        PRE : num et den contiennent des entiers, aucun dénominateur nul
+        POST : Le tableau est créé et chaque fraction est simplifiée
+        RAISES :
+        - TypeError si num ou den contient autre chose que des entiers
+        - ValueError si un dénominateur est égal à zéro
+        """
+        num, den = np.broadcast_arrays(_as_int_array(num), _as_int_array(den))
+        if np.any(den == 0):
+            raise ValueError(
+                "Le dénominateur ne peut pas être zéro.")
+        if num.dtype != den.dtype:
+            num, den = num.astype(object), den.astype(object)
+        self.num, self.den = _reduce(num.copy(), den.copy())
+
+    @classmethod
+    def _from_reduced(cls, num, den) -> 'FractionArray':
+        """
+        Construit un tableau sans vérification ni simplification.
+
+        PRE : num et den sont des tableaux de même forme et de même dtype,
+            déjà réduits, avec des dénominateurs positifs
+        POST : Retourne un tableau qui référence num et den (sans copie)
+        RAISES : Aucune
+        """
+        obj = object.__new__(cls)
+        obj.num = num
+        obj.den = den
+        return obj
+
+    @classmethod
+    def from_fractions(cls, fractions) -> 'FractionArray':
+        """
+        Construit un tableau à partir d'un itérable de `Fraction`.
+
+        PRE : `fractions` ne contient que des instances de Fraction
+        POST : Retourne un tableau à une dimension de même longueur
+        RAISES : TypeError si un élément n'est pas une Fraction
+        """
+        nums, dens = [], []
+        for f in fractions:
+            if not isinstance(f, Fraction):
+                raise TypeError(
+                    "Les éléments doivent être des instances de la classe Fraction.")
+            nums.append(f.num)
+            dens.append(f.den)
+        num = _compact(np.array(nums, dtype=object))
+        den = _compact(np.array(dens, dtype=object))
+        if num.dtype != den.dtype:
+            num, den = num.astype(object), den.astype(object)
+        # Les fractions sont déjà réduites
+        return cls._from_reduced(num, den)
+
+# ------------------ Container protocol ------------------
+
+    @property
+    def shape(self) -> tuple:
+        """
+        Retourne la forme du tableau.
+
+        PRE : Aucune
+        POST : Retourne la forme commune de `num` et `den`
+        RAISES : Aucune
+        """
+        return self.num.shape
+
+    def __len__(self) -> int:
+        return len(self.num)
+
+    def __getitem__(self, index):
+        """
+        Retourne un élément (Fraction) ou un sous-tableau (FractionArray).
+
+        PRE : `index` est un index NumPy valide
+        POST : Retourne une Fraction si l'index désigne un seul élément,
+            sinon un FractionArray
+        RAISES : IndexError si l'index est hors limites
+        """
+        num = self.num[index]
+        den = self.den[index]
+        if isinstance(num, np.ndarray):
+            return FractionArray._from_reduced(num, den)
+        return Fraction._from_reduced(int(num), int(den))
+
+    def __iter__(self):
+        for n, d in zip(self.num.ravel(), self.den.ravel()):
+            yield Fraction._from_reduced(int(n), int(d))
+
+    def to_fractions(self) -> list:
+        """
+        Retourne la liste des éléments sous forme de `Fraction`.
+
+        PRE : Aucune
+        POST : Retourne une liste (à plat) de Fraction
+        RAISES : Aucune
+        """
+        return list(self)
+
+    def __repr__(self) -> str:
+        return "FractionArray([" + ", ".join(str(f) for f in self) + "])"
+
+# ------------------ Operators overloading ------------------
+
+    def __add__(self, other) -> 'FractionArray':
+        """
+        Addition élément par élément.
+
+        PRE : `other` est un FractionArray, une Fraction ou un entier
+        POST : Retourne un nouveau tableau de fractions réduites
+        RAISES : TypeError si `other` n'est pas d'un type supporté
+        """
+        other = _coerce(other)
+        if other is NotImplemented:
+            return other
+        return _add(self.num, self.den, other.num, other.den)
+
+    __radd__ = __add__
+
+    def __sub__(self, other) -> 'FractionArray':
+        """
+        Soustraction élément par élément.
+
+        PRE : `other` est un FractionArray, une Fraction ou un entier
+        POST : Retourne un nouveau tableau de fractions réduites
+        RAISES : TypeError si `other` n'est pas d'un type supporté
+        """
+        other = _coerce(other)
+        if other is NotImplemented:
+            return other
+        other = -other
+        return _add(self.num, self.den, other.num, other.den)
+
+    def __rsub__(self, other) -> 'FractionArray':
+        other = _coerce(other)
+        if other is NotImplemented:
+            return other
+        negated = -self
+        return _add(other.num, other.den, negated.num, negated.den)
+
+    def __mul__(self, other) -> 'FractionArray':
+        """
+        Multiplication élément par élément.
+
+        PRE : `other` est un FractionArray, une Fraction ou un entier
+        POST : Retourne un nouveau tableau de fractions réduites
+        RAISES : TypeError si `other` n'est pas d'un type supporté
+        """
+        other = _coerce(other)
+        if other is NotImplemented:
+            return other
+        return _mul(self.num, self.den, other.num, other.den)
+
+    __rmul__ = __mul__
+
+    def __truediv__(self, other) -> 'FractionArray':
+        """
+        Division élément par élément.
+
+        PRE :
+        - `other` est un FractionArray, une Fraction ou un entier.
+        - Aucun élément de `other` n'est nul.
+
+        POST : Retourne un nouveau tableau de fractions réduites
+        RAISES :
+        - TypeError si `other` n'est pas d'un type supporté
+        - ZeroDivisionError si un élément de `other` est nul
+        """
+        other = _coerce(other)
+        if other is NotImplemented:
+            return other
+        return _div(self.num, self.den, other.num, other.den)
+
+    def __rtruediv__(self, other) -> 'FractionArray':
+        other = _coerce(other)
+        if other is NotImplemented:
+            return other
+        return _div(other.num, other.den, self.num, self.den)
+
+    def __pow__(self, other) -> 'FractionArray':
+        """
+        Élève chaque fraction à une puissance entière.
+
+        PRE :
+        - `other` doit être un entier.
+        - Si `other` est négatif, aucun élément ne doit être nul.
+
+        POST : Retourne un nouveau tableau de fractions réduites
+        RAISES :
+        - TypeError si `other` n'est pas un entier
+        - ValueError si `other` est négatif et qu'un élément est nul
+        """
+        if not isinstance(other, (int, np.integer)) or isinstance(other, bool):
+            raise TypeError("La puissance doit être un entier.")
+        other = int(other)
+        num, den = self.num, self.den
+        if other < 0:
+            if np.any(num == 0):
+                raise ValueError(
+                    "Le dénominateur ne peut pas être zéro.")
+            # Inversion : le signe reste porté par le numérateur
+            sign = np.where(num < 0, -1, 1)
+            num, den = den * sign, num * sign
+            other = -other
+        bits = max(_max_bits(num), _max_bits(den))
+        if num.dtype != object and bits * other >= 63:
+            num, den = num.astype(object), den.astype(object)
+        # Des puissances de termes premiers entre eux restent premières
+        # entre elles : aucun PGCD n'est nécessaire.
+        return FractionArray._from_reduced(*_same_dtype(
+            _compact(np.asarray(num ** other)),
+            _compact(np.asarray(den ** other))))
+
+    def __neg__(self) -> 'FractionArray':
+        num, den = _widen_min(self.num, self.den)
+        # np.asarray : -x sur un tableau object 0-d donne un int Python
+        return FractionArray._from_reduced(np.asarray(-num), den.copy())
+
+    def __abs__(self) -> 'FractionArray':
+        num, den = _widen_min(self.num, self.den)
+        return FractionArray._from_reduced(np.asarray(abs(num)), den.copy())
+
+# ------------------ Comparisons ------------------
+
+    def _cross(self, other):
+        """
+        Retourne les produits croisés (a*d, c*b) utilisés par les comparaisons.
+
+        PRE : `other` est déjà converti en FractionArray
+        POST : Retourne deux tableaux comparables sans dépassement
+        RAISES : Aucune
+        """
+        na, da, nb, db = _widen(self.num, self.den, other.num, other.den)
+        return na * db, nb * da
+
+    def __eq__(self, other):
+        other = _coerce(other)
+        if other is NotImplemented:
+            return other
+        # Forme réduite unique : la comparaison des termes suffit
+        return (self.num == other.num) & (self.den == other.den)
+
+    def __ne__(self, other):
+        other = _coerce(other)
+        if other is NotImplemented:
+            return other
+        return (self.num != other.num) | (self.den != other.den)
+
+    def __lt__(self, other):
+        other = _coerce(other)
+        if other is NotImplemented:
+            return other
+        left, right = self._cross(other)
+        return np.asarray(left < right, dtype=bool)
+
+    def __le__(self, other):
+        other = _coerce(other)
+        if other is NotImplemented:
+            return other
+        left, right = self._cross(other)
+        return np.asarray(left <= right, dtype=bool)
+
+    def __gt__(self, other):
+        other = _coerce(other)
+        if other is NotImplemented:
+            return other
+        left, right = self._cross(other)
+        return np.asarray(left > right, dtype=bool)
+
+    def __ge__(self, other):
+        other = _coerce(other)
+        if other is NotImplemented:
+            return other
+        left, right = self._cross(other)
+        return np.asarray(left >= right, dtype=bool)
+
+    # Les comparaisons renvoient des tableaux : pas de hash possible
+    __hash__ = None
+
+# ------------------ Conversions ------------------
+
+    def to_float(self):
+        """
+        Retourne les valeurs sous forme de tableau NumPy float64.
+
+        Si tous les termes tiennent exactement dans un float64 (|x| <= 2**53),
+        la conversion est une seule division vectorisée, correctement
+        arrondie ; sinon chaque élément passe par Fraction.__float__.
+
+        PRE : Aucune
+        POST : Retourne un tableau float64 de même forme
+        RAISES : OverflowError si une valeur dépasse la capacité d'un flottant
+        """
+        return _to_float(self.num, self.den)
+
+# ------------------ Reductions ------------------
+
+    def sum(self) -> Fraction:
+        """
+        Retourne la somme exacte de tous les éléments.
+
+        La somme est calculée par paires (arbre) : chaque niveau est une
+        seule opération vectorisée et la taille des termes reste équilibrée.
+
+        PRE : Aucune
+        POST : Retourne une Fraction (0 pour un tableau vide)
+        RAISES : Aucune
+        """
+        return self._tree_reduce(_add, 0)
+
+    def prod(self) -> Fraction:
+        """
+        Retourne le produit exact de tous les éléments.
+
+        PRE : Aucune
+        POST : Retourne une Fraction (1 pour un tableau vide)
+        RAISES : Aucune
+        """
+        return self._tree_reduce(_mul, 1)
+
+    def _tree_reduce(self, combine, neutral) -> Fraction:
+        num, den = self.num.ravel(), self.den.ravel()
+        if num.size == 0:
+            return Fraction(neutral)
+        while num.size > 1:
+            half = num.size // 2
+            result = combine(num[:half], den[:half],
+                             num[half:2 * half], den[half:2 * half])
+            if num.size % 2:
+                # Élément impair : il remonte tel quel au niveau suivant
+                num, den = _same_dtype(np.concatenate([result.num, num[-1:]]),
+                                       np.concatenate([result.den, den[-1:]]))
+            else:
+                num, den = result.num, result.den
+        return Fraction._from_reduced(int(num[0]), int(den[0]))
+
+
+def to_float_array(fractions):
+    """
+    Convertit des fractions en tableau NumPy float64, en un seul passage.
+
+    PRE : `fractions` est un FractionArray ou un itérable de Fraction
+    POST : Retourne un tableau float64 à une dimension (ou de même forme
+        qu'un FractionArray), valeurs correctement arrondies
+    RAISES :
+    - TypeError si un élément n'est pas une instance de Fraction
+    - OverflowError si une valeur dépasse la capacité d'un flottant
+    """
+    if isinstance(fractions, FractionArray):
+        return fractions.to_float()
+    nums, dens = [], []
+    for f in fractions:
+        if not isinstance(f, Fraction):
+            raise TypeError(
+                "Les éléments doivent être des instances de la classe Fraction.")
+        nums.append(f.num)
+        dens.append(f.den)
+    return _to_float(_compact(np.array(nums, dtype=object)),
+                     _compact(np.array(dens, dtype=object)))
+
+
+# ------------------ Internal helpers ------------------
+
+def _to_float(num, den):
+    """
+    Divise num par den élément par élément, avec un arrondi correct.
+
+    PRE : num et den sont des tableaux d'entiers de même forme, den > 0
+    POST : Retourne un tableau float64
+    RAISES : OverflowError si une valeur dépasse la capacité d'un flottant
+    """
+    exact = num.dtype != object and den.dtype != object and (
+        num.size == 0 or (num.min() >= -_EXACT_FLOAT and num.max() <= _EXACT_FLOAT
+                          and den.max() <= _EXACT_FLOAT))
+    if exact:
+        # Les deux opérandes sont exacts : la division IEEE est correctement arrondie
+        return num.astype(np.float64) / den.astype(np.float64)
+    values = [float(Fraction._from_reduced(int(n), int(d)))
+              for n, d in zip(num.ravel(), den.ravel())]
+    return np.array(values, dtype=np.float64).reshape(num.shape)
+
+
+def _as_int_array(values):
+    """
+    Convertit `values` en tableau d'entiers int64 (ou object si trop grand).
+
+    PRE : Aucune
+    POST : Retourne un tableau de dtype int64 ou object (entiers Python)
+    RAISES : TypeError si une valeur n'est pas entière
+    """
+    if isinstance(values, FractionArray):
+        raise TypeError("Les numérateurs et dénominateurs doivent être des entiers.")
+    arr = np.asarray(values)
+    kind = arr.dtype.kind
+    if kind in "bi" or arr.size == 0:
+        return arr.astype(np.int64)
+    if kind == "u":
+        if arr.size and int(arr.max()) > _INT64_MAX:
+            return arr.astype(object)
+        return arr.astype(np.int64)
+    if kind == "O":
+        flat = arr.ravel()
+        for value in flat:
+            if not isinstance(value, (int, np.integer)) or isinstance(value, bool):
+                raise TypeError(
+                    "Les numérateurs et dénominateurs doivent être des entiers.")
+        converted = np.empty(arr.shape, dtype=object)
+        converted.ravel()[:] = [int(value) for value in flat]
+        return _compact(converted)
+    raise TypeError("Les numérateurs et dénominateurs doivent être des entiers.")
+
+
+def _compact(arr):
+    """
+    Ramène un tableau object en int64 si toutes ses valeurs y tiennent.
+
+    PRE : arr est un tableau d'entiers (int64 ou object)
+    POST : Retourne arr en int64 si possible, sinon arr inchangé
+    RAISES : Aucune
+    """
+    if arr.dtype != object:
+        return arr
+    # INT64_MIN est exclu : sa valeur absolue ne tient pas dans un int64
+    if arr.size == 0 or (arr.min() > _INT64_MIN and arr.max() <= _INT64_MAX):
+        return arr.astype(np.int64)
+    return arr
+
+
+def _same_dtype(num, den):
+    """Aligne num et den sur un même dtype (object si l'un des deux l'est)."""
+    if num.dtype != den.dtype:
+        return num.astype(object), den.astype(object)
+    return num, den
+
+
+def _max_bits(arr) -> int:
+    """Retourne le nombre de bits de la plus grande valeur absolue de arr."""
+    if arr.size == 0:
+        return 0
+    return max(int(arr.max()).bit_length(), int(arr.min()).bit_length())
+
+
+def _widen(*arrays):
+    """
+    Passe tous les tableaux en dtype object si un produit croisé
+    risque de dépasser un int64.
+
+    PRE : les tableaux contiennent des entiers (int64 ou object)
+    POST : Retourne les tableaux, tous int64 « sûrs » ou tous object
+    RAISES : Aucune
+    """
+    for arr in arrays:
+        if arr.dtype == object or (
+                arr.size and (arr.min() <= -_SAFE or arr.max() >= _SAFE)):
+            return tuple(a.astype(object) for a in arrays)
+    return arrays
+
+
+def _widen_min(num, den):
+    """
+    Passe num et den en dtype object si l'un d'eux contient INT64_MIN,
+    dont l'opposé (changement de signe) ne tient pas dans un int64.
+    """
+    for arr in (num, den):
+        if arr.dtype != object and arr.size and arr.min() == _INT64_MIN:
+            return num.astype(object), den.astype(object)
+    return num, den
+
+
+def _reduce(num, den):
+    """
+    Simplifie chaque fraction par le PGCD et place le signe au numérateur.
+
+    PRE : num et den sont de même forme et de même dtype, den != 0
+    POST : Retourne (num, den) réduits, den > 0, en int64 si possible
+    RAISES : Aucune
+    """
+    num, den = _widen_min(num, den)
+    g = np.gcd(num, den)
+    # np.asarray : les opérations sur des tableaux 0-d renvoient des scalaires
+    num = np.asarray(num // g)
+    den = np.asarray(den // g)
+    negative = den < 0
+    if np.any(negative):
+        num = np.where(negative, -num, num)
+        den = np.where(negative, -den, den)
+    return _same_dtype(_compact(num), _compact(den))
+
+
+def _coerce(other):
+    """
+    Convertit l'autre opérande d'une opération en FractionArray.
+
+    PRE : Aucune
+    POST : Retourne un FractionArray, ou NotImplemented pour un type inconnu
+    RAISES : Aucune
+    """
+    if isinstance(other, FractionArray):
+        return other
+    if isinstance(other, Fraction):
+        num = _compact(np.array(other.num, dtype=object))
+        den = _compact(np.array(other.den, dtype=object))
+        return FractionArray._from_reduced(*_same_dtype(num, den))
+    if isinstance(other, (int, np.integer)) and not isinstance(other, bool):
+        num = _compact(np.array(int(other), dtype=object))
+        return FractionArray._from_reduced(num, np.ones((), dtype=num.dtype))
+    if isinstance(other, np.ndarray) and other.dtype.kind in "biu":
+        return FractionArray(other)
+    return NotImplemented
+
+
+def _add(na, da, nb, db) -> FractionArray:
+    """Retourne na/da + nb/db réduit, élément par élément."""
+    na, da, nb, db = _widen(na, da, nb, db)
+    return FractionArray._from_reduced(*_reduce(na * db + nb * da, da * db))
+
+
+def _mul(na, da, nb, db) -> FractionArray:
+    """Retourne (na*nb)/(da*db) réduit, élément par élément."""
+    na, da, nb, db = _widen(na, da, nb, db)
+    return FractionArray._from_reduced(*_reduce(na * nb, da * db))
+
+
+def _div(na, da, nb, db) -> FractionArray:
+    """Retourne (na/da) / (nb/db) réduit, élément par élément."""
+    if np.any(nb == 0):
+        raise ZeroDivisionError(
+            "Division par une fraction avec un numérateur égal à zéro.")
+    na, da, nb, db = _widen(na, da, nb, db)
+    return FractionArray._from_reduced(*_reduce(na * db, da * nb))
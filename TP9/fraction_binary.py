@@ -0,0 +1,223 @@
+"""Format binaire compact pour de grands ensembles de fractions.
+
+Disposition du fichier (petit-boutiste) :
+
+    en-tête     b"FRAC", version (1 octet), 3 octets nuls,
+                nombre de fractions (uint64), taille de la zone annexe (uint64)
+    numérateurs nombre x int64
+    dénominateurs nombre x int64
+    zone annexe entiers trop grands pour un int64
+
+Une fraction dont les termes tiennent dans un int64 occupe 16 octets. Pour
+les autres, le dénominateur vaut 0 (valeur impossible pour une fraction)
+et le numérateur contient la position, dans la zone annexe, de deux
+entiers encodés chacun par une longueur (varint) suivie de leurs octets.
+Les deux tableaux int64 sont alignés sur 8 octets : un lecteur peut les
+exposer sous forme de `memoryview` directement sur le fichier mappé en
+mémoire, sans copie ni décodage à l'ouverture.
+"""
+import mmap
+import struct
+import sys
+from array import array
+
+from fraction import Fraction
+
+MAGIC = b"FRAC"
+VERSION = 1
+
+_HEADER = struct.Struct("<4sB3xQQ")
+_INT64_MIN = -(1 << 63)
+_INT64_MAX = (1 << 63) - 1
+# Les tableaux sont écrits en petit-boutiste : sur une machine gros-boutiste
+# il faut inverser les octets (et le lecteur ne peut plus éviter la copie)
+_NATIVE = sys.byteorder == "little"
+
+
+def write_binary(file, fractions) -> int:
+    """
+    Écrit des fractions au format binaire compact.
+
+    PRE :
+    - `file` est un fichier binaire ouvert en écriture.
+    - `fractions` est un itérable d'instances de Fraction.
+
+    POST : Écrit l'en-tête, les deux tableaux int64 et la zone annexe ;
+        retourne le nombre de fractions écrites
+    RAISES : TypeError si un élément n'est pas une instance de Fraction
+    """
+    nums = array("q")
+    dens = array("q")
+    overflow = bytearray()
+    for f in fractions:
+        if not isinstance(f, Fraction):
+            raise TypeError(
+                "Les éléments doivent être des instances de la classe Fraction.")
+        num, den = f.num, f.den
+        if _INT64_MIN <= num <= _INT64_MAX and den <= _INT64_MAX:
+            nums.append(num)
+            dens.append(den)
+        else:
+            nums.append(len(overflow))
+            dens.append(0)
+            _write_bigint(overflow, num)
+            _write_bigint(overflow, den)
+    if not _NATIVE:
+        nums.byteswap()
+        dens.byteswap()
+    file.write(_HEADER.pack(MAGIC, VERSION, len(nums), len(overflow)))
+    file.write(nums)
+    file.write(dens)
+    file.write(overflow)
+    return len(nums)
+
+
+def open_binary(path: str) -> 'FractionReader':
+    """
+    Ouvre un fichier binaire de fractions en le mappant en mémoire.
+
+    L'ouverture ne lit que l'en-tête : sa durée ne dépend pas du nombre
+    de fractions.
+
+    PRE : `path` désigne un fichier écrit par write_binary
+    POST : Retourne un FractionReader à fermer (ou à utiliser avec `with`)
+    RAISES : ValueError si le fichier n'est pas au bon format
+    """
+    with open(path, "rb") as file:
+        mapped = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+    try:
+        return FractionReader(mapped)
+    except ValueError:
+        mapped.close()
+        raise
+
+
+class FractionReader:
+    """Accès en lecture à des fractions au format binaire, sans copie.
+
+    `numerators` et `denominators` sont des `memoryview` de format "q"
+    (int64) qui pointent directement dans le tampon source. Une position
+    dont le dénominateur vaut 0 désigne une fraction stockée dans la zone
+    annexe : utiliser `reader[i]` pour obtenir la valeur exacte.
+    """
+
+    def __init__(self, buffer) -> None:
+        """
+        Interprète un tampon (bytes, bytearray, mmap...) au format binaire.
+
+        PRE : `buffer` supporte le protocole tampon
+        POST : Les vues sur les tableaux sont créées (aucune copie)
+        RAISES : ValueError si l'en-tête ou la taille est incorrecte
+        """
+        self._buffer = buffer
+        view = memoryview(buffer).cast("B")
+        if len(view) < _HEADER.size:
+            raise ValueError("Fichier de fractions tronqué.")
+        magic, version, count, overflow_size = _HEADER.unpack_from(view)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError("Ce n'est pas un fichier de fractions (version 1).")
+        start = _HEADER.size
+        middle = start + 8 * count
+        end = middle + 8 * count
+        if len(view) < end + overflow_size:
+            raise ValueError("Fichier de fractions tronqué.")
+
+        self._view = view
+        self._overflow = view[end:end + overflow_size]
+        if _NATIVE:
+            self.numerators = view[start:middle].cast("q")
+            self.denominators = view[middle:end].cast("q")
+        else:
+            nums = array("q", view[start:middle].tobytes())
+            dens = array("q", view[middle:end].tobytes())
+            nums.byteswap()
+            dens.byteswap()
+            self.numerators = memoryview(nums)
+            self.denominators = memoryview(dens)
+
+    def __len__(self) -> int:
+        return len(self.numerators)
+
+    def __getitem__(self, index: int) -> Fraction:
+        """
+        Retourne la fraction à la position `index`.
+
+        PRE : -len(self) <= index < len(self)
+        POST : Retourne une Fraction (décodée depuis la zone annexe si besoin)
+        RAISES : IndexError si l'index est hors limites
+        """
+        den = self.denominators[index]
+        if den:
+            return Fraction._from_reduced(self.numerators[index], den)
+        offset = self.numerators[index]
+        num, offset = _read_bigint(self._overflow, offset)
+        den, _ = _read_bigint(self._overflow, offset)
+        return Fraction._from_reduced(num, den)
+
+    def __iter__(self):
+        make = Fraction._from_reduced
+        overflow = self._overflow
+        for num, den in zip(self.numerators, self.denominators):
+            if den:
+                yield make(num, den)
+            else:
+                num, offset = _read_bigint(overflow, num)
+                den, _ = _read_bigint(overflow, offset)
+                yield make(num, den)
+
+    def has_overflow(self) -> bool:
+        """
+        Indique si des fractions sont stockées dans la zone annexe.
+
+        PRE : Aucune
+        POST : Retourne False si `numerators` et `denominators` contiennent
+            directement toutes les valeurs
+        RAISES : Aucune
+        """
+        return len(self._overflow) > 0
+
+    def close(self) -> None:
+        """
+        Libère les vues et ferme le fichier mappé éventuel.
+
+        PRE : Aucune vue dérivée de `numerators`/`denominators` n'est
+            encore utilisée
+        POST : Le lecteur n'est plus utilisable
+        RAISES : BufferError si une vue dérivée est encore active
+        """
+        for view in (self.numerators, self.denominators, self._overflow, self._view):
+            view.release()
+        if isinstance(self._buffer, mmap.mmap):
+            self._buffer.close()
+
+    def __enter__(self) -> 'FractionReader':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+def _write_bigint(out: bytearray, value: int) -> None:
+    """Ajoute à `out` la longueur (varint) puis les octets signés de `value`."""
+    data = value.to_bytes(value.bit_length() // 8 + 1, "little", signed=True)
+    length = len(data)
+    while length >= 0x80:
+        out.append(length & 0x7F | 0x80)
+        length >>= 7
+    out.append(length)
+    out += data
+
+
+def _read_bigint(view, offset: int) -> tuple:
+    """Décode un entier écrit par _write_bigint ; retourne (valeur, position suivante)."""
+    length = 0
+    shift = 0
+    while True:
+        byte = view[offset]
+        offset += 1
+        length |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            break
+        shift += 7
+    value = int.from_bytes(view[offset:offset + length], "little", signed=True)
+    return value, offset + length
@@ -0,0 +1,354 @@
+"""Fractions égyptiennes, suites de Farey et voisinages.
+
+Décompositions d'une fraction positive en somme de fractions unitaires
+distinctes (1/d) : algorithme glouton de Fibonacci–Sylvester, développement
+d'Engel et décomposition optimale à dénominateurs bornés. Tous les calculs
+se font sur des couples d'entiers : aucune Fraction intermédiaire.
+
+Deux fractions a/b et c/d sont voisines (au sens de
+`Fraction.is_adjacent_to`) si |ad - bc| = 1, comme deux termes consécutifs
+d'une suite de Farey. `AdjacencyIndex` répond à « quelles fractions d'un
+ensemble sont voisines de x ? » sans comparer x à chaque élément.
+"""
+from bisect import bisect_left, bisect_right
+from math import gcd
+
+from fraction import Fraction
+
+# Nombre de termes maximal par défaut de la recherche optimale
+MAX_TERMS = 6
+
+
+# ------------------ Egyptian fractions ------------------
+
+def greedy(x: Fraction) -> list:
+    """
+    Décomposition gloutonne (Fibonacci–Sylvester) en fractions unitaires.
+
+    À chaque étape, on retire la plus grande fraction unitaire inférieure
+    ou égale au reste.
+
+    PRE : `x` est une Fraction avec 0 < x <= 1
+    POST : Retourne la liste des fractions unitaires, de dénominateurs
+        distincts et strictement croissants, dont la somme vaut x
+    RAISES :
+    - TypeError si `x` n'est pas une instance de Fraction
+    - ValueError si x <= 0 ou x > 1
+    """
+    p, q = _unit_interval(x)
+    terms = []
+    while p:
+        d = -(-q // p)
+        terms.append(d)
+        p, q = p * d - q, q * d
+        pgcd = gcd(p, q)
+        p, q = p // pgcd, q // pgcd
+    return _units(terms)
+
+
+def engel(x: Fraction) -> list:
+    """
+    Développement d'Engel : x = 1/a1 + 1/(a1 a2) + 1/(a1 a2 a3) + ...
+
+    La suite a1 <= a2 <= ... est croissante et finie pour un rationnel.
+
+    PRE : `x` est une Fraction avec 0 < x <= 1
+    POST : Retourne la liste des fractions unitaires 1/(a1...ak), de
+        dénominateurs strictement croissants, dont la somme vaut x
+    RAISES :
+    - TypeError si `x` n'est pas une instance de Fraction
+    - ValueError si x <= 0 ou x > 1
+    """
+    p, q = _unit_interval(x)
+    terms = []
+    product = 1
+    while p:
+        a = -(-q // p)
+        product *= a
+        terms.append(product)
+        # Reste suivant : x * a - 1
+        p, q = p * a - q, q
+        pgcd = gcd(p, q)
+        p, q = p // pgcd, q // pgcd
+    return _units(terms)
+
+
+def optimal(x: Fraction, max_den: int, max_terms: int = MAX_TERMS) -> list:
+    """
+    Décomposition en fractions unitaires distinctes la plus courte possible,
+    avec des dénominateurs au plus égaux à `max_den`.
+
+    Recherche en profondeur itérative sur le nombre de termes ; à longueur
+    égale, la décomposition retenue est celle dont le plus grand
+    dénominateur est le plus petit. Les branches sont élaguées par les
+    bornes 1/d <= reste <= k/d (k termes restants). Le coût croît
+    exponentiellement avec le nombre de termes : `max_terms` le borne.
+
+    PRE :
+    - `x` est une Fraction strictement positive.
+    - max_den >= 1, max_terms >= 1.
+
+    POST : Retourne la liste des fractions unitaires, de dénominateurs
+        strictement croissants, dont la somme vaut x
+    RAISES :
+    - TypeError si `x` n'est pas une instance de Fraction
+    - ValueError si x <= 0 ou s'il n'existe aucune décomposition d'au plus
+      `max_terms` termes avec ces dénominateurs
+    """
+    if not isinstance(x, Fraction):
+        raise TypeError("L'argument doit être une instance de la classe Fraction.")
+    if x.num <= 0:
+        raise ValueError("La fraction doit être strictement positive.")
+    # Le dénominateur de la somme divise le PPCM des dénominateurs utilisés
+    if not _divides_lcm(x.den, max_den):
+        raise ValueError(
+            f"Aucune décomposition avec des dénominateurs <= {max_den}.")
+    # Des dénominateurs distincts : au plus max_den termes
+    for length in range(1, min(max_terms, max_den) + 1):
+        best = _search(x.num, x.den, length, 1, max_den)
+        if best is not None:
+            return _units(best)
+    raise ValueError(f"Aucune décomposition en au plus {max_terms} termes "
+                     f"avec des dénominateurs <= {max_den}.")
+
+
+def _search(p: int, q: int, length: int, start: int, cap: int):
+    """
+    Cherche `length` dénominateurs distincts dans [start, cap] dont les
+    inverses ont pour somme p/q, en minimisant le plus grand.
+
+    PRE : p > 0, q > 0, pgcd(p, q) = 1, length >= 1
+    POST : Retourne la liste croissante des dénominateurs, ou None
+    RAISES : Aucune
+    """
+    if length == 1:
+        return [q] if p == 1 and start <= q <= cap else None
+    best = None
+    # 1/d <= p/q et p/q <= length/d
+    low = max(start, -(-q // p))
+    high = min(cap, length * q // p)
+    for d in range(low, high + 1):
+        # Le plafond baisse à chaque solution trouvée
+        if d > cap:
+            break
+        rest_p, rest_q = p * d - q, q * d
+        if rest_p == 0:
+            continue
+        pgcd = gcd(rest_p, rest_q)
+        found = _search(rest_p // pgcd, rest_q // pgcd, length - 1, d + 1, cap)
+        if found is not None:
+            best = [d] + found
+            # Seules les solutions de plus petit maximum nous intéressent
+            cap = best[-1] - 1
+    return best
+
+
+def _divides_lcm(q: int, n: int) -> bool:
+    """
+    Vrai si q divise ppcm(1, ..., n), c'est-à-dire si chaque puissance de
+    nombre premier de q est <= n. Divisions d'essai jusqu'à min(n, √q) :
+    le PPCM lui-même, de l'ordre de e**n, n'est jamais calculé.
+    """
+    d = 2
+    while d <= n and d * d <= q:
+        if q % d == 0:
+            power = 1
+            while q % d == 0:
+                q //= d
+                power *= d
+            if power > n:
+                return False
+        d += 1
+    # Reste : 1, un nombre premier, ou un produit de facteurs > n
+    return q <= n
+
+
+def _unit_interval(x) -> tuple:
+    if not isinstance(x, Fraction):
+        raise TypeError("L'argument doit être une instance de la classe Fraction.")
+    if x.num <= 0 or x.num > x.den:
+        raise ValueError("La fraction doit être comprise entre 0 (exclu) et 1.")
+    return x.num, x.den
+
+
+def _units(denominators: list) -> list:
+    make = Fraction._from_reduced
+    return [make(1, d) for d in denominators]
+
+
+# ------------------ Farey sequences and Stern–Brocot tree ------------------
+
+def farey_sequence(n: int):
+    """
+    Générateur de la suite de Farey d'ordre n (fractions de [0, 1] de
+    dénominateur <= n, par ordre croissant).
+
+    Chaque terme est obtenu à partir des deux précédents, sans PGCD.
+
+    PRE : n >= 1
+    POST : Produit 0/1, ..., 1/1 ; deux termes consécutifs sont voisins
+    RAISES : ValueError si n < 1
+    """
+    if n < 1:
+        raise ValueError("L'ordre de la suite de Farey doit être >= 1.")
+    make = Fraction._from_reduced
+    a, b, c, d = 0, 1, 1, n
+    yield make(a, b)
+    while c <= n:
+        k = (n + b) // d
+        a, b, c, d = c, d, k * c - a, k * d - b
+        yield make(a, b)
+
+
+def stern_brocot(depth: int):
+    """
+    Générateur des fractions positives de l'arbre de Stern–Brocot jusqu'à
+    la profondeur `depth`, par ordre croissant.
+
+    La racine 1/1 est de profondeur 1 ; chaque nœud est la médiane de ses
+    deux ancêtres les plus proches (0/1 et 1/0 aux bornes).
+
+    PRE : depth >= 0
+    POST : Produit 2**depth - 1 fractions ; deux termes consécutifs sont voisins
+    RAISES : Aucune
+    """
+    make = Fraction._from_reduced
+    # Parcours infixe itératif : (bornes gauche et droite, profondeur)
+    stack = []
+    node = (0, 1, 1, 0, 1)
+    while True:
+        while node[4] <= depth:
+            stack.append(node)
+            a, b, c, d, level = node
+            node = (a, b, a + c, b + d, level + 1)
+        if not stack:
+            return
+        a, b, c, d, level = stack.pop()
+        yield make(a + c, b + d)
+        node = (a + c, b + d, c, d, level + 1)
+
+
+def farey_neighbours(x: Fraction, n: int) -> tuple:
+    """
+    Retourne les deux fractions de dénominateur <= n qui encadrent x au
+    plus près (voisines de x dans la suite de Farey d'ordre n étendue à
+    tous les rationnels).
+
+    Si le dénominateur de x est <= n, les voisins sont obtenus par un
+    inverse modulaire ; sinon par une descente de l'arbre de Stern–Brocot
+    par blocs (au plus O(log n) étapes).
+
+    PRE : `x` est une Fraction, n >= 1
+    POST : Retourne (gauche, droite) avec gauche < x < droite, aucune
+        fraction de dénominateur <= n strictement entre gauche et droite
+        ni entre elles et x
+    RAISES :
+    - TypeError si `x` n'est pas une instance de Fraction
+    - ValueError si n < 1
+    """
+    if not isinstance(x, Fraction):
+        raise TypeError("L'argument doit être une instance de la classe Fraction.")
+    if n < 1:
+        raise ValueError("Le dénominateur maximal doit être >= 1.")
+    p, q = x.num, x.den
+    make = Fraction._from_reduced
+    if q <= n:
+        # Voisin gauche a/b : b p - a q = 1, b maximal <= n (idem à droite)
+        inverse = pow(p, -1, q) if q > 1 else 0
+        left_b = n - (n - inverse) % q if q > 1 else n
+        right_b = n - (n + inverse) % q if q > 1 else n
+        return (make((left_b * p - 1) // q, left_b),
+                make((right_b * p + 1) // q, right_b))
+
+    # Encadrement initial par deux entiers consécutifs
+    ln, ld = p // q, 1
+    hn, hd = ln + 1, 1
+    while True:
+        # Avance la borne gauche : lo + k hi reste < x
+        k = min((p * ld - ln * q - 1) // (hn * q - p * hd), (n - ld) // hd)
+        if k > 0:
+            ln, ld = ln + k * hn, ld + k * hd
+        # Recule la borne droite : hi + k lo reste > x
+        j = min((hn * q - p * hd - 1) // (p * ld - ln * q), (n - hd) // ld)
+        if j > 0:
+            hn, hd = hn + j * ln, hd + j * ld
+        if k <= 0 and j <= 0:
+            return make(ln, ld), make(hn, hd)
+
+
+# ------------------ Adjacency index ------------------
+
+class AdjacencyIndex:
+    """Index d'un ensemble de fractions pour les requêtes de voisinage.
+
+    Les voisins a/b de x = p/q vérifient a q - b p = ±1 : pour chaque
+    signe, les solutions forment une progression arithmétique
+    (a + k p, b + k q) calculée par inverse modulaire. Elles sont aussi
+    toutes à une distance 1/(b q) <= 1/q de x. Une requête parcourt donc
+    le plus court des deux : la progression (recherche dans un
+    dictionnaire, b <= plus grand dénominateur de l'ensemble) ou la fenêtre
+    [x - 1/q, x + 1/q] de la liste triée (recherche dichotomique).
+    """
+
+    __slots__ = ("_members", "_sorted", "_max_den")
+
+    def __init__(self, fractions) -> None:
+        """
+        Construit l'index.
+
+        PRE : `fractions` est un itérable d'instances de Fraction
+        POST : L'index contient chaque valeur une seule fois
+        RAISES : TypeError si un élément n'est pas une instance de Fraction
+        """
+        members = {}
+        for f in fractions:
+            if not isinstance(f, Fraction):
+                raise TypeError(
+                    "Les éléments doivent être des instances de la classe Fraction.")
+            members[(f.num, f.den)] = f
+        self._members = members
+        self._sorted = sorted(members.values())
+        self._max_den = max((den for _, den in members), default=0)
+
+    def __len__(self) -> int:
+        return len(self._members)
+
+    def __contains__(self, x) -> bool:
+        return isinstance(x, Fraction) and (x.num, x.den) in self._members
+
+    def neighbours(self, x: Fraction) -> list:
+        """
+        Retourne les fractions de l'index voisines de `x`.
+
+        PRE : `x` est une instance de Fraction
+        POST : Retourne, par ordre croissant, les f de l'index telles que
+            f.is_adjacent_to(x) est vrai
+        RAISES : TypeError si `x` n'est pas une instance de Fraction
+        """
+        if not isinstance(x, Fraction):
+            raise TypeError("L'argument doit être une instance de la classe Fraction.")
+        p, q = x.num, x.den
+        # Taille de la fenêtre triée contenant tous les voisins possibles
+        lo = bisect_left(self._sorted, Fraction(p - 1, q))
+        hi = bisect_right(self._sorted, Fraction(p + 1, q))
+        starts = [(sign, _first_denominator(p, q, sign)) for sign in (1, -1)]
+        steps = sum(max(0, (self._max_den - b) // q + 1) for _, b in starts)
+
+        if hi - lo <= steps:
+            return [f for f in self._sorted[lo:hi] if abs(f.num * q - f.den * p) == 1]
+        found = []
+        members = self._members
+        for sign, b in starts:
+            for den in range(b, self._max_den + 1, q):
+                f = members.get(((den * p + sign) // q, den))
+                if f is not None:
+                    found.append(f)
+        found.sort()
+        return found
+
+
+def _first_denominator(p: int, q: int, sign: int) -> int:
+    """Plus petit b >= 1 tel que b p + sign soit divisible par q."""
+    if q == 1:
+        return 1
+    return (-sign * pow(p, -1, q)) % q or q
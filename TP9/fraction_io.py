@@ -0,0 +1,99 @@
+"""Lecture et écriture en continu de fichiers texte de fractions.
+
+Un fichier contient une fraction par ligne, au format de `Fraction.__str__`
+("3/4", "-7") ou de `Fraction.as_mixed_number` ("2 1/3"). Les lignes vides
+sont ignorées. La lecture se fait par blocs de taille fixe : la mémoire
+utilisée ne dépend pas de la taille du fichier.
+"""
+from fraction import Fraction
+
+# Taille des blocs lus d'un coup dans le fichier
+CHUNK_SIZE = 1 << 20
+# Nombre de lignes regroupées en un seul appel à write()
+WRITE_BATCH = 4096
+
+
+def read_fractions(file, chunk_size: int = CHUNK_SIZE):
+    """
+    Générateur qui lit les fractions d'un fichier, une par ligne.
+
+    `file` peut être un fichier texte, un fichier binaire (plus rapide :
+    aucun décodage) ou un objet `mmap.mmap` : seule la méthode
+    `read(taille)` est utilisée.
+
+    PRE : `file` est ouvert en lecture, chunk_size > 0
+    POST : Produit les fractions dans l'ordre du fichier ; au plus un bloc
+        et une ligne incomplète sont gardés en mémoire
+    RAISES : ValueError si une ligne n'est pas une fraction valide
+        (le message indique le numéro de la ligne)
+    """
+    make = Fraction
+    pending = None
+    lineno = 0
+    while True:
+        chunk = file.read(chunk_size)
+        if not chunk:
+            break
+        if pending:
+            chunk = pending + chunk
+        if isinstance(chunk, bytes):
+            newline, slash = b"\n", b"/"
+        else:
+            newline, slash = "\n", "/"
+        lines = chunk.split(newline)
+        # La dernière ligne du bloc peut être coupée : elle attend le bloc suivant
+        pending = lines.pop()
+        for line in lines:
+            lineno += 1
+            # Chemin rapide pour "n/d" et "n" (int() ignore les espaces et \r) ;
+            # les nombres mixtes et les erreurs passent par _parse_line
+            num, sep, den = line.partition(slash)
+            try:
+                f = make(int(num), int(den) if sep else 1)
+            except ValueError:
+                if not line.strip():
+                    continue
+                f = _parse_line(line, lineno)
+            yield f
+    if pending and pending.strip():
+        yield _parse_line(pending, lineno + 1)
+
+
+def write_fractions(file, fractions, mixed: bool = False) -> int:
+    """
+    Écrit des fractions dans un fichier texte, une par ligne.
+
+    Les lignes sont écrites par lots de WRITE_BATCH : un générateur
+    peut être écrit sans être chargé entièrement en mémoire.
+
+    PRE :
+    - `file` est un fichier texte ouvert en écriture.
+    - `fractions` est un itérable d'instances de Fraction.
+
+    POST : Écrit chaque fraction au format de `__str__`, ou de
+        `as_mixed_number` si `mixed` est vrai ; retourne le nombre de lignes
+    RAISES : TypeError si un élément n'est pas une instance de Fraction
+    """
+    to_text = Fraction.as_mixed_number if mixed else Fraction.__str__
+    batch = []
+    count = 0
+    for f in fractions:
+        if not isinstance(f, Fraction):
+            raise TypeError(
+                "Les éléments doivent être des instances de la classe Fraction.")
+        batch.append(to_text(f))
+        if len(batch) == WRITE_BATCH:
+            file.write("\n".join(batch) + "\n")
+            count += len(batch)
+            batch.clear()
+    if batch:
+        file.write("\n".join(batch) + "\n")
+        count += len(batch)
+    return count
+
+
+def _parse_line(line, lineno: int) -> Fraction:
+    try:
+        return Fraction.from_string(line)
+    except ValueError as error:
+        raise ValueError(f"Ligne {lineno} : {error}") from None
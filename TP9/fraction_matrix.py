@@ -0,0 +1,281 @@
+from math import lcm
+
+from fraction import Fraction
+
+
+class FractionMatrix:
+    """Matrice de fractions avec algèbre linéaire exacte.
+
+    Le déterminant, la résolution de systèmes, l'inverse et le rang sont
+    calculés par élimination de Bareiss (« fraction-free ») : chaque ligne
+    est d'abord multipliée par le PPCM de ses dénominateurs, puis toute
+    l'élimination se fait sur des entiers, avec des divisions exactes et
+    sans aucun PGCD intermédiaire. Seuls les résultats finaux sont
+    reconvertis en Fraction.
+    Les matrices sont immuables.
+    """
+
+    __slots__ = ("_rows",)
+
+    def __init__(self, rows) -> None:
+        """
+        Initialise une matrice à partir d'une liste de lignes.
+
+        PRE : `rows` est une liste non vide de lignes de même longueur non
+            nulle, contenant des Fraction ou des entiers
+        POST : La matrice est créée (les entiers sont convertis en Fraction)
+        RAISES :
+        - ValueError si la matrice est vide ou si les lignes n'ont pas
+          toutes la même longueur
+        - TypeError si un élément n'est ni une Fraction ni un entier
+        """
+        converted = []
+        for row in rows:
+            line = []
+            for value in row:
+                if isinstance(value, int):
+                    value = Fraction(value)
+                elif not isinstance(value, Fraction):
+                    raise TypeError(
+                        "Les éléments doivent être des fractions ou des entiers.")
+                line.append(value)
+            converted.append(tuple(line))
+        if not converted or not converted[0]:
+            raise ValueError("La matrice ne peut pas être vide.")
+        if any(len(line) != len(converted[0]) for line in converted):
+            raise ValueError("Toutes les lignes doivent avoir la même longueur.")
+        self._rows = tuple(converted)
+
+    @classmethod
+    def identity(cls, n: int) -> 'FractionMatrix':
+        """
+        Retourne la matrice identité de taille n.
+
+        PRE : n > 0
+        POST : Retourne une matrice n x n avec des 1 sur la diagonale
+        RAISES : ValueError si n <= 0
+        """
+        return cls([[int(i == j) for j in range(n)] for i in range(n)])
+
+    @property
+    def shape(self) -> tuple:
+        """
+        Retourne le couple (nombre de lignes, nombre de colonnes).
+
+        PRE : Aucune
+        POST : Retourne un tuple de deux entiers
+        RAISES : Aucune
+        """
+        return len(self._rows), len(self._rows[0])
+
+    def __getitem__(self, index: tuple) -> Fraction:
+        i, j = index
+        return self._rows[i][j]
+
+    def to_list(self) -> list:
+        """
+        Retourne la matrice sous forme de liste de listes de Fraction.
+
+        PRE : Aucune
+        POST : Retourne une nouvelle liste (les modifications n'affectent
+            pas la matrice)
+        RAISES : Aucune
+        """
+        return [list(row) for row in self._rows]
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, FractionMatrix):
+            return NotImplemented
+        return self._rows == other._rows
+
+    def __hash__(self) -> int:
+        return hash(self._rows)
+
+    def __str__(self) -> str:
+        return "\n".join(" ".join(str(value) for value in row) for row in self._rows)
+
+    def __repr__(self) -> str:
+        rows = ", ".join("[" + ", ".join(str(v) for v in row) + "]" for row in self._rows)
+        return f"FractionMatrix([{rows}])"
+
+    def __matmul__(self, other) -> 'FractionMatrix':
+        """
+        Produit matriciel exact.
+
+        PRE : `other` est une FractionMatrix dont le nombre de lignes est
+            égal au nombre de colonnes de `self`
+        POST : Retourne la matrice produit
+        RAISES : ValueError si les dimensions sont incompatibles
+        """
+        if not isinstance(other, FractionMatrix):
+            return NotImplemented
+        if self.shape[1] != other.shape[0]:
+            raise ValueError("Dimensions incompatibles pour le produit.")
+        columns = list(zip(*other._rows))
+        return FractionMatrix([
+            [Fraction.sum(a * b for a, b in zip(row, column)) for column in columns]
+            for row in self._rows])
+
+# ------------------ Exact linear algebra ------------------
+
+    def determinant(self) -> Fraction:
+        """
+        Retourne le déterminant exact de la matrice.
+
+        PRE : La matrice est carrée
+        POST : Retourne une Fraction (0 si la matrice est singulière)
+        RAISES : ValueError si la matrice n'est pas carrée
+        """
+        n = self._require_square()
+        matrix, scale = _integer_rows(self._rows)
+        rank, sign = _bareiss(matrix, n)
+        if rank < n:
+            return Fraction(0)
+        # Le dernier pivot de Bareiss est le déterminant de la matrice entière
+        return Fraction(sign * matrix[n - 1][n - 1], scale)
+
+    def rank(self) -> int:
+        """
+        Retourne le rang de la matrice.
+
+        PRE : Aucune
+        POST : Retourne un entier entre 0 et min(lignes, colonnes)
+        RAISES : Aucune
+        """
+        matrix, _ = _integer_rows(self._rows)
+        rank, _ = _bareiss(matrix, self.shape[1])
+        return rank
+
+    def solve(self, b):
+        """
+        Résout exactement le système A x = b.
+
+        PRE :
+        - La matrice A (self) est carrée et inversible.
+        - `b` est une liste de len(A) valeurs (Fraction ou entiers), ou une
+          FractionMatrix ayant autant de lignes que A.
+
+        POST : Retourne la liste des inconnues x si `b` est une liste, ou la
+            FractionMatrix X telle que A X = b si `b` est une matrice
+        RAISES :
+        - ValueError si A n'est pas carrée, si les dimensions de `b` sont
+          incompatibles ou si A est singulière
+        """
+        n = self._require_square()
+        vector = not isinstance(b, FractionMatrix)
+        right = FractionMatrix([[value] for value in b]) if vector else b
+        if right.shape[0] != n:
+            raise ValueError("Le second membre doit avoir autant de lignes que la matrice.")
+
+        rows = [left + extra for left, extra in zip(self._rows, right._rows)]
+        matrix, _ = _integer_rows(rows)
+        rank, _ = _bareiss(matrix, n)
+        if rank < n:
+            raise ValueError("La matrice est singulière.")
+        solution = _back_substitute(matrix, n)
+        if vector:
+            return [row[0] for row in solution]
+        return FractionMatrix(solution)
+
+    def inverse(self) -> 'FractionMatrix':
+        """
+        Retourne l'inverse exact de la matrice.
+
+        PRE : La matrice est carrée et inversible
+        POST : Retourne la matrice B telle que A B = B A = I
+        RAISES : ValueError si la matrice n'est pas carrée ou est singulière
+        """
+        return self.solve(FractionMatrix.identity(self._require_square()))
+
+    def _require_square(self) -> int:
+        rows, columns = self.shape
+        if rows != columns:
+            raise ValueError("La matrice doit être carrée.")
+        return rows
+
+
+def _integer_rows(rows) -> tuple:
+    """
+    Multiplie chaque ligne par le PPCM de ses dénominateurs.
+
+    PRE : `rows` est une séquence de lignes de Fraction
+    POST : Retourne (matrice d'entiers, produit des facteurs appliqués)
+    RAISES : Aucune
+    """
+    matrix = []
+    scale = 1
+    for row in rows:
+        common = lcm(*(value.den for value in row))
+        matrix.append([value.num * (common // value.den) for value in row])
+        scale *= common
+    return matrix, scale
+
+
+def _bareiss(matrix: list, columns: int) -> tuple:
+    """
+    Élimination de Bareiss en place sur les `columns` premières colonnes.
+
+    Après élimination, chaque coefficient est un mineur de la matrice
+    initiale : toutes les divisions par le pivot précédent sont exactes.
+    Les colonnes suivantes (second membre) sont transformées de la même façon.
+
+    PRE : `matrix` est une liste de lignes d'entiers de même longueur
+    POST : `matrix` est échelonnée ; retourne (rang, signe des permutations)
+    RAISES : Aucune
+    """
+    n = len(matrix)
+    width = len(matrix[0])
+    sign = 1
+    previous = 1
+    row = 0
+    for col in range(columns):
+        if row == n:
+            break
+        pivot_row = next((r for r in range(row, n) if matrix[r][col]), None)
+        if pivot_row is None:
+            continue
+        if pivot_row != row:
+            matrix[row], matrix[pivot_row] = matrix[pivot_row], matrix[row]
+            sign = -sign
+        top = matrix[row]
+        pivot = top[col]
+        tail = top[col + 1:width]
+        for r in range(row + 1, n):
+            current = matrix[r]
+            factor = current[col]
+            if factor:
+                current[col + 1:] = [(pivot * a - factor * b) // previous
+                                     for a, b in zip(current[col + 1:], tail)]
+            elif pivot != previous:
+                current[col + 1:] = [pivot * a // previous for a in current[col + 1:]]
+            current[col] = 0
+        previous = pivot
+        row += 1
+    return row, sign
+
+
+def _back_substitute(matrix: list, n: int) -> list:
+    """
+    Remontée exacte après Bareiss sur une matrice carrée inversible.
+
+    Avec d = dernier pivot (déterminant de la matrice entière), les valeurs
+    y = d * x sont entières (règle de Cramer) : la remontée se fait sur des
+    entiers et chaque inconnue est simplifiée une seule fois, à la fin.
+
+    PRE : matrix[:, :n] est triangulaire supérieure et inversible
+    POST : Retourne les lignes de la solution X (une colonne par second membre)
+    RAISES : Aucune
+    """
+    det = matrix[n - 1][n - 1]
+    width = len(matrix[0])
+    solution = [None] * n
+    for i in range(n - 1, -1, -1):
+        row = matrix[i]
+        values = []
+        for k in range(n, width):
+            total = det * row[k]
+            for j in range(i + 1, n):
+                total -= row[j] * solution[j][k - n]
+            values.append(total // row[i])
+        solution[i] = values
+    return [[Fraction(y, det) for y in values] for values in solution]
@@ -0,0 +1,271 @@
+"""Instrumentation optionnelle de la classe Fraction.
+
+Quand elle est activée, les opérateurs, les constructeurs et `_simplify`
+sont remplacés sur la classe par des versions qui comptent les appels,
+mesurent leur durée et enregistrent la taille (en bits) des opérandes dans
+des histogrammes. La désactivation remet en place les méthodes d'origine :
+hors mesure, le coût est strictement nul (aucun test dans les méthodes).
+
+Exemple :
+
+    with instrumented():
+        calcul()
+    print(to_prometheus())
+"""
+from contextlib import contextmanager
+from time import perf_counter_ns
+
+from fraction import Fraction
+
+# Méthodes mesurées : nombre d'appels, durée et taille des opérandes
+OPERATORS = (
+    "__add__", "__radd__", "__sub__", "__rsub__", "__mul__", "__rmul__",
+    "__truediv__", "__rtruediv__", "__pow__",
+    "__eq__", "__lt__", "__le__", "__gt__", "__ge__", "__float__",
+)
+# Les histogrammes regroupent les tailles par puissance de 2 :
+# le seau i contient les tailles de 2**(i-1) à 2**i - 1 bits
+_BUCKETS = 32
+
+
+class _Metrics:
+    """Compteurs accumulés depuis le dernier reset()."""
+
+    __slots__ = ("enabled", "originals", "constructions", "reduced_constructions",
+                 "gcd_calls", "calls", "nanoseconds", "buckets", "bits")
+
+    def __init__(self) -> None:
+        self.enabled = False
+        self.originals = {}
+        self.reset()
+
+    def reset(self) -> None:
+        self.constructions = 0
+        self.reduced_constructions = 0
+        self.gcd_calls = 0
+        self.calls = dict.fromkeys(OPERATORS, 0)
+        self.nanoseconds = dict.fromkeys(OPERATORS, 0)
+        self.buckets = {name: [0] * (_BUCKETS + 1) for name in OPERATORS}
+        self.bits = dict.fromkeys(OPERATORS, 0)
+
+
+_metrics = _Metrics()
+
+
+def enable() -> None:
+    """
+    Active l'instrumentation de la classe Fraction.
+
+    PRE : Aucune
+    POST : Les méthodes mesurées sont remplacées (sans effet si
+        l'instrumentation est déjà active) ; les compteurs sont conservés
+    RAISES : Aucune
+    """
+    if _metrics.enabled:
+        return
+    namespace = Fraction.__dict__
+    for name in OPERATORS + ("__new__", "_from_reduced", "_simplify"):
+        _metrics.originals[name] = namespace[name]
+    for name in OPERATORS:
+        setattr(Fraction, name, _timed(name, namespace[name]))
+    Fraction.__new__ = staticmethod(_counted_new(namespace["__new__"].__func__))
+    Fraction._from_reduced = classmethod(
+        _counted_reduced(namespace["_from_reduced"].__func__))
+    Fraction._simplify = _counted_simplify(namespace["_simplify"])
+    _metrics.enabled = True
+
+
+def disable() -> None:
+    """
+    Désactive l'instrumentation et remet en place les méthodes d'origine.
+
+    PRE : Aucune
+    POST : La classe Fraction est identique à sa version non instrumentée ;
+        les compteurs restent consultables
+    RAISES : Aucune
+    """
+    if not _metrics.enabled:
+        return
+    for name, original in _metrics.originals.items():
+        setattr(Fraction, name, original)
+    _metrics.originals.clear()
+    _metrics.enabled = False
+
+
+def is_enabled() -> bool:
+    return _metrics.enabled
+
+
+def reset() -> None:
+    """
+    Remet tous les compteurs et histogrammes à zéro.
+
+    PRE : Aucune
+    POST : snapshot() ne contient plus que des zéros
+    RAISES : Aucune
+    """
+    _metrics.reset()
+
+
+@contextmanager
+def instrumented(clear: bool = True):
+    """
+    Gestionnaire de contexte qui active l'instrumentation le temps d'un bloc.
+
+    PRE : Aucune
+    POST : Les compteurs sont remis à zéro à l'entrée si `clear` est vrai ;
+        l'instrumentation retrouve son état initial à la sortie
+    RAISES : Aucune
+    """
+    was_enabled = _metrics.enabled
+    if clear:
+        reset()
+    enable()
+    try:
+        yield _metrics
+    finally:
+        if not was_enabled:
+            disable()
+
+
+# ------------------ Export ------------------
+
+def snapshot() -> dict:
+    """
+    Retourne une copie des mesures sous forme de dictionnaire.
+
+    PRE : Aucune
+    POST : Retourne un dictionnaire avec les clés `enabled`,
+        `constructions`, `reduced_constructions` (sans PGCD, voir
+        Fraction._from_reduced), `gcd_calls` (appels à _simplify) et
+        `operations` : pour chaque opérateur appelé au moins une fois,
+        `calls`, `seconds`, `operand_bits` (somme des tailles) et
+        `histogram` (borne supérieure en bits -> nombre d'opérandes)
+    RAISES : Aucune
+    """
+    operations = {}
+    for name in OPERATORS:
+        if not _metrics.calls[name]:
+            continue
+        operations[name] = {
+            "calls": _metrics.calls[name],
+            "seconds": _metrics.nanoseconds[name] / 1e9,
+            "operand_bits": _metrics.bits[name],
+            "histogram": {_upper_bound(i): count
+                          for i, count in enumerate(_metrics.buckets[name]) if count},
+        }
+    return {
+        "enabled": _metrics.enabled,
+        "constructions": _metrics.constructions,
+        "reduced_constructions": _metrics.reduced_constructions,
+        "gcd_calls": _metrics.gcd_calls,
+        "operations": operations,
+    }
+
+
+def to_prometheus(prefix: str = "fraction") -> str:
+    """
+    Retourne les mesures au format texte d'exposition de Prometheus.
+
+    PRE : `prefix` est un nom de métrique valide
+    POST : Retourne des compteurs (`_total`) et un histogramme
+        `<prefix>_operand_bits` par opérateur (seaux cumulés `le`)
+    RAISES : Aucune
+    """
+    data = snapshot()
+    lines = [
+        f"# HELP {prefix}_constructions_total Fractions construites.",
+        f"# TYPE {prefix}_constructions_total counter",
+        f'{prefix}_constructions_total{{path="checked"}} {data["constructions"]}',
+        f'{prefix}_constructions_total{{path="reduced"}} {data["reduced_constructions"]}',
+        f"# HELP {prefix}_gcd_calls_total Appels à _simplify (un PGCD chacun).",
+        f"# TYPE {prefix}_gcd_calls_total counter",
+        f"{prefix}_gcd_calls_total {data['gcd_calls']}",
+        f"# HELP {prefix}_operations_total Appels par opérateur.",
+        f"# TYPE {prefix}_operations_total counter",
+    ]
+    operations = data["operations"]
+    for name, op in operations.items():
+        lines.append(f'{prefix}_operations_total{{op="{_label(name)}"}} {op["calls"]}')
+    lines += [f"# HELP {prefix}_operation_seconds_total Temps passé par opérateur.",
+              f"# TYPE {prefix}_operation_seconds_total counter"]
+    for name, op in operations.items():
+        lines.append(f'{prefix}_operation_seconds_total{{op="{_label(name)}"}} '
+                     f'{op["seconds"]:.9f}')
+    lines += [f"# HELP {prefix}_operand_bits Taille des opérandes en bits.",
+              f"# TYPE {prefix}_operand_bits histogram"]
+    for name, op in operations.items():
+        label = _label(name)
+        cumulated = 0
+        for i, count in enumerate(_metrics.buckets[name][:_BUCKETS]):
+            cumulated += count
+            lines.append(f'{prefix}_operand_bits_bucket{{op="{label}",le="{_upper_bound(i)}"}} '
+                         f'{cumulated}')
+        total = sum(_metrics.buckets[name])
+        lines.append(f'{prefix}_operand_bits_bucket{{op="{label}",le="+Inf"}} {total}')
+        lines.append(f'{prefix}_operand_bits_sum{{op="{label}"}} {op["operand_bits"]}')
+        lines.append(f'{prefix}_operand_bits_count{{op="{label}"}} {total}')
+    return "\n".join(lines) + "\n"
+
+
+def _label(name: str) -> str:
+    return name.strip("_")
+
+
+def _upper_bound(index: int):
+    """Taille maximale (en bits) des opérandes du seau `index`."""
+    return (1 << index) - 1 if index < _BUCKETS else "+Inf"
+
+
+# ------------------ Instrumented wrappers ------------------
+
+def _record_operand(name: str, value) -> None:
+    """Ajoute la taille d'un opérande (Fraction ou entier) à l'histogramme."""
+    if isinstance(value, Fraction):
+        bits = max(value.num.bit_length(), value.den.bit_length())
+    elif isinstance(value, int):
+        bits = value.bit_length()
+    else:
+        return
+    _metrics.bits[name] += bits
+    _metrics.buckets[name][min(bits.bit_length(), _BUCKETS)] += 1
+
+
+def _timed(name: str, method):
+    metrics = _metrics
+
+    def wrapper(self, *args):
+        start = perf_counter_ns()
+        try:
+            return method(self, *args)
+        finally:
+            metrics.nanoseconds[name] += perf_counter_ns() - start
+            metrics.calls[name] += 1
+            _record_operand(name, self)
+            for value in args:
+                _record_operand(name, value)
+
+    wrapper.__name__ = method.__name__
+    wrapper.__doc__ = method.__doc__
+    return wrapper
+
+
+def _counted_new(new):
+    def __new__(cls, *args, **kwargs):
+        _metrics.constructions += 1
+        return new(cls, *args, **kwargs)
+    return __new__
+
+
+def _counted_reduced(from_reduced):
+    def _from_reduced(cls, num, den):
+        _metrics.reduced_constructions += 1
+        return from_reduced(cls, num, den)
+    return _from_reduced
+
+
+def _counted_simplify(simplify):
+    def _simplify(self):
+        _metrics.gcd_calls += 1
+        simplify(self)
+    return _simplify
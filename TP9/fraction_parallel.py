@@ -0,0 +1,159 @@
+"""Réductions et map parallèles sur de grandes listes de fractions.
+
+Le travail est découpé en blocs répartis sur un `ProcessPoolExecutor`.
+Les blocs sont envoyés aux processus sous forme de deux listes d'entiers
+(numérateurs, dénominateurs) plutôt que d'objets Fraction, et les résultats
+partiels reviennent sous forme de couples (num, den) combinés exactement.
+"""
+import os
+from concurrent.futures import ProcessPoolExecutor
+from math import gcd
+
+from fraction import Fraction, _sum_pairs
+
+# En dessous de ce nombre de fractions, le calcul reste dans le processus
+# courant : le coût de démarrage et d'envoi dépasse le gain
+PARALLEL_THRESHOLD = 10_000
+# Nombre de blocs par processus (équilibrage de charge)
+CHUNKS_PER_WORKER = 4
+
+
+def parallel_sum(fractions, workers: int = None, executor=None) -> Fraction:
+    """
+    Retourne la somme exacte d'une séquence de fractions, en parallèle.
+
+    PRE :
+    - `fractions` est un itérable d'instances de Fraction.
+    - workers > 0 (par défaut : nombre de processeurs).
+    - `executor` est un ProcessPoolExecutor à réutiliser (optionnel).
+
+    POST : Retourne la même fraction que Fraction.sum(fractions)
+    RAISES : TypeError si un élément n'est pas une instance de Fraction
+    """
+    chunks = _split(fractions, workers)
+    if len(chunks) <= 1:
+        return Fraction(*_sum_pairs(zip(*chunks[0]))) if chunks else Fraction(0)
+    partials = _run(_sum_chunk, chunks, workers, executor)
+    return Fraction(*_sum_pairs(partials))
+
+
+def parallel_prod(fractions, workers: int = None, executor=None) -> Fraction:
+    """
+    Retourne le produit exact d'une séquence de fractions, en parallèle.
+
+    PRE :
+    - `fractions` est un itérable d'instances de Fraction.
+    - workers > 0 (par défaut : nombre de processeurs).
+    - `executor` est un ProcessPoolExecutor à réutiliser (optionnel).
+
+    POST : Retourne le produit simplifié (1 pour une séquence vide)
+    RAISES : TypeError si un élément n'est pas une instance de Fraction
+    """
+    chunks = _split(fractions, workers)
+    if len(chunks) <= 1:
+        return Fraction(*_prod_chunk(chunks[0])) if chunks else Fraction(1)
+    partials = _run(_prod_chunk, chunks, workers, executor)
+    nums, dens = zip(*partials)
+    return Fraction(*_prod_chunk((nums, dens)))
+
+
+def parallel_map(func, fractions, workers: int = None, executor=None) -> list:
+    """
+    Applique `func` à chaque fraction, en parallèle, en gardant l'ordre.
+
+    `func` doit pouvoir être envoyée à un autre processus : une fonction
+    définie au niveau d'un module (pas de lambda), ou un functools.partial
+    d'une telle fonction. Exemple, pour tester l'adjacence à une fraction x :
+    parallel_map(functools.partial(adjacent_to, x), fractions) avec
+    `def adjacent_to(x, f): return f.is_adjacent_to(x)`.
+
+    PRE :
+    - `fractions` est un itérable d'instances de Fraction.
+    - workers > 0 (par défaut : nombre de processeurs).
+
+    POST : Retourne la liste [func(f) for f in fractions]
+    RAISES :
+    - TypeError si un élément n'est pas une instance de Fraction
+    - Toute exception levée par `func`
+    """
+    chunks = _split(fractions, workers)
+    if len(chunks) <= 1:
+        return _map_chunk(func, chunks[0]) if chunks else []
+    results = []
+    for part in _run(_map_chunk, chunks, workers, executor, func):
+        results.extend(part)
+    return results
+
+
+def _split(fractions, workers: int) -> list:
+    """
+    Découpe les fractions en blocs (numérateurs, dénominateurs).
+
+    PRE : `fractions` est un itérable d'instances de Fraction
+    POST : Retourne une liste de blocs ; un seul bloc si le calcul ne
+        mérite pas d'être parallélisé, aucun si l'itérable est vide
+    RAISES : TypeError si un élément n'est pas une instance de Fraction
+    """
+    nums = []
+    dens = []
+    for f in fractions:
+        if not isinstance(f, Fraction):
+            raise TypeError(
+                "Les éléments doivent être des instances de la classe Fraction.")
+        nums.append(f.num)
+        dens.append(f.den)
+    if not nums:
+        return []
+    workers = workers or os.cpu_count() or 1
+    if workers == 1 or len(nums) < PARALLEL_THRESHOLD:
+        return [(nums, dens)]
+    count = workers * CHUNKS_PER_WORKER
+    size = -(-len(nums) // count)
+    return [(nums[i:i + size], dens[i:i + size]) for i in range(0, len(nums), size)]
+
+
+def _run(task, chunks, workers, executor, *extra) -> list:
+    """Exécute `task(*extra, bloc)` pour chaque bloc dans un pool de processus."""
+    if executor is not None:
+        return list(executor.map(task, *([arg] * len(chunks) for arg in extra), chunks))
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(task, *([arg] * len(chunks) for arg in extra), chunks))
+
+
+# ------------------ Worker functions (run in child processes) ------------------
+
+def _sum_chunk(chunk) -> tuple:
+    """Somme exacte d'un bloc ; retourne le couple (num, den) simplifié."""
+    num, den = _sum_pairs(zip(*chunk))
+    pgcd = gcd(num, den)
+    return num // pgcd, den // pgcd
+
+
+def _prod_chunk(chunk) -> tuple:
+    """Produit exact d'un bloc ; retourne le couple (num, den) simplifié."""
+    num = _tree_product(chunk[0])
+    den = _tree_product(chunk[1])
+    pgcd = gcd(num, den)
+    return num // pgcd, den // pgcd
+
+
+def _map_chunk(func, chunk) -> list:
+    make = Fraction._from_reduced
+    return [func(make(num, den)) for num, den in zip(*chunk)]
+
+
+def _tree_product(values) -> int:
+    """
+    Produit d'entiers calculé par paires : les multiplications portent sur
+    des opérandes de tailles équilibrées (bien plus rapide pour de grands
+    entiers qu'un produit de gauche à droite).
+    """
+    values = list(values)
+    if not values:
+        return 1
+    while len(values) > 1:
+        paired = [values[i] * values[i + 1] for i in range(0, len(values) - 1, 2)]
+        if len(values) % 2:
+            paired.append(values[-1])
+        values = paired
+    return values[0]
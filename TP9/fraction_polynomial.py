@@ -0,0 +1,313 @@
+from math import gcd, lcm
+
+from fraction import Fraction
+
+# En dessous de ce nombre de coefficients, le produit naïf est plus rapide
+_KARATSUBA_THRESHOLD = 32
+
+
+class FractionPolynomial:
+    """Polynôme à coefficients rationnels, stockés sur un dénominateur commun.
+
+    Le polynôme c0 + c1 x + ... + cn x^n est représenté par la liste des
+    entiers (a0, ..., an) et un dénominateur commun d > 0 tels que
+    ci = ai / d, avec pgcd(a0, ..., an, d) = 1. L'évaluation et la
+    multiplication se font entièrement sur des entiers : un seul PGCD est
+    calculé par résultat. Les polynômes sont immuables.
+    """
+
+    __slots__ = ("_coeffs", "_den")
+
+    def __init__(self, coefficients=()) -> None:
+        """
+        Initialise un polynôme à partir de ses coefficients.
+
+        PRE : `coefficients` est un itérable de Fraction ou d'entiers, par
+            degré croissant (le premier est le terme constant)
+        POST : Le polynôme est créé, sans coefficient nul de tête
+        RAISES : TypeError si un coefficient n'est ni une Fraction ni un entier
+        """
+        values = []
+        for value in coefficients:
+            if isinstance(value, int):
+                value = Fraction(value)
+            elif not isinstance(value, Fraction):
+                raise TypeError(
+                    "Les coefficients doivent être des fractions ou des entiers.")
+            values.append(value)
+        den = lcm(*(value.den for value in values)) if values else 1
+        # Avec le PPCM des dénominateurs réduits, pgcd(coefficients, den) = 1
+        coeffs = [value.num * (den // value.den) for value in values]
+        _trim(coeffs)
+        self._coeffs = tuple(coeffs)
+        self._den = den if coeffs else 1
+
+    @classmethod
+    def _from_integers(cls, coeffs: list, den: int) -> 'FractionPolynomial':
+        """
+        Construit un polynôme à partir d'entiers et d'un dénominateur commun.
+
+        PRE : den > 0
+        POST : Retourne le polynôme sum(coeffs[i] x^i) / den, simplifié
+        RAISES : Aucune
+        """
+        _trim(coeffs)
+        pgcd = gcd(den, *coeffs)
+        if pgcd > 1:
+            coeffs = [c // pgcd for c in coeffs]
+            den //= pgcd
+        obj = object.__new__(cls)
+        obj._coeffs = tuple(coeffs)
+        obj._den = den if coeffs else 1
+        return obj
+
+    @property
+    def coefficients(self) -> list:
+        """
+        Retourne les coefficients (Fraction) par degré croissant.
+
+        PRE : Aucune
+        POST : Retourne une liste vide pour le polynôme nul
+        RAISES : Aucune
+        """
+        return [Fraction(c, self._den) for c in self._coeffs]
+
+    def degree(self) -> int:
+        """
+        Retourne le degré du polynôme.
+
+        PRE : Aucune
+        POST : Retourne -1 pour le polynôme nul
+        RAISES : Aucune
+        """
+        return len(self._coeffs) - 1
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, FractionPolynomial):
+            return NotImplemented
+        return self._coeffs == other._coeffs and self._den == other._den
+
+    def __hash__(self) -> int:
+        return hash((self._coeffs, self._den))
+
+    def __str__(self) -> str:
+        if not self._coeffs:
+            return "0"
+        terms = []
+        for power, coeff in enumerate(self.coefficients):
+            if coeff.is_zero():
+                continue
+            if power == 0:
+                terms.append(str(coeff))
+            elif power == 1:
+                terms.append(f"({coeff})x")
+            else:
+                terms.append(f"({coeff})x^{power}")
+        return " + ".join(terms)
+
+    def __repr__(self) -> str:
+        return f"FractionPolynomial([{', '.join(str(c) for c in self.coefficients)}])"
+
+# ------------------ Evaluation ------------------
+
+    def __call__(self, x) -> Fraction:
+        """
+        Évalue le polynôme en `x` par la méthode de Horner, sur des entiers.
+
+        Pour x = p/q, on calcule sum(ai p^i q^(n-i)) / (d q^n) : aucune
+        Fraction intermédiaire et un seul PGCD pour le résultat.
+
+        PRE : `x` est une Fraction ou un entier
+        POST : Retourne la valeur exacte P(x)
+        RAISES : TypeError si `x` n'est ni une Fraction ni un entier
+        """
+        num, den = _point(x)
+        return Fraction(*self._horner(num, den))
+
+    def evaluate_many(self, points) -> list:
+        """
+        Évalue le polynôme en chacun des points.
+
+        Les puissances du dénominateur sont partagées entre les points de
+        même dénominateur.
+
+        PRE : `points` est un itérable de Fraction ou d'entiers
+        POST : Retourne la liste des valeurs exactes, dans l'ordre des points
+        RAISES : TypeError si un point n'est ni une Fraction ni un entier
+        """
+        powers_cache = {}
+        results = []
+        for x in points:
+            num, den = _point(x)
+            powers = powers_cache.get(den)
+            if powers is None:
+                powers = _powers(den, len(self._coeffs))
+                powers_cache[den] = powers
+            results.append(Fraction(*self._horner(num, den, powers)))
+        return results
+
+    def _horner(self, num: int, den: int, powers: list = None) -> tuple:
+        """
+        Retourne le couple (numérateur, dénominateur) non simplifié de P(num/den).
+
+        PRE : den > 0 ; `powers` vaut [1, den, den^2, ...] s'il est fourni
+        POST : Retourne (N, D) avec D > 0 et N / D = P(num/den)
+        RAISES : Aucune
+        """
+        coeffs = self._coeffs
+        if not coeffs:
+            return 0, 1
+        n = len(coeffs) - 1
+        if powers is None:
+            powers = _powers(den, n + 1)
+        acc = coeffs[n]
+        for i in range(n - 1, -1, -1):
+            acc = acc * num + coeffs[i] * powers[n - i]
+        return acc, self._den * powers[n]
+
+# ------------------ Arithmetic ------------------
+
+    def __add__(self, other) -> 'FractionPolynomial':
+        """
+        Addition de deux polynômes (ou d'un polynôme et d'une constante).
+
+        PRE : `other` est un FractionPolynomial, une Fraction ou un entier
+        POST : Retourne un nouveau polynôme
+        RAISES : TypeError si `other` n'est pas d'un type supporté
+        """
+        other = _coerce(other)
+        if other is NotImplemented:
+            return other
+        common = lcm(self._den, other._den)
+        a = [c * (common // self._den) for c in self._coeffs]
+        b = [c * (common // other._den) for c in other._coeffs]
+        return FractionPolynomial._from_integers(_add_lists(a, b), common)
+
+    __radd__ = __add__
+
+    def __neg__(self) -> 'FractionPolynomial':
+        return FractionPolynomial._from_integers([-c for c in self._coeffs], self._den)
+
+    def __sub__(self, other) -> 'FractionPolynomial':
+        other = _coerce(other)
+        if other is NotImplemented:
+            return other
+        return self + (-other)
+
+    def __rsub__(self, other) -> 'FractionPolynomial':
+        other = _coerce(other)
+        if other is NotImplemented:
+            return other
+        return other + (-self)
+
+    def __mul__(self, other) -> 'FractionPolynomial':
+        """
+        Multiplication exacte de deux polynômes.
+
+        Les numérateurs entiers sont multipliés par l'algorithme de
+        Karatsuba au-delà de _KARATSUBA_THRESHOLD coefficients.
+
+        PRE : `other` est un FractionPolynomial, une Fraction ou un entier
+        POST : Retourne un nouveau polynôme
+        RAISES : TypeError si `other` n'est pas d'un type supporté
+        """
+        other = _coerce(other)
+        if other is NotImplemented:
+            return other
+        if not self._coeffs or not other._coeffs:
+            return FractionPolynomial()
+        coeffs = _karatsuba(list(self._coeffs), list(other._coeffs))
+        return FractionPolynomial._from_integers(coeffs, self._den * other._den)
+
+    __rmul__ = __mul__
+
+
+# ------------------ Integer polynomial helpers ------------------
+
+def _trim(coeffs: list) -> None:
+    """Retire en place les coefficients nuls de tête."""
+    while coeffs and coeffs[-1] == 0:
+        coeffs.pop()
+
+
+def _point(x) -> tuple:
+    if isinstance(x, Fraction):
+        return x.num, x.den
+    if isinstance(x, int):
+        return x, 1
+    raise TypeError("Le point doit être une fraction ou un entier.")
+
+
+def _powers(base: int, count: int) -> list:
+    """Retourne [1, base, base^2, ..., base^(count-1)]."""
+    powers = [1] * max(count, 1)
+    for i in range(1, count):
+        powers[i] = powers[i - 1] * base
+    return powers
+
+
+def _coerce(other):
+    if isinstance(other, FractionPolynomial):
+        return other
+    if isinstance(other, (Fraction, int)):
+        return FractionPolynomial([other])
+    return NotImplemented
+
+
+def _add_lists(a: list, b: list) -> list:
+    if len(a) < len(b):
+        a, b = b, a
+    result = list(a)
+    for i, value in enumerate(b):
+        result[i] += value
+    return result
+
+
+def _schoolbook(a: list, b: list) -> list:
+    result = [0] * (len(a) + len(b) - 1)
+    for i, x in enumerate(a):
+        if x:
+            for j, y in enumerate(b):
+                result[i + j] += x * y
+    return result
+
+
+def _karatsuba(a: list, b: list) -> list:
+    """
+    Produit de deux polynômes à coefficients entiers (Karatsuba).
+
+    PRE : a et b sont des listes non vides d'entiers
+    POST : Retourne la liste des coefficients de a * b
+        (longueur len(a) + len(b) - 1)
+    RAISES : Aucune
+    """
+    if len(a) < len(b):
+        a, b = b, a
+    if len(b) <= _KARATSUBA_THRESHOLD:
+        return _schoolbook(a, b)
+    m = len(a) // 2
+    if len(b) <= m:
+        # Opérandes déséquilibrés : on découpe seulement le plus long
+        low = _karatsuba(a[:m], b)
+        high = _karatsuba(a[m:], b)
+        result = low + [0] * (len(a) + len(b) - 1 - len(low))
+        for i, value in enumerate(high):
+            result[m + i] += value
+        return result
+
+    a0, a1 = a[:m], a[m:]
+    b0, b1 = b[:m], b[m:]
+    z0 = _karatsuba(a0, b0)
+    z2 = _karatsuba(a1, b1)
+    z1 = _karatsuba(_add_lists(a0, a1), _add_lists(b0, b1))
+    result = [0] * (len(a) + len(b) - 1)
+    for i, value in enumerate(z0):
+        result[i] += value
+        z1[i] -= value
+    for i, value in enumerate(z2):
+        result[2 * m + i] += value
+        z1[i] -= value
+    for i, value in enumerate(z1):
+        if value:
+            result[m + i] += value
+    return result
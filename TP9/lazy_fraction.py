@@ -0,0 +1,329 @@
+from math import gcd
+
+from fraction import Fraction
+
+
+class LazyFraction:
+    """Fraction à simplification différée.
+
+    Les opérations arithmétiques ne calculent aucun PGCD : le numérateur et
+    le dénominateur restent non simplifiés (seul le signe est normalisé,
+    le dénominateur est toujours positif). La simplification a lieu :
+    - lorsque la valeur est observée (`numerator`, `denominator`, `__str__`,
+      `as_mixed_number`, `__eq__`, `__hash__`, `to_fraction`) ;
+    - lorsque le dénominateur dépasse `reduce_bits` bits, pour éviter que
+      les entiers ne grossissent sans limite.
+    Utile pour de longues chaînes de calcul dont seul le résultat final est
+    affiché ou comparé.
+    """
+
+    __slots__ = ("_num", "_den", "_reduced")
+
+    # Seuil (en bits) au-delà duquel un résultat intermédiaire est simplifié
+    reduce_bits = 2048
+
+    def __init__(self, num: int = 0, den: int = 1) -> None:
+        """
+        Initialise une fraction différée, sans la simplifier.
+
+        PRE : num et den sont des entiers, den != 0
+        POST : La fraction est créée avec un dénominateur positif
+        RAISES :
+        - TypeError si num ou den n'est pas un entier
+        - ValueError si le dénominateur est égal à zéro
+        """
+        if not isinstance(num, int) or not isinstance(den, int):
+            raise TypeError(
+                "Le numérateur et le dénominateur doivent être des entiers.")
+        if den == 0:
+            raise ValueError(
+                "Le dénominateur ne peut pas être zéro.")
+        if den < 0:
+            num, den = -num, -den
+        self._num = num
+        self._den = den
+        self._reduced = den == 1
+
+    @classmethod
+    def _raw(cls, num: int, den: int) -> 'LazyFraction':
+        """
+        Construit un résultat intermédiaire, simplifié seulement si
+        son dénominateur dépasse le seuil `reduce_bits`.
+
+        PRE : num et den sont des entiers, den > 0
+        POST : Retourne une LazyFraction de valeur num/den
+        RAISES : Aucune
+        """
+        obj = object.__new__(cls)
+        obj._num = num
+        obj._den = den
+        obj._reduced = den == 1
+        if den.bit_length() > cls.reduce_bits:
+            obj._reduce()
+        return obj
+
+    @classmethod
+    def from_fraction(cls, f: Fraction) -> 'LazyFraction':
+        """
+        Convertit une Fraction (déjà simplifiée) en LazyFraction.
+
+        PRE : `f` est une instance de Fraction
+        POST : Retourne une LazyFraction de même valeur, marquée simplifiée
+        RAISES : TypeError si `f` n'est pas une instance de Fraction
+        """
+        if not isinstance(f, Fraction):
+            raise TypeError(
+                "L'argument doit être une instance de la classe Fraction.")
+        obj = object.__new__(cls)
+        obj._num = f.num
+        obj._den = f.den
+        obj._reduced = True
+        return obj
+
+    def _reduce(self) -> None:
+        """
+        Simplifie la représentation interne (la valeur ne change pas).
+
+        PRE : Aucune
+        POST : _num et _den sont premiers entre eux
+        """
+        if not self._reduced:
+            pgcd = gcd(self._num, self._den)
+            if pgcd > 1:
+                self._num //= pgcd
+                self._den //= pgcd
+            self._reduced = True
+
+    def to_fraction(self) -> Fraction:
+        """
+        Retourne la Fraction (simplifiée) de même valeur.
+
+        PRE : Aucune
+        POST : Retourne une instance de Fraction
+        RAISES : Aucune
+        """
+        self._reduce()
+        return Fraction._from_reduced(self._num, self._den)
+
+# ------------------ Observation (forces the reduction) ------------------
+
+    @property
+    def numerator(self) -> int:
+        """
+        Retourne le numérateur de la fraction simplifiée.
+
+        PRE : Aucune
+        POST : Retourne le numérateur après simplification
+        RAISES : Aucune
+        """
+        self._reduce()
+        return self._num
+
+    @property
+    def denominator(self) -> int:
+        """
+        Retourne le dénominateur (positif) de la fraction simplifiée.
+
+        PRE : Aucune
+        POST : Retourne le dénominateur après simplification
+        RAISES : Aucune
+        """
+        self._reduce()
+        return self._den
+
+    def __str__(self) -> str:
+        return str(self.to_fraction())
+
+    def __repr__(self) -> str:
+        return f"LazyFraction({self})"
+
+    def as_mixed_number(self) -> str:
+        return self.to_fraction().as_mixed_number()
+
+    def __eq__(self, other) -> bool:
+        pair = _as_pair(other)
+        if pair is None:
+            return NotImplemented
+        self._reduce()
+        if isinstance(other, LazyFraction):
+            other._reduce()
+            pair = (other._num, other._den)
+        return self._num == pair[0] and self._den == pair[1]
+
+    def __hash__(self) -> int:
+        return hash(self.to_fraction())
+
+    def __float__(self) -> float:
+        return self._num / self._den
+
+# ------------------ Deferred arithmetic ------------------
+
+    def __add__(self, other) -> 'LazyFraction':
+        """
+        Addition sans simplification.
+
+        PRE : `other` est une LazyFraction, une Fraction ou un entier
+        POST : Retourne une nouvelle LazyFraction (non simplifiée)
+        RAISES : TypeError si `other` n'est pas d'un type supporté
+        """
+        pair = _as_pair(other)
+        if pair is None:
+            return NotImplemented
+        return _add(self._num, self._den, pair[0], pair[1])
+
+    __radd__ = __add__
+
+    def __sub__(self, other) -> 'LazyFraction':
+        """
+        Soustraction sans simplification.
+
+        PRE : `other` est une LazyFraction, une Fraction ou un entier
+        POST : Retourne une nouvelle LazyFraction (non simplifiée)
+        RAISES : TypeError si `other` n'est pas d'un type supporté
+        """
+        pair = _as_pair(other)
+        if pair is None:
+            return NotImplemented
+        return _add(self._num, self._den, -pair[0], pair[1])
+
+    def __rsub__(self, other) -> 'LazyFraction':
+        pair = _as_pair(other)
+        if pair is None:
+            return NotImplemented
+        return _add(pair[0], pair[1], -self._num, self._den)
+
+    def __neg__(self) -> 'LazyFraction':
+        obj = object.__new__(LazyFraction)
+        obj._num = -self._num
+        obj._den = self._den
+        obj._reduced = self._reduced
+        return obj
+
+    def __mul__(self, other) -> 'LazyFraction':
+        """
+        Multiplication sans simplification.
+
+        PRE : `other` est une LazyFraction, une Fraction ou un entier
+        POST : Retourne une nouvelle LazyFraction (non simplifiée)
+        RAISES : TypeError si `other` n'est pas d'un type supporté
+        """
+        pair = _as_pair(other)
+        if pair is None:
+            return NotImplemented
+        return LazyFraction._raw(self._num * pair[0], self._den * pair[1])
+
+    __rmul__ = __mul__
+
+    def __truediv__(self, other) -> 'LazyFraction':
+        """
+        Division sans simplification.
+
+        PRE :
+        - `other` est une LazyFraction, une Fraction ou un entier.
+        - `other` ne doit pas être nul.
+
+        POST : Retourne une nouvelle LazyFraction (non simplifiée)
+        RAISES :
+        - TypeError si `other` n'est pas d'un type supporté
+        - ZeroDivisionError si `other` est nul
+        """
+        pair = _as_pair(other)
+        if pair is None:
+            return NotImplemented
+        return _divide(self._num, self._den, pair[0], pair[1])
+
+    def __rtruediv__(self, other) -> 'LazyFraction':
+        pair = _as_pair(other)
+        if pair is None:
+            return NotImplemented
+        return _divide(pair[0], pair[1], self._num, self._den)
+
+    def __pow__(self, other: int) -> 'LazyFraction':
+        """
+        Élève la fraction à une puissance entière.
+
+        PRE : `other` est un entier ; s'il est négatif, la fraction est non nulle
+        POST : Retourne une nouvelle LazyFraction
+        RAISES :
+        - TypeError si `other` n'est pas un entier
+        - ValueError si `other` est négatif et que la fraction est nulle
+        """
+        if not isinstance(other, int):
+            raise TypeError("La puissance doit être un entier.")
+        # Simplifier avant d'élever évite de porter le PGCD à la puissance
+        self._reduce()
+        if other >= 0:
+            return LazyFraction._raw(self._num ** other, self._den ** other)
+        if self._num == 0:
+            raise ValueError(
+                "Le dénominateur ne peut pas être zéro.")
+        return _divide(1, 1, self._num ** -other, self._den ** -other)
+
+# ------------------ Ordering (no reduction needed) ------------------
+
+    def __lt__(self, other) -> bool:
+        pair = _as_pair(other)
+        if pair is None:
+            return NotImplemented
+        return self._num * pair[1] < pair[0] * self._den
+
+    def __le__(self, other) -> bool:
+        pair = _as_pair(other)
+        if pair is None:
+            return NotImplemented
+        return self._num * pair[1] <= pair[0] * self._den
+
+    def __gt__(self, other) -> bool:
+        pair = _as_pair(other)
+        if pair is None:
+            return NotImplemented
+        return self._num * pair[1] > pair[0] * self._den
+
+    def __ge__(self, other) -> bool:
+        pair = _as_pair(other)
+        if pair is None:
+            return NotImplemented
+        return self._num * pair[1] >= pair[0] * self._den
+
+
+def _as_pair(other):
+    """
+    Retourne le couple brut (num, den > 0) d'un opérande, ou None
+    si son type n'est pas supporté.
+    """
+    if isinstance(other, LazyFraction):
+        return other._num, other._den
+    if isinstance(other, Fraction):
+        return other.num, other.den
+    if isinstance(other, int):
+        return other, 1
+    return None
+
+
+def _add(na: int, da: int, nb: int, db: int) -> LazyFraction:
+    """
+    Retourne na/da + nb/db sans simplification.
+
+    PRE : da > 0, db > 0
+    POST : Retourne une LazyFraction de dénominateur positif
+    RAISES : Aucune
+    """
+    if da == db:
+        return LazyFraction._raw(na + nb, da)
+    return LazyFraction._raw(na * db + nb * da, da * db)
+
+
+def _divide(na: int, da: int, nb: int, db: int) -> LazyFraction:
+    """
+    Retourne (na/da) / (nb/db) sans simplification.
+
+    PRE : da > 0, db > 0
+    POST : Retourne une LazyFraction de dénominateur positif
+    RAISES : ZeroDivisionError si nb est nul
+    """
+    if nb == 0:
+        raise ZeroDivisionError(
+            "Division par une fraction avec un numérateur égal à zéro.")
+    if nb < 0:
+        return LazyFraction._raw(-na * db, da * -nb)
+    return LazyFraction._raw(na * db, da * nb)
@@ -54,6 +54,130 @@ class TestFraction(unittest.TestCase):
         with self.assertRaises(ZeroDivisionError):
             f1 / Fraction(0, 1)
 
+    # Test des opérateurs (formules de Henrici) contre le module fractions
+    def test_operators_match_stdlib(self):
+        import fractions
+        import operator
+        values = [(0, 1), (1, 2), (-3, 4), (5, 6), (7, -12), (10**30, 3 * 10**20)]
+        for a in values:
+            for b in values:
+                for op in (operator.add, operator.sub, operator.mul, operator.truediv):
+                    if op is operator.truediv and b[0] == 0:
+                        continue
+                    result = op(Fraction(*a), Fraction(*b))
+                    expected = op(fractions.Fraction(*a), fractions.Fraction(*b))
+                    self.assertEqual((result.numerator, result.denominator),
+                                     (expected.numerator, expected.denominator))
+        self.assertEqual(str(Fraction(-2, 3) ** -3), "-27/8")
+        with self.assertRaises(ValueError):
+            Fraction(0, 1) ** -1
+
+    # Test de la somme exacte Fraction.sum()
+    def test_sum(self):
+        from fraction import fsum_exact
+        self.assertEqual(Fraction.sum([]), Fraction(0))
+        self.assertEqual(Fraction.sum([Fraction(1, 2)]), Fraction(1, 2))
+        # Générateur : série harmonique H(100)
+        total = Fraction(0)
+        for k in range(1, 101):
+            total = total + Fraction(1, k)
+        self.assertEqual(Fraction.sum(Fraction(1, k) for k in range(1, 101)), total)
+        self.assertEqual(fsum_exact(Fraction(-1, 3) for _ in range(3)), Fraction(-1))
+        with self.assertRaises(TypeError):
+            Fraction.sum([Fraction(1, 2), 3.0])
+
+    # Test de la table d'internement
+    def test_interning(self):
+        Fraction.configure_interning(maxsize=2)
+        try:
+            self.assertIs(Fraction(1, 2), Fraction(2, 4))
+            self.assertIs(Fraction(-1, 1), Fraction(3, -3))
+            big = Fraction(1000, 3000)
+            self.assertIs(Fraction(1000, 3000), big)
+            self.assertEqual(str(big), "1/3")
+            Fraction(10**6, 7)
+            Fraction(10**7, 7)
+            # (1000, 3000) a été évincé du cache LRU
+            self.assertIsNot(Fraction(1000, 3000), big)
+            info = Fraction.interning_info()
+            self.assertEqual(info["size"], 2)
+            self.assertEqual(info["hits"], 5)
+            self.assertEqual(info["misses"], 4)
+        finally:
+            Fraction.configure_interning(enabled=False)
+        self.assertIsNot(Fraction(1000, 3000), Fraction(1000, 3000))
+        with self.assertRaises(ValueError):
+            Fraction.configure_interning(maxsize=-1)
+
+    # Test des opérations mixtes avec int, float, Decimal et fractions.Fraction
+    def test_mixed_operands(self):
+        import fractions
+        import numbers
+        from decimal import Decimal
+        f = Fraction(1, 2)
+        self.assertEqual(f + 1, Fraction(3, 2))
+        self.assertEqual(1 + f, Fraction(3, 2))
+        self.assertEqual(3 - f, Fraction(5, 2))
+        self.assertEqual(f * 4, Fraction(2))
+        self.assertEqual(1 / f, Fraction(2))
+        self.assertEqual(f / -3, Fraction(-1, 6))
+        # Conversions exactes
+        self.assertEqual(f + 0.25, Fraction(3, 4))
+        self.assertEqual(0.1 * Fraction(1), Fraction.from_float(0.1))
+        self.assertEqual(Fraction.from_float(0.1).denominator, 2 ** 55)
+        self.assertEqual(Decimal("1.5") - f, Fraction(1))
+        self.assertEqual(Fraction.from_decimal(Decimal("-0.125")), Fraction(-1, 8))
+        self.assertEqual(fractions.Fraction(1, 3) + f, Fraction(5, 6))
+        self.assertIsInstance(f, numbers.Rational)
+
+        with self.assertRaises(ZeroDivisionError):
+            f / 0
+        with self.assertRaises(ZeroDivisionError):
+            2 / Fraction(0)
+        with self.assertRaises(ValueError):
+            f + float("nan")
+        with self.assertRaises(TypeError):
+            f + "1"
+
+    # Test des fractions continues et de limit_denominator()
+    def test_continued_fraction(self):
+        import fractions
+        f = Fraction(415, 93)
+        self.assertEqual(list(f.as_continued_fraction()), [4, 2, 6, 7])
+        self.assertEqual(list(Fraction(-7, 3).as_continued_fraction()), [-3, 1, 2])
+        self.assertEqual(Fraction.from_continued_fraction([4, 2, 6, 7]), f)
+        self.assertEqual(Fraction.from_continued_fraction(iter([-3, 1, 2])), Fraction(-7, 3))
+        self.assertEqual([str(c) for c in f.convergents()],
+                         ["4", "9/2", "58/13", "415/93"])
+        with self.assertRaises(ValueError):
+            Fraction.from_continued_fraction([])
+
+        pi = Fraction(3141592653589793, 10**15)
+        self.assertEqual(pi.limit_denominator(10), Fraction(22, 7))
+        self.assertEqual(pi.limit_denominator(100), Fraction(311, 99))
+        self.assertEqual(pi.limit_denominator(1000), Fraction(355, 113))
+        self.assertIs(f.limit_denominator(100), f)
+        for value in (Fraction(-10**40 - 7, 3**60), Fraction(123456789, 1000003)):
+            for bound in (1, 2, 7, 1000, 10**9):
+                expected = fractions.Fraction(value.numerator, value.denominator) \
+                    .limit_denominator(bound)
+                result = value.limit_denominator(bound)
+                self.assertEqual((result.numerator, result.denominator),
+                                 (expected.numerator, expected.denominator))
+        with self.assertRaises(ValueError):
+            f.limit_denominator(0)
+
+    # Test de __float__ (arrondi correct, grands entiers, mémorisation)
+    def test_float(self):
+        self.assertEqual(float(Fraction(1, 3)), 1 / 3)
+        self.assertEqual(float(Fraction(10**400 + 1, 10**399)), 10.0)
+        self.assertEqual(float(Fraction(1, 10**400)), 0.0)
+        big = Fraction(3**700 + 1, 3**700)
+        self.assertEqual(float(big), 1.0)
+        self.assertIs(float(big), float(big))
+        with self.assertRaises(OverflowError):
+            float(Fraction(10**400, 3))
+
     # Test une fraction négative
     def test_negative_fraction(self):
         f1 = Fraction(-1, 2)
@@ -75,6 +199,77 @@ class TestFraction(unittest.TestCase):
         f3 = Fraction(3, 4)
         self.assertFalse(f1 == f3)
 
+        # Comparaison avec les autres types numériques
+        import fractions
+        from decimal import Decimal
+        self.assertTrue(f1 == 0.5 and 0.5 == f1)
+        self.assertTrue(Fraction(4, 2) == 2 and 2 == Fraction(4, 2))
+        self.assertTrue(f1 == fractions.Fraction(1, 2))
+        self.assertTrue(fractions.Fraction(1, 2) == f1)
+        self.assertTrue(f1 == Decimal("0.5") and f1 == complex(0.5, 0))
+        self.assertFalse(Fraction(1, 3) == 1 / 3)
+        self.assertFalse(f1 == float("nan") or f1 == float("inf"))
+        self.assertFalse(f1 == "1/2")
+        self.assertTrue(f1 != "1/2")
+        self.assertIs(f1.__eq__("1/2"), NotImplemented)
+
+    # Test des opérateurs d'ordre <, <=, >, >=
+    def test_ordering(self):
+        import fractions
+        from decimal import Decimal
+        f1 = Fraction(1, 3)
+        f2 = Fraction(1, 2)
+        self.assertTrue(f1 < f2)
+        self.assertTrue(f1 <= Fraction(2, 6))
+        self.assertTrue(Fraction(-1, 2) < Fraction(-1, 3))
+        self.assertTrue(Fraction(3, 4) > Fraction(1, 4))
+        self.assertTrue(f2 >= f1)
+        self.assertFalse(f2 <= f1)
+        with self.assertRaises(TypeError):
+            f1 < "1/2"
+        # Comparaisons avec les autres nombres
+        self.assertTrue(f1 < 1 and 0 < f1 and f2 <= 0.5 and f2 >= Decimal("0.5"))
+        self.assertTrue(f1 > fractions.Fraction(1, 4))
+        self.assertTrue(f1 < float("inf") and f1 > float("-inf"))
+        self.assertFalse(f1 < float("nan") or f1 >= float("nan"))
+
+    # Test du protocole numbers.Rational (opérateurs unaires, arrondis, divmod)
+    def test_rational_protocol(self):
+        import fractions
+        import math
+        import statistics
+        f = Fraction(-7, 2)
+        self.assertEqual((-f, +f, abs(f)), (Fraction(7, 2), f, Fraction(7, 2)))
+        self.assertEqual((int(f), math.floor(f), math.ceil(f)), (-3, -4, -3))
+        self.assertEqual((round(Fraction(5, 2)), round(Fraction(7, 2)), round(f)), (2, 4, -4))
+        self.assertEqual(round(Fraction(1234, 1000), 2), Fraction(123, 100))
+        self.assertEqual((f // 1, f % 1), (-4, Fraction(1, 2)))
+        self.assertEqual(divmod(Fraction(7, 2), Fraction(-1, 3)), (-11, Fraction(-1, 6)))
+        self.assertEqual((7 // Fraction(7, 2), 7 % Fraction(2)), (2, Fraction(1)))
+        with self.assertRaises(ZeroDivisionError):
+            f // 0
+        self.assertEqual((f.real, f.imag, f.conjugate()), (f, 0, f))
+        self.assertFalse(Fraction(0))
+        self.assertTrue(f)
+        self.assertEqual(f.as_integer_ratio(), (-7, 2))
+        self.assertEqual(2 ** Fraction(3), Fraction(8))
+        self.assertEqual(Fraction(fractions.Fraction(3, 4)), Fraction(3, 4))
+        self.assertEqual(statistics.mean([Fraction(1, 2), Fraction(1, 3)]), Fraction(5, 12))
+
+    # Test du tri avec Fraction.sort_key
+    def test_sort_key(self):
+        import bisect
+        import random
+        rng = random.Random(42)
+        values = [Fraction(rng.randint(-50, 50), rng.randint(1, 50)) for _ in range(200)]
+        # Valeurs très proches (même flottant) et hors de la plage des flottants
+        values += [Fraction(10**20, 10**20 + 1), Fraction(10**20 + 1, 10**20 + 2),
+                   Fraction(10**400, 3), Fraction(-10**400, 7)]
+        expected = sorted(values)
+        self.assertEqual(sorted(values, key=Fraction.sort_key), expected)
+        index = bisect.bisect_left(expected, Fraction(0).sort_key(), key=Fraction.sort_key)
+        self.assertTrue(all(f < Fraction(0) for f in expected[:index]))
+
     # Test de la méthode is_integer()
     def test_is_integer(self):
         f1 = Fraction(6, 2)
@@ -100,5 +295,45 @@ class TestFraction(unittest.TestCase):
         f3 = Fraction(3, 4)
         self.assertFalse(f1.is_adjacent_to(f3))
 
+    # Test de l'immuabilité (__slots__, pas de __dict__)
+    def test_immutable(self):
+        f = Fraction(1, 2)
+        self.assertFalse(hasattr(f, "__dict__"))
+        with self.assertRaises(AttributeError):
+            f.num = 3
+        with self.assertRaises(AttributeError):
+            f.autre = 3
+        with self.assertRaises(AttributeError):
+            del f.den
+        self.assertEqual(str(f), "1/2")
+
+    # Test de la méthode __hash__()
+    def test_hash(self):
+        self.assertEqual(hash(Fraction(1, 2)), hash(Fraction(2, 4)))
+        self.assertEqual(hash(Fraction(1, -2)), hash(Fraction(-1, 2)))
+        d = {Fraction(1, 2): "demi"}
+        self.assertEqual(d[Fraction(3, 6)], "demi")
+        self.assertEqual(len({Fraction(1, 3), Fraction(2, 6), Fraction(1, 2)}), 2)
+
+        # Compatible avec le hash numérique de CPython
+        import fractions
+        for num, den in [(0, 1), (7, 1), (-1, 1), (-2, 1), (1, 2), (-3, 4), (10**40, 3),
+                         (1, 2**61 - 1), (-5, 3 * (2**61 - 1)), (2**200 + 1, 2**70)]:
+            f = Fraction(num, den)
+            self.assertEqual(hash(f), hash(fractions.Fraction(num, den)))
+            self.assertEqual(hash(f), hash(f))
+        self.assertEqual(hash(Fraction(5)), hash(5))
+        self.assertEqual(hash(Fraction(-3, 8)), hash(-0.375))
+        self.assertEqual({1: "un", 0.5: "demi"}[Fraction(1, 2)], "demi")
+        self.assertEqual(len({Fraction(2), 2, 2.0, Fraction(1, 2), 0.5}), 2)
+
+    # Test de la copie et de la sérialisation
+    def test_pickle(self):
+        import copy
+        import pickle
+        f = Fraction(-3, 4)
+        self.assertEqual(pickle.loads(pickle.dumps(f)), f)
+        self.assertEqual(copy.deepcopy(f), f)
+
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
@@ -0,0 +1,115 @@
+import unittest
+import sys
+import os
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../")))
+from fraction import Fraction
+
+try:
+    import numpy as np
+    from fraction_array import FractionArray, to_float_array
+except ImportError:  # NumPy est une dépendance optionnelle
+    np = None
+
+
+def as_pairs(values):
+    return [(f.numerator, f.denominator) for f in values]
+
+
+@unittest.skipIf(np is None, "NumPy n'est pas installé")
+class TestFractionArray(unittest.TestCase):
+
+    # Test du constructeur : simplification et signe au numérateur
+    def test_constructor(self):
+        a = FractionArray([4, 3, -2, 0], [8, -6, -4, 5])
+        self.assertEqual(as_pairs(a), [(1, 2), (-1, 2), (1, 2), (0, 1)])
+        self.assertEqual(a.num.dtype, np.int64)
+
+        with self.assertRaises(ValueError):
+            FractionArray([1, 2], [1, 0])
+        with self.assertRaises(TypeError):
+            FractionArray([1.5], [2])
+
+    # Test des opérateurs contre la Fraction scalaire
+    def test_operators_match_scalar(self):
+        nums = [1, -3, 5, 7, 10**12]
+        dens = [2, 4, -6, 9, 7]
+        a = FractionArray(nums, dens)
+        b = FractionArray(dens, [n or 1 for n in nums])
+        fa = [Fraction(n, d) for n, d in zip(nums, dens)]
+        fb = [Fraction(d, n) for n, d in zip(nums, dens)]
+        self.assertEqual(as_pairs(a + b), as_pairs(x + y for x, y in zip(fa, fb)))
+        self.assertEqual(as_pairs(a - b), as_pairs(x - y for x, y in zip(fa, fb)))
+        self.assertEqual(as_pairs(a * b), as_pairs(x * y for x, y in zip(fa, fb)))
+        self.assertEqual(as_pairs(a / b), as_pairs(x / y for x, y in zip(fa, fb)))
+        self.assertEqual(as_pairs(a ** -3), as_pairs(x ** -3 for x in fa))
+        self.assertEqual(as_pairs(a + Fraction(1, 3)),
+                         as_pairs(x + Fraction(1, 3) for x in fa))
+
+        with self.assertRaises(ZeroDivisionError):
+            a / FractionArray([0], [1])
+
+    # Test des comparaisons élément par élément
+    def test_comparisons(self):
+        a = FractionArray([1, 2, 3], [2, 4, 4])
+        b = FractionArray([1, 1, 1], [3, 2, 1])
+        self.assertEqual(list(a == b), [False, True, False])
+        self.assertEqual(list(a < b), [False, False, True])
+        self.assertEqual(list(a >= b), [True, True, False])
+
+    # Test du repli sur les entiers Python en cas de dépassement d'int64
+    def test_overflow_fallback(self):
+        big = 2**62
+        a = FractionArray([big, 1], [3, 3])
+        total = a + a
+        self.assertEqual(total[0], Fraction(2 * big, 3))
+        self.assertEqual(total.num.dtype, object)
+        # Le résultat revient en int64 dès que possible
+        self.assertEqual((total - total).num.dtype, np.int64)
+
+    # Test de INT64_MIN : son opposé ne tient pas dans un int64
+    def test_int64_min(self):
+        low = -2**63
+        a = FractionArray([low], [-1])
+        self.assertEqual(a[0], Fraction(2**63))
+        b = FractionArray([1, 1], [low, 3])
+        self.assertEqual(b.to_fractions(), [Fraction(-1, 2**63), Fraction(1, 3)])
+        self.assertTrue(all(int(d) > 0 for d in b.den))
+        c = FractionArray._from_reduced(np.array([low, 3]), np.array([1, 1]))
+        self.assertEqual((-c).to_fractions(), [Fraction(2**63), Fraction(-3)])
+        self.assertEqual(abs(c)[0], Fraction(2**63))
+        self.assertEqual((c - np.int64(low)).to_fractions(), [Fraction(0), Fraction(3 - low)])
+
+    # Test de la soustraction d'un scalaire hors des int64
+    def test_sub_big_scalar(self):
+        a = FractionArray([1, 1], [2, 3])
+        self.assertEqual((a - 2**70).to_fractions(), [Fraction(1, 2) - 2**70, Fraction(1, 3) - 2**70])
+        self.assertEqual((a - Fraction(2**70, 3)).to_fractions(),
+                         [Fraction(1, 2) - Fraction(2**70, 3), Fraction(1, 3) - Fraction(2**70, 3)])
+        self.assertEqual((2**70 - a)[0], 2**70 - Fraction(1, 2))
+
+    # Test des réductions exactes
+    def test_sum_prod(self):
+        a = FractionArray(list(range(1, 101)), list(range(2, 102)))
+        expected_sum = Fraction(0)
+        expected_prod = Fraction(1)
+        for f in a:
+            expected_sum = expected_sum + f
+            expected_prod = expected_prod * f
+        self.assertEqual(a.sum(), expected_sum)
+        self.assertEqual(a.prod(), Fraction(1, 101))
+        self.assertEqual(a.prod(), expected_prod)
+        self.assertEqual(FractionArray([], []).sum(), Fraction(0))
+
+    # Test de la conversion en float64 (rapide et exacte, ou élément par élément)
+    def test_to_float(self):
+        a = FractionArray([1, -2, 10**30], [3, 7, 3**70])
+        expected = [1 / 3, -2 / 7, 10**30 / 3**70]
+        self.assertEqual(list(a.to_float()), expected)
+        self.assertEqual(list(FractionArray([1, 2], [3, 5]).to_float()), [1 / 3, 2 / 5])
+        values = [Fraction(1, 3), Fraction(10**400 + 1, 10**399)]
+        self.assertEqual(list(to_float_array(values)), [1 / 3, 10.0])
+        self.assertEqual(to_float_array(iter([])).dtype, np.float64)
+
+
+if __name__ == "__main__":
+    unittest.main()
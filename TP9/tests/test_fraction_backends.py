@@ -0,0 +1,130 @@
+import unittest
+import sys
+import os
+import importlib.util
+import shutil
+import tempfile
+import warnings
+from unittest import mock
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../")))
+import fraction
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+ROOT = os.path.abspath(os.path.join(HERE, "../"))
+
+# Seule l'extension compilée depuis ce fraction.py est utilisée
+_fraction_accel = fraction._load_accelerator(os.path.join(ROOT, "fraction.py"))
+
+
+def load(name, path):
+    """Charge un fichier source comme module indépendant."""
+    spec = importlib.util.spec_from_file_location(name, path)
+    module = importlib.util.module_from_spec(spec)
+    # Enregistré comme un import normal (nécessaire pour pickle)
+    sys.modules[name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+def parity_suite(backend):
+    """
+    Retourne la classe TestFraction de test_fraction.py exécutée avec
+    `backend` comme module `fraction` (y compris pour les imports faits
+    à l'intérieur des tests).
+    """
+    saved = sys.modules["fraction"]
+    sys.modules["fraction"] = backend
+    try:
+        tests = load(f"test_fraction_{backend.__name__}", os.path.join(HERE, "test_fraction.py"))
+    finally:
+        sys.modules["fraction"] = saved
+
+    class Parity(tests.TestFraction):
+
+        def setUp(self):
+            sys.modules["fraction"] = backend
+            self.addCleanup(sys.modules.__setitem__, "fraction", saved)
+            super().setUp()
+
+    return Parity
+
+
+# Le module pur est chargé sous un autre nom : il ne charge pas l'accélérateur
+pure = load("fraction_pure", os.path.join(ROOT, "fraction.py"))
+
+
+class TestPurePython(parity_suite(pure)):
+    pass
+
+
+if _fraction_accel is not None:
+    class TestCompiled(parity_suite(_fraction_accel)):
+        pass
+
+
+class TestBackendSelection(unittest.TestCase):
+
+    # Test du choix automatique du backend
+    def test_backend(self):
+        self.assertEqual(pure.BACKEND, "python")
+        self.assertEqual(pure.Fraction.__module__, "fraction_pure")
+        if _fraction_accel is None or os.environ.get("FRACTION_PURE_PYTHON"):
+            self.assertEqual(fraction.BACKEND, "python")
+        else:
+            self.assertEqual(fraction.BACKEND, "cython")
+            self.assertIs(fraction.Fraction, _fraction_accel.Fraction)
+            self.assertIs(fraction._sum_pairs, _fraction_accel._sum_pairs)
+
+    def load_copy(self, folder, suffix=b""):
+        """Charge une copie de fraction.py (suivie de `suffix`) placée dans
+        `folder` comme module `fraction`, et retourne (module, avertissements)."""
+        with open(os.path.join(ROOT, "fraction.py"), "rb") as file:
+            code = file.read()
+        path = os.path.join(folder, "fraction.py")
+        with open(path, "wb") as file:
+            file.write(code + suffix)
+        # sys.modules est restauré : `fraction` et `_fraction_accel` restent ceux des autres tests
+        with mock.patch.dict(sys.modules), mock.patch.dict(os.environ), \
+                warnings.catch_warnings(record=True) as caught:
+            os.environ.pop("FRACTION_PURE_PYTHON", None)
+            warnings.simplefilter("always")
+            module = load("fraction", path)
+        return module, [str(w.message) for w in caught]
+
+    # Test : un _fraction_accel ailleurs dans sys.path n'est pas chargé
+    def test_foreign_accelerator_ignored(self):
+        folder, other = tempfile.mkdtemp(), tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, folder)
+        self.addCleanup(shutil.rmtree, other)
+        with open(os.path.join(other, "_fraction_accel.py"), "w") as file:
+            file.write("Fraction = None\n")
+        with mock.patch.object(sys, "path", [other] + sys.path):
+            module, caught = self.load_copy(folder)
+        self.assertEqual(module.BACKEND, "python")
+        self.assertEqual(module.Fraction(2, 4), pure.Fraction(1, 2))
+        self.assertEqual(caught, [])
+
+    # Test : une extension compilée depuis un autre source est ignorée
+    @unittest.skipIf(_fraction_accel is None, "accélérateur non compilé")
+    def test_stale_accelerator_ignored(self):
+        folder = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, folder)
+        shutil.copy(_fraction_accel.__file__, folder)
+        module, caught = self.load_copy(folder)
+        self.assertEqual((module.BACKEND, caught), ("cython", []))
+        module, caught = self.load_copy(folder, b"\n# modifi\xc3\xa9\n")
+        self.assertEqual(module.BACKEND, "python")
+        self.assertEqual(len(caught), 1)
+        self.assertIn("build_accelerator.py", caught[0])
+
+    # Test de l'interopérabilité entre les deux implémentations
+    def test_interoperability(self):
+        a = pure.Fraction(1, 3)
+        b = fraction.Fraction(2, 6)
+        self.assertTrue(a == b and b == a)
+        self.assertEqual(hash(a), hash(b))
+        self.assertEqual(a + b, pure.Fraction(2, 3))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,61 @@
+import io
+import os
+import pickle
+import tempfile
+import unittest
+import sys
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../")))
+from fraction import Fraction
+from fraction_binary import FractionReader, open_binary, write_binary
+
+
+class TestFractionBinary(unittest.TestCase):
+
+    values = [Fraction(3, 4), Fraction(-7), Fraction(0), Fraction(-2**63, 5),
+              Fraction(10**30 + 1, 7), Fraction(-1, 10**25), Fraction(2**63 - 1, 2**62 + 1)]
+
+    # Test de l'aller-retour en mémoire
+    def test_round_trip(self):
+        buffer = io.BytesIO()
+        self.assertEqual(write_binary(buffer, self.values), len(self.values))
+        reader = FractionReader(buffer.getvalue())
+        self.assertEqual(len(reader), len(self.values))
+        self.assertEqual(list(reader), self.values)
+        self.assertEqual(reader[4], Fraction(10**30 + 1, 7))
+        self.assertEqual(reader[-1], self.values[-1])
+        self.assertTrue(reader.has_overflow())
+        # 16 octets par petite fraction
+        small = io.BytesIO()
+        write_binary(small, [Fraction(1, 2)] * 10)
+        self.assertEqual(len(small.getvalue()), 24 + 16 * 10)
+
+    # Test des vues sans copie sur un fichier mappé en mémoire
+    def test_open_binary(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "fractions.bin")
+            with open(path, "wb") as file:
+                write_binary(file, (Fraction(k, k + 1) for k in range(1000)))
+            with open_binary(path) as reader:
+                self.assertFalse(reader.has_overflow())
+                self.assertEqual(reader.numerators.format, "q")
+                self.assertEqual(reader.numerators[10], 10)
+                self.assertEqual(reader.denominators[10], 11)
+                self.assertEqual(reader[999], Fraction(999, 1000))
+
+    # Test des fichiers invalides
+    def test_invalid(self):
+        with self.assertRaises(ValueError):
+            FractionReader(b"PASDEFRACTION" * 3)
+        buffer = io.BytesIO()
+        write_binary(buffer, self.values)
+        with self.assertRaises(ValueError):
+            FractionReader(buffer.getvalue()[:-1])
+
+    # Test de la sérialisation pickle (via __reduce__)
+    def test_pickle(self):
+        data = pickle.dumps(self.values, protocol=pickle.HIGHEST_PROTOCOL)
+        self.assertEqual(pickle.loads(data), self.values)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,82 @@
+import unittest
+import sys
+import os
+import random
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../")))
+from fraction import Fraction
+from fraction_egyptian import (greedy, engel, optimal, farey_sequence, stern_brocot,
+                               farey_neighbours, AdjacencyIndex)
+
+
+def denominators(terms):
+    return [f.den for f in terms]
+
+
+class TestFractionEgyptian(unittest.TestCase):
+
+    # Test des décompositions gloutonne et d'Engel
+    def test_greedy_engel(self):
+        x = Fraction(4, 13)
+        self.assertEqual(denominators(greedy(x)), [4, 18, 468])
+        self.assertEqual(denominators(engel(x)), [4, 20, 140, 1820])
+        for q in range(1, 25):
+            for p in range(1, q + 1):
+                x = Fraction(p, q)
+                for terms in (greedy(x), engel(x)):
+                    self.assertTrue(all(f.is_unit() for f in terms))
+                    self.assertEqual(Fraction.sum(terms), x)
+                    dens = denominators(terms)
+                    self.assertEqual(dens, sorted(set(dens)))
+        with self.assertRaises(ValueError):
+            greedy(Fraction(3, 2))
+        with self.assertRaises(ValueError):
+            engel(Fraction(0))
+        with self.assertRaises(TypeError):
+            greedy(0.5)
+
+    # Test de la décomposition optimale à dénominateurs bornés
+    def test_optimal(self):
+        self.assertEqual(denominators(optimal(Fraction(4, 13), 100)), [4, 26, 52])
+        self.assertEqual(denominators(optimal(Fraction(3, 4), 10)), [2, 4])
+        self.assertEqual(denominators(optimal(Fraction(2), 6)), [1, 2, 3, 6])
+        with self.assertRaises(ValueError):
+            optimal(Fraction(1, 7), 6)
+        with self.assertRaises(ValueError):
+            optimal(Fraction(2, 13), 60, max_terms=4)
+        # 8 ne divise pas ppcm(1, ..., 4) = 12, bien que 2 et 4 soient <= 4
+        with self.assertRaises(ValueError):
+            optimal(Fraction(1, 8), 4)
+        # Grande borne : le PPCM de 1 à max_den n'est pas calculé
+        self.assertEqual(denominators(optimal(Fraction(3, 7), 10 ** 6)), [4, 7, 28])
+
+    # Test des suites de Farey et de l'arbre de Stern–Brocot
+    def test_farey_stern_brocot(self):
+        self.assertEqual([str(f) for f in farey_sequence(4)],
+                         ["0", "1/4", "1/3", "1/2", "2/3", "3/4", "1"])
+        tree = list(stern_brocot(3))
+        self.assertEqual([str(f) for f in tree], ["1/3", "1/2", "2/3", "1", "3/2", "2", "3"])
+        sequence = list(farey_sequence(12))
+        for a, b in zip(sequence, sequence[1:]):
+            self.assertTrue(a.is_adjacent_to(b))
+        for left, x, right in zip(sequence, sequence[1:], sequence[2:]):
+            self.assertEqual(farey_neighbours(x, 12), (left, right))
+        self.assertEqual(farey_neighbours(Fraction(355, 113), 10),
+                         (Fraction(25, 8), Fraction(22, 7)))
+        self.assertEqual(farey_neighbours(Fraction(-2), 3), (Fraction(-7, 3), Fraction(-5, 3)))
+
+    # Test de l'index de voisinage (comparé à un parcours complet)
+    def test_adjacency_index(self):
+        rng = random.Random(3)
+        values = [Fraction(rng.randint(-100, 100), rng.randint(1, 100)) for _ in range(2000)]
+        index = AdjacencyIndex(values)
+        self.assertEqual(len(index), len(set(values)))
+        self.assertIn(values[0], index)
+        for x in values[:100] + [Fraction(1), Fraction(1, 2), Fraction(3, 1000)]:
+            expected = sorted({f for f in values if f.is_adjacent_to(x)})
+            self.assertEqual(index.neighbours(x), expected)
+        with self.assertRaises(TypeError):
+            AdjacencyIndex([1])
+
+
+if __name__ == "__main__":
+    unittest.main()
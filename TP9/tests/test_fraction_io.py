@@ -0,0 +1,51 @@
+import io
+import unittest
+import sys
+import os
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../")))
+from fraction import Fraction
+from fraction_io import read_fractions, write_fractions
+
+
+class TestFractionIO(unittest.TestCase):
+
+    values = [Fraction(3, 4), Fraction(-7), Fraction(7, 3), Fraction(-7, 3),
+              Fraction(-1, 3), Fraction(0), Fraction(10**40 + 1, 10**20)]
+
+    # Test de Fraction.from_string sur les deux formats de sortie
+    def test_from_string(self):
+        self.assertEqual(Fraction.from_string("3/4"), Fraction(3, 4))
+        self.assertEqual(Fraction.from_string(" -7 "), Fraction(-7))
+        self.assertEqual(Fraction.from_string("2 1/3"), Fraction(7, 3))
+        self.assertEqual(Fraction.from_string(b"6/8"), Fraction(3, 4))
+        for f in self.values:
+            self.assertEqual(Fraction.from_string(str(f)), f)
+            self.assertEqual(Fraction.from_string(f.as_mixed_number()), f)
+        for text in ("", "a/b", "1/2/3", "2 -1/3", "1 2"):
+            with self.assertRaises(ValueError):
+                Fraction.from_string(text)
+
+    # Test de l'aller-retour écriture / lecture (texte et binaire)
+    def test_round_trip(self):
+        for mixed in (False, True):
+            text = io.StringIO()
+            self.assertEqual(write_fractions(text, iter(self.values), mixed=mixed),
+                             len(self.values))
+            text.seek(0)
+            self.assertEqual(list(read_fractions(text, chunk_size=5)), self.values)
+            binary = io.BytesIO(text.getvalue().encode())
+            self.assertEqual(list(read_fractions(binary, chunk_size=3)), self.values)
+
+    # Test des lignes vides, \r\n, absence de saut de ligne final et erreurs
+    def test_read_edge_cases(self):
+        data = io.BytesIO(b"1/2\r\n\n  -3 \r\n2 1/4")
+        self.assertEqual(list(read_fractions(data, chunk_size=4)),
+                         [Fraction(1, 2), Fraction(-3), Fraction(9, 4)])
+        with self.assertRaisesRegex(ValueError, "Ligne 2"):
+            list(read_fractions(io.StringIO("1/2\nx/3\n")))
+        with self.assertRaisesRegex(ValueError, "Ligne 1"):
+            list(read_fractions(io.StringIO("1/0\n")))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,54 @@
+import unittest
+import sys
+import os
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../")))
+from fraction import Fraction
+from fraction_matrix import FractionMatrix
+
+
+class TestFractionMatrix(unittest.TestCase):
+
+    a = FractionMatrix([[Fraction(1, 2), Fraction(1, 3), 1],
+                        [Fraction(-2, 5), 3, Fraction(1, 4)],
+                        [1, Fraction(2, 7), Fraction(-1, 6)]])
+
+    # Test du déterminant (valeur obtenue par la règle de Sarrus)
+    def test_determinant(self):
+        self.assertEqual(self.a.determinant(), Fraction(-601, 180))
+        self.assertEqual(FractionMatrix([[1, 2], [2, 4]]).determinant(), Fraction(0))
+        self.assertEqual(FractionMatrix([[0, 1], [1, 0]]).determinant(), Fraction(-1))
+        with self.assertRaises(ValueError):
+            FractionMatrix([[1, 2, 3]]).determinant()
+
+    # Test de la résolution et de l'inverse
+    def test_solve_inverse(self):
+        b = [Fraction(1), Fraction(-1, 2), Fraction(3, 4)]
+        x = self.a.solve(b)
+        for row, expected in zip(self.a.to_list(), b):
+            self.assertEqual(Fraction.sum(v * xi for v, xi in zip(row, x)), expected)
+        identity = FractionMatrix.identity(3)
+        self.assertEqual(self.a @ self.a.inverse(), identity)
+        self.assertEqual(self.a.inverse() @ self.a, identity)
+        with self.assertRaises(ValueError):
+            FractionMatrix([[1, 2], [2, 4]]).inverse()
+
+    # Test du rang (matrices singulières et rectangulaires)
+    def test_rank(self):
+        self.assertEqual(self.a.rank(), 3)
+        self.assertEqual(FractionMatrix([[1, 2], [2, 4]]).rank(), 1)
+        self.assertEqual(FractionMatrix([[0, 0, 1], [0, 0, 2]]).rank(), 1)
+        self.assertEqual(FractionMatrix([[1, 0, 0], [0, 0, 1]]).rank(), 2)
+        self.assertEqual(FractionMatrix([[0]]).rank(), 0)
+
+    # Test du constructeur
+    def test_constructor(self):
+        with self.assertRaises(ValueError):
+            FractionMatrix([])
+        with self.assertRaises(ValueError):
+            FractionMatrix([[1, 2], [3]])
+        with self.assertRaises(TypeError):
+            FractionMatrix([[1.5]])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,63 @@
+import unittest
+import sys
+import os
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../")))
+from fraction import Fraction
+import fraction_metrics
+from fraction_metrics import instrumented, snapshot, to_prometheus
+
+
+class TestFractionMetrics(unittest.TestCase):
+
+    def tearDown(self):
+        fraction_metrics.disable()
+        fraction_metrics.reset()
+
+    # Test des compteurs de constructions, de PGCD et d'opérateurs
+    def test_counters(self):
+        with instrumented():
+            a = Fraction(2, 6)
+            b = a + Fraction(1, 2 ** 40)
+            b * 3
+            self.assertTrue(a < b)
+        data = snapshot()
+        self.assertFalse(data["enabled"])
+        self.assertEqual(data["constructions"], 2)
+        self.assertEqual(data["gcd_calls"], 2)
+        self.assertGreaterEqual(data["reduced_constructions"], 2)
+        add = data["operations"]["__add__"]
+        self.assertEqual(add["calls"], 1)
+        self.assertEqual(add["operand_bits"], 2 + 41)
+        self.assertEqual(add["histogram"], {3: 1, 63: 1})
+        self.assertEqual(set(data["operations"]), {"__add__", "__mul__", "__lt__"})
+        self.assertGreaterEqual(add["seconds"], 0)
+
+    # Test de la restauration des méthodes d'origine
+    def test_disable_restores(self):
+        originals = {name: Fraction.__dict__[name] for name in fraction_metrics.OPERATORS}
+        new = Fraction.__dict__["__new__"]
+        fraction_metrics.enable()
+        fraction_metrics.enable()
+        self.assertIsNot(Fraction.__dict__["__add__"], originals["__add__"])
+        self.assertEqual(Fraction(1, 2) + 1, Fraction(3, 2))
+        fraction_metrics.disable()
+        for name, method in originals.items():
+            self.assertIs(Fraction.__dict__[name], method)
+        self.assertIs(Fraction.__dict__["__new__"], new)
+        Fraction(1, 3) + Fraction(1, 3)
+        self.assertEqual(snapshot()["operations"]["__add__"]["calls"], 1)
+
+    # Test de l'export au format Prometheus
+    def test_prometheus(self):
+        with instrumented():
+            Fraction(1, 3) * Fraction(3, 4)
+        text = to_prometheus()
+        self.assertIn('fraction_constructions_total{path="checked"} 2\n', text)
+        self.assertIn('fraction_operations_total{op="mul"} 1\n', text)
+        self.assertIn('fraction_operand_bits_bucket{op="mul",le="3"} 2\n', text)
+        self.assertIn('fraction_operand_bits_bucket{op="mul",le="+Inf"} 2\n', text)
+        self.assertIn("# TYPE fraction_operand_bits histogram\n", text)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,56 @@
+import functools
+import math
+import unittest
+import sys
+import os
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../")))
+from fraction import Fraction
+import fraction_parallel
+from fraction_parallel import parallel_map, parallel_prod, parallel_sum
+
+
+def adjacent_to(other, f):
+    return f.is_adjacent_to(other)
+
+
+class TestFractionParallel(unittest.TestCase):
+
+    values = [Fraction((-1) ** k * k, k + 1) for k in range(1, 200)]
+
+    def setUp(self):
+        # Forcer le découpage en blocs même pour une petite liste
+        self.threshold = fraction_parallel.PARALLEL_THRESHOLD
+        fraction_parallel.PARALLEL_THRESHOLD = 10
+
+    def tearDown(self):
+        fraction_parallel.PARALLEL_THRESHOLD = self.threshold
+
+    # Test de la somme et du produit contre le calcul séquentiel
+    def test_sum_prod(self):
+        self.assertEqual(parallel_sum(self.values, workers=2), Fraction.sum(self.values))
+        expected = Fraction(1)
+        for f in self.values:
+            expected = expected * f
+        self.assertEqual(parallel_prod(self.values, workers=2), expected)
+        self.assertEqual(parallel_prod(self.values, workers=1), expected)
+        self.assertEqual(parallel_sum([], workers=2), Fraction(0))
+        self.assertEqual(parallel_prod([], workers=2), Fraction(1))
+        with self.assertRaises(TypeError):
+            parallel_sum([Fraction(1), 2], workers=2)
+
+    # Test de parallel_map (ordre conservé)
+    def test_map(self):
+        half = Fraction(1, 2)
+        result = parallel_map(functools.partial(adjacent_to, half), self.values, workers=2)
+        self.assertEqual(result, [f.is_adjacent_to(half) for f in self.values])
+        self.assertEqual(parallel_map(str, self.values[:3], workers=2),
+                         [str(f) for f in self.values[:3]])
+
+    # Test du produit équilibré
+    def test_tree_product(self):
+        self.assertEqual(fraction_parallel._tree_product(range(1, 30)), math.factorial(29))
+        self.assertEqual(fraction_parallel._tree_product([]), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,56 @@
+import unittest
+import sys
+import os
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../")))
+from fraction import Fraction
+from fraction_polynomial import FractionPolynomial
+
+
+def naive_eval(coefficients, x):
+    result = Fraction(0)
+    for c in reversed(coefficients):
+        result = result * x + c
+    return result
+
+
+class TestFractionPolynomial(unittest.TestCase):
+
+    coefficients = [Fraction(1, 2), Fraction(-2, 3), 0, Fraction(5, 6)]
+
+    # Test du constructeur et du dénominateur commun
+    def test_constructor(self):
+        p = FractionPolynomial(self.coefficients + [0, 0])
+        self.assertEqual(p.degree(), 3)
+        self.assertEqual(p.coefficients, [Fraction(c) if isinstance(c, int) else c
+                                          for c in self.coefficients])
+        self.assertEqual((p._coeffs, p._den), ((3, -4, 0, 5), 6))
+        self.assertEqual(FractionPolynomial().degree(), -1)
+        with self.assertRaises(TypeError):
+            FractionPolynomial([0.5])
+
+    # Test de l'évaluation (Horner sur les entiers) contre le calcul naïf
+    def test_evaluate(self):
+        p = FractionPolynomial(self.coefficients)
+        points = [Fraction(0), Fraction(1), Fraction(-3, 7), Fraction(10**20, 3), 4]
+        expected = [naive_eval(self.coefficients, x) for x in points]
+        self.assertEqual([p(x) for x in points], expected)
+        self.assertEqual(p.evaluate_many(points), expected)
+        self.assertEqual(FractionPolynomial()(Fraction(1, 2)), Fraction(0))
+
+    # Test de la multiplication (naïve et Karatsuba) et de l'addition
+    def test_arithmetic(self):
+        a = [Fraction(k % 7 - 3, k % 5 + 1) for k in range(100)]
+        b = [Fraction(k % 3 - 1, k % 4 + 1) for k in range(80)]
+        product = [Fraction(0)] * (len(a) + len(b) - 1)
+        for i, x in enumerate(a):
+            for j, y in enumerate(b):
+                product[i + j] = product[i + j] + x * y
+        pa, pb = FractionPolynomial(a), FractionPolynomial(b)
+        self.assertEqual(pa * pb, FractionPolynomial(product))
+        self.assertEqual((pa + pb) - pb, pa)
+        self.assertEqual(pa - pa, FractionPolynomial())
+        self.assertEqual(2 * FractionPolynomial([Fraction(1, 2)]), FractionPolynomial([1]))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,55 @@
+import unittest
+import sys
+import os
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../")))
+from fraction import Fraction
+from lazy_fraction import LazyFraction
+
+
+class TestLazyFraction(unittest.TestCase):
+
+    # Test du constructeur : pas de simplification, signe au numérateur
+    def test_constructor(self):
+        f = LazyFraction(4, -8)
+        self.assertEqual((f._num, f._den), (-4, 8))
+        self.assertEqual(f.numerator, -1)
+        self.assertEqual(f.denominator, 2)
+        with self.assertRaises(ValueError):
+            LazyFraction(1, 0)
+
+    # Test de la simplification différée jusqu'à l'observation
+    def test_deferred_reduction(self):
+        total = LazyFraction(0)
+        for _ in range(4):
+            total = total + LazyFraction(1, 4)
+        self.assertEqual(total._den, 4)
+        self.assertEqual(str(total), "1")
+        self.assertEqual(total.to_fraction(), Fraction(1))
+
+    # Test du seuil de simplification forcée
+    def test_reduce_threshold(self):
+        total = LazyFraction(1)
+        for k in range(1, 400):
+            total = total * LazyFraction(k, k)
+        self.assertLessEqual(total._den.bit_length(), LazyFraction.reduce_bits + 9)
+        self.assertEqual(total, LazyFraction(1))
+
+    # Test des résultats contre la Fraction classique
+    def test_matches_fraction(self):
+        lazy = LazyFraction(1, 3)
+        eager = Fraction(1, 3)
+        for k in range(1, 30):
+            lazy = (lazy * LazyFraction(k, k + 1) - Fraction(1, k)) / LazyFraction(-2, 3)
+            eager = (eager * Fraction(k, k + 1) - Fraction(1, k)) / Fraction(-2, 3)
+        self.assertEqual(lazy.to_fraction(), eager)
+        self.assertEqual(lazy, eager)
+        self.assertEqual(hash(lazy), hash(eager))
+        self.assertEqual(str(2 - LazyFraction(1, 2)), "3/2")
+        self.assertEqual(str(LazyFraction(2, 4) ** -2), "4")
+        self.assertTrue(LazyFraction(1, 3) < Fraction(1, 2))
+        with self.assertRaises(ZeroDivisionError):
+            LazyFraction(1) / LazyFraction(0, 5)
+
+
+if __name__ == "__main__":
+    unittest.main()
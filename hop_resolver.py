@@ -0,0 +1,451 @@
+"""Résolution asynchrone des adresses des sauts (nom inverse et numéro d'AS).
+
+Les requêtes DNS sont envoyées directement en UDP depuis la boucle asyncio :
+aucun appel bloquant (gethostbyaddr) ni fil d'exécution par requête. Le
+nom vient de l'enregistrement PTR, le numéro d'AS de l'enregistrement TXT
+publié par Team Cymru (origin.asn.cymru.com).
+
+Les résultats sont gardés dans un cache en mémoire (durée de vie limitée,
+éviction du moins récemment utilisé), éventuellement sauvegardé dans un
+fichier JSON d'une exécution à l'autre : les routeurs de cœur de réseau,
+présents dans presque toutes les traces, ne sont résolus qu'une fois.
+"""
+import asyncio
+import ipaddress
+import json
+import os
+import random
+import socket
+import struct
+import threading
+import time
+from collections import OrderedDict
+from typing import NamedTuple
+
+DNS_PORT = 53
+LOOKUP_TIMEOUT = 1.0     # secondes par requête DNS
+CACHE_TTL = 6 * 3600     # durée de vie d'un résultat en cache (secondes)
+NEGATIVE_TTL = 600       # durée de vie d'un échec (pas de nom, délai dépassé...)
+CACHE_SIZE = 4096        # nombre maximal d'adresses en mémoire
+MAX_QUERIES = 64         # requêtes DNS en vol au plus (un socket UDP chacune)
+
+_TYPE_PTR = 12
+_TYPE_TXT = 16
+_RCODE_NXDOMAIN = 3
+_HEADER = struct.Struct("!HHHHHH")
+_RECORD = struct.Struct("!HHIH")
+
+
+class HopInfo(NamedTuple):
+    """Nom inverse et numéro d'AS d'une adresse (None si inconnus)."""
+    hostname: str
+    asn: int
+
+
+# ------------------ DNS client ------------------
+
+def default_nameserver() -> str:
+    """
+    Retourne le premier serveur de noms de /etc/resolv.conf.
+
+    PRE : Aucune
+    POST : Retourne une adresse IP, ou None si aucun serveur n'est configuré
+        (fichier absent, par exemple sous Windows)
+    RAISES : Aucune
+    """
+    try:
+        with open("/etc/resolv.conf", encoding="utf-8") as file:
+            for line in file:
+                fields = line.split()
+                if len(fields) >= 2 and fields[0] == "nameserver":
+                    return fields[1]
+    except OSError:
+        pass
+    return None
+
+
+def _encode_name(name: str) -> bytes:
+    labels = [label.encode("idna") for label in name.rstrip(".").split(".") if label]
+    return b"".join(bytes((len(label),)) + label for label in labels) + b"\0"
+
+
+def _read_name(packet: bytes, offset: int) -> tuple:
+    """
+    Lit un nom de domaine (éventuellement compressé) dans un paquet DNS.
+
+    PRE : offset est la position du nom dans `packet`
+    POST : Retourne (nom, position qui suit le nom)
+    RAISES : ValueError si le paquet est tronqué ou si les pointeurs bouclent
+    """
+    labels = []
+    end = None
+    for _ in range(128):
+        if offset >= len(packet):
+            raise ValueError("Paquet DNS tronqué.")
+        length = packet[offset]
+        if length & 0xC0 == 0xC0:
+            if offset + 1 >= len(packet):
+                raise ValueError("Paquet DNS tronqué.")
+            if end is None:
+                end = offset + 2
+            offset = ((length & 0x3F) << 8) | packet[offset + 1]
+        elif length == 0:
+            return ".".join(labels), end if end is not None else offset + 1
+        else:
+            labels.append(packet[offset + 1:offset + 1 + length].decode("ascii", "replace"))
+            offset += 1 + length
+    raise ValueError("Nom DNS invalide.")
+
+
+def _build_query(ident: int, name: str, qtype: int) -> bytes:
+    return _HEADER.pack(ident, 0x0100, 1, 0, 0, 0) + _encode_name(name) + struct.pack("!HH", qtype, 1)
+
+
+def _parse_answers(packet: bytes, qtype: int) -> tuple:
+    """
+    Extrait les réponses de type `qtype` d'un paquet DNS.
+
+    PRE : Aucune
+    POST : Retourne (code de réponse, liste des noms pour PTR ou des textes
+        pour TXT)
+    RAISES : ValueError si le paquet est mal formé
+    """
+    if len(packet) < _HEADER.size:
+        raise ValueError("Paquet DNS tronqué.")
+    _, flags, questions, answers, _, _ = _HEADER.unpack_from(packet)
+    offset = _HEADER.size
+    for _ in range(questions):
+        offset = _read_name(packet, offset)[1] + 4
+    values = []
+    for _ in range(answers):
+        offset = _read_name(packet, offset)[1]
+        rtype, _, _, length = _RECORD.unpack_from(packet, offset)
+        offset += _RECORD.size
+        data = packet[offset:offset + length]
+        if rtype == _TYPE_PTR == qtype:
+            values.append(_read_name(packet, offset)[0])
+        elif rtype == _TYPE_TXT == qtype:
+            chunks, i = [], 0
+            while i < len(data):
+                chunks.append(data[i + 1:i + 1 + data[i]].decode("utf-8", "replace"))
+                i += 1 + data[i]
+            values.append("".join(chunks))
+        offset += length
+    return flags & 0xF, values
+
+
+class _DnsProtocol(asyncio.DatagramProtocol):
+    def __init__(self, ident: int, qtype: int, future: asyncio.Future) -> None:
+        self.ident = ident
+        self.qtype = qtype
+        self.future = future
+
+    def datagram_received(self, data, address) -> None:
+        # Les réponses dont l'identifiant ne correspond pas sont ignorées
+        if self.future.done() or len(data) < 2 or struct.unpack_from("!H", data)[0] != self.ident:
+            return
+        try:
+            self.future.set_result(_parse_answers(data, self.qtype))
+        except (ValueError, struct.error) as error:
+            self.future.set_exception(ValueError(f"Réponse DNS invalide : {error}"))
+
+    def error_received(self, error) -> None:
+        if not self.future.done():
+            self.future.set_exception(error)
+
+
+async def dns_query(name: str, qtype: int, nameserver: tuple, timeout: float = LOOKUP_TIMEOUT) -> list:
+    """
+    Envoie une requête DNS en UDP et attend la réponse sans bloquer la boucle.
+
+    PRE : `nameserver` est un couple (adresse IP, port)
+    POST : Retourne la liste des réponses (vide si le nom n'existe pas)
+    RAISES :
+    - asyncio.TimeoutError si le serveur ne répond pas dans le délai
+    - OSError si le serveur signale une erreur ou est injoignable
+    - ValueError si la réponse est mal formée
+    """
+    loop = asyncio.get_running_loop()
+    ident = random.getrandbits(16)
+    future = loop.create_future()
+    transport, _ = await loop.create_datagram_endpoint(
+        lambda: _DnsProtocol(ident, qtype, future), remote_addr=nameserver)
+    try:
+        transport.sendto(_build_query(ident, name, qtype))
+        rcode, values = await asyncio.wait_for(future, timeout)
+    finally:
+        transport.close()
+    if rcode == _RCODE_NXDOMAIN:
+        return []
+    if rcode:
+        raise OSError(f"Erreur DNS (code {rcode}) pour {name}")
+    return values
+
+
+def asn_query_name(address: str) -> str:
+    """
+    Retourne le nom à interroger (TXT) chez Team Cymru pour `address`.
+
+    PRE : `address` est une adresse IPv4 ou IPv6
+    POST : Retourne par exemple "8.8.8.8.origin.asn.cymru.com" pour 8.8.8.8
+    RAISES : ValueError si `address` n'est pas une adresse IP
+    """
+    ip = ipaddress.ip_address(address)
+    if ip.version == 4:
+        return ".".join(reversed(str(ip).split("."))) + ".origin.asn.cymru.com"
+    return ".".join(reversed(ip.exploded.replace(":", ""))) + ".origin6.asn.cymru.com"
+
+
+# ------------------ Resolver ------------------
+
+class Resolver:
+    """Résolveur asynchrone avec cache, partagé par toutes les traces.
+
+    Les requêtes concurrentes pour une même adresse n'envoient qu'une seule
+    requête DNS. Les échecs (pas de nom, délai dépassé) sont gardés en
+    cache pendant `negative_ttl` secondes pour ne pas retarder les traces
+    suivantes ; une erreur locale (plus de sockets disponibles, serveur
+    injoignable...) n'est pas mise en cache. Un Resolver est utilisé depuis une seule boucle asyncio :
+    celle de l'appelant pour resolve(), ou une boucle dans un fil
+    d'exécution dédié pour submit().
+    """
+
+    def __init__(self, nameserver=None, timeout: float = LOOKUP_TIMEOUT, ttl: float = CACHE_TTL,
+                 negative_ttl: float = NEGATIVE_TTL, max_entries: int = CACHE_SIZE,
+                 cache_file: str = None, asn: bool = True, max_queries: int = MAX_QUERIES,
+                 clock=time.time) -> None:
+        """
+        Initialise le résolveur et charge le cache sur disque s'il existe.
+
+        PRE :
+        - `nameserver` est une adresse IP, un couple (adresse, port) ou None
+          (premier serveur de /etc/resolv.conf ; à défaut, le résolveur du
+          système donne les noms, sans numéro d'AS).
+        - timeout > 0, ttl >= 0, negative_ttl >= 0, max_entries >= 1.
+        - max_queries >= 1 : requêtes DNS simultanées au plus, pour ne pas
+          épuiser les descripteurs de fichiers en mode par lots.
+        - `clock` retourne l'heure en secondes depuis l'époque (les dates
+          d'expiration sont aussi écrites dans le fichier de cache).
+
+        POST : Le résolveur est prêt ; aucune requête n'est encore envoyée
+        RAISES : Aucune (un fichier de cache illisible est ignoré)
+        """
+        if nameserver is None:
+            nameserver = default_nameserver()
+        if isinstance(nameserver, str):
+            nameserver = (nameserver, DNS_PORT)
+        self.nameserver = nameserver
+        self.timeout = timeout
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self.max_entries = max_entries
+        self.cache_file = cache_file
+        self.asn = asn
+        self.max_queries = max_queries
+        self.clock = clock
+        self.queries = 0
+        self._cache = OrderedDict()
+        self._pending = {}
+        self._slots = None
+        self._slots_loop = None
+        self._loop = None
+        self._thread = None
+        if cache_file:
+            self.load()
+
+    def __len__(self) -> int:
+        return len(self._cache)
+
+    def cached(self, address: str):
+        """
+        Retourne le résultat en cache pour `address`, sans requête.
+
+        PRE : Aucune
+        POST : Retourne un HopInfo, ou None si l'adresse est absente du cache
+            ou si son résultat a expiré
+        RAISES : Aucune
+        """
+        entry = self._cache.get(address)
+        if entry is None:
+            return None
+        expires, info = entry
+        if expires <= self.clock():
+            del self._cache[address]
+            return None
+        self._cache.move_to_end(address)
+        return info
+
+    async def resolve(self, address: str) -> HopInfo:
+        """
+        Retourne le nom inverse et le numéro d'AS de `address`.
+
+        Le cache est consulté d'abord ; sinon les requêtes PTR et TXT sont
+        envoyées en parallèle. Le numéro d'AS n'est pas demandé pour les
+        adresses privées ou réservées.
+
+        PRE : `address` est une adresse IPv4 ou IPv6
+        POST : Retourne un HopInfo (champs à None si inconnus) ; le résultat
+            est mis en cache
+        RAISES : Aucune (les erreurs réseau donnent un HopInfo vide)
+        """
+        info = self.cached(address)
+        if info is not None:
+            return info
+        pending = self._pending.get(address)
+        if pending is None:
+            pending = asyncio.ensure_future(self._lookup(address))
+            self._pending[address] = pending
+            pending.add_done_callback(lambda _: self._pending.pop(address, None))
+        return await asyncio.shield(pending)
+
+    async def _lookup(self, address: str) -> HopInfo:
+        try:
+            ip = ipaddress.ip_address(address)
+        except ValueError:
+            return HopInfo(None, None)
+        if self.nameserver is None:
+            info = HopInfo(await self._system_name(address), None)
+            self._store(address, info, self.ttl if info.hostname else self.negative_ttl)
+            return info
+        lookups = [self._query(ip.reverse_pointer, _TYPE_PTR)]
+        if self.asn and ip.is_global:
+            lookups.append(self._query(asn_query_name(address), _TYPE_TXT))
+        results = await asyncio.gather(*lookups)
+        hostname = results[0][0].rstrip(".") if results[0] else None
+        asn = _parse_asn(results[1]) if len(results) > 1 and results[1] else None
+        info = HopInfo(hostname, asn)
+        # Après une erreur locale, la prochaine résolution réessaie
+        if None not in results:
+            self._store(address, info, self.ttl if hostname or asn else self.negative_ttl)
+        return info
+
+    async def _query(self, name: str, qtype: int) -> list:
+        """
+        Envoie une requête DNS, au plus `max_queries` à la fois.
+
+        PRE : Appelée depuis la boucle du résolveur
+        POST : Retourne la liste des réponses (vide si le nom n'existe pas
+            ou si le serveur n'a pas répondu à temps), ou None si la requête
+            a échoué (erreur locale, erreur du serveur, réponse invalide)
+        RAISES : Aucune
+        """
+        loop = asyncio.get_running_loop()
+        if self._slots_loop is not loop:
+            self._slots, self._slots_loop = asyncio.Semaphore(self.max_queries), loop
+        async with self._slots:
+            self.queries += 1
+            try:
+                return await dns_query(name, qtype, self.nameserver, self.timeout)
+            except asyncio.TimeoutError:
+                return []
+            except (OSError, ValueError):
+                return None
+
+    async def _system_name(self, address: str) -> str:
+        # getnameinfo bloque : il tourne dans l'exécuteur de la boucle
+        self.queries += 1
+        loop = asyncio.get_running_loop()
+        try:
+            hostname, _ = await asyncio.wait_for(
+                loop.getnameinfo((address, 0), socket.NI_NAMEREQD), self.timeout)
+        except (OSError, asyncio.TimeoutError):
+            return None
+        return hostname
+
+    def _store(self, address: str, info: HopInfo, ttl: float) -> None:
+        self._cache[address] = (self.clock() + ttl, info)
+        self._cache.move_to_end(address)
+        while len(self._cache) > self.max_entries:
+            self._cache.popitem(last=False)
+
+# ------------------ Synchronous callers ------------------
+
+    def submit(self, address: str):
+        """
+        Lance la résolution de `address` sans attendre le résultat.
+
+        Les requêtes tournent dans une boucle asyncio propre au résolveur,
+        dans un fil d'exécution démarré au premier appel.
+
+        PRE : Aucune
+        POST : Retourne un concurrent.futures.Future dont le résultat est
+            un HopInfo
+        RAISES : Aucune
+        """
+        if self._loop is None:
+            self._loop = asyncio.new_event_loop()
+            self._thread = threading.Thread(target=self._loop.run_forever, daemon=True)
+            self._thread.start()
+        return asyncio.run_coroutine_threadsafe(self.resolve(address), self._loop)
+
+    def close(self) -> None:
+        """
+        Arrête le fil d'exécution de submit() et sauvegarde le cache.
+
+        PRE : Aucune
+        POST : Le cache est écrit dans `cache_file` s'il est défini
+        RAISES : OSError si le fichier de cache ne peut pas être écrit
+        """
+        if self._loop is not None:
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._thread.join()
+            self._loop.close()
+            self._loop = self._thread = None
+        if self.cache_file:
+            self.save()
+
+    def __enter__(self) -> 'Resolver':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+# ------------------ Persistent cache ------------------
+
+    def load(self) -> None:
+        """
+        Ajoute au cache les résultats encore valides de `cache_file`.
+
+        PRE : Aucune
+        POST : Les entrées expirées du fichier sont ignorées
+        RAISES : Aucune (un fichier absent ou illisible est ignoré)
+        """
+        try:
+            with open(self.cache_file, encoding="utf-8") as file:
+                entries = json.load(file)
+            now = self.clock()
+            for address, (hostname, asn, expires) in sorted(entries.items(), key=lambda e: e[1][2]):
+                if expires > now:
+                    self._cache[address] = (expires, HopInfo(hostname, asn))
+        except (OSError, ValueError, TypeError, AttributeError):
+            return
+        while len(self._cache) > self.max_entries:
+            self._cache.popitem(last=False)
+
+    def save(self) -> None:
+        """
+        Écrit les résultats valides du cache dans `cache_file`.
+
+        Le fichier est remplacé d'un coup (fichier temporaire puis
+        renommage) : une interruption ne laisse pas de cache tronqué.
+
+        PRE : `cache_file` est défini
+        POST : Le fichier contient {adresse: [nom, AS, expiration]}
+        RAISES : OSError si le fichier ne peut pas être écrit
+        """
+        now = self.clock()
+        entries = {address: [info.hostname, info.asn, expires]
+                   for address, (expires, info) in self._cache.items() if expires > now}
+        temporary = f"{self.cache_file}.tmp"
+        with open(temporary, "w", encoding="utf-8") as file:
+            json.dump(entries, file)
+        os.replace(temporary, self.cache_file)
+
+
+def _parse_asn(records: list):
+    """Premier numéro d'AS d'une réponse « 15169 | 8.8.8.0/24 | US | ... »."""
+    for record in records:
+        fields = record.split("|")[0].split()
+        if fields and fields[0].isdigit():
+            return int(fields[0])
+    return None
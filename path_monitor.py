@@ -0,0 +1,420 @@
+"""Surveillance des changements de chemin réseau vers une liste de cibles.
+
+Le dernier chemin connu de chaque cible est gardé (en mémoire et, si
+demandé, dans un fichier JSON). À chaque passage, seuls les deux derniers
+sauts connus sont sondés (probe_ttls_async) : si la cible répond toujours
+au même TTL et que le routeur qui la précède est le même, le chemin est
+considéré comme inchangé. Une trace complète n'est lancée que pour une
+nouvelle cible, quand cette vérification échoue ou quand la dernière
+trace complète date de plus de `max_age` secondes (un changement au milieu
+du chemin n'est vu que par une trace complète) ; les différences sont
+alors produites sous forme d'événements.
+
+Comme en mode par lots (traceroute.trace_many), toutes les cibles d'un
+passage sont vérifiées en parallèle sur une même boucle asyncio, avec un
+limiteur de débit commun : un passage dure à peu près le temps de la
+cible la plus lente.
+
+Usage :
+    python path_monitor.py -f cibles.txt -i 300 --state-file chemins.json
+"""
+import argparse
+import asyncio
+import json
+import os
+import time
+from typing import NamedTuple
+
+import traceroute
+from traceroute import MAX_CONCURRENT, MAX_HOPS, PER_TARGET, PROBE_RATE, QUERIES, TIMEOUT, RateLimiter
+
+CHECK_INTERVAL = 300.0   # secondes entre deux passages sur toutes les cibles
+MAX_AGE = 3600.0         # secondes au-delà desquelles un chemin est retracé en entier
+
+# Nature d'un événement
+NEW = "new"              # première trace de la cible
+UNCHANGED = "unchanged"  # vérification rapide réussie (ou trace identique)
+CHANGED = "changed"      # le chemin a changé
+ERROR = "error"          # la cible n'a pas pu être sondée
+
+
+class PathChange(NamedTuple):
+    """Différence à un saut : adresse avant et après (None si absente)."""
+    ttl: int
+    old: str
+    new: str
+
+
+class PathEvent(NamedTuple):
+    """Résultat d'une vérification de chemin."""
+    time: float
+    target: str
+    kind: str
+    path: tuple
+    changes: tuple = ()
+    probes: int = 0
+    error: str = None
+
+
+def path_of(hops) -> tuple:
+    """
+    Retourne le chemin d'une trace : adresse de chaque saut, par TTL.
+
+    PRE : `hops` est un itérable de Hop dans l'ordre des TTL
+    POST : Retourne un tuple d'adresses (None pour un saut sans réponse),
+        sans les sauts sans réponse de fin de trace
+    RAISES : Aucune
+    """
+    path = [hop.address for hop in hops]
+    while path and path[-1] is None:
+        path.pop()
+    return tuple(path)
+
+
+def diff_paths(old, new, exact_length: bool = True) -> list:
+    """
+    Compare deux chemins saut par saut.
+
+    Un saut sans réponse dans l'un des deux chemins n'est pas compté comme
+    un changement (les routeurs limitent souvent leurs réponses ICMP).
+
+    PRE : `old` et `new` sont des séquences d'adresses (voir path_of)
+    POST : Retourne la liste des PathChange, dans l'ordre des TTL ; une
+        différence de longueur n'est comptée que si `exact_length` est vrai
+        (au moins une des deux traces a atteint la cible)
+    RAISES : Aucune
+    """
+    changes = []
+    common = max(len(old), len(new)) if not exact_length else min(len(old), len(new))
+    for ttl in range(1, max(len(old), len(new)) + 1):
+        before = old[ttl - 1] if ttl <= len(old) else None
+        after = new[ttl - 1] if ttl <= len(new) else None
+        if ttl <= common and (before is None or after is None):
+            continue
+        if before != after:
+            changes.append(PathChange(ttl, before, after))
+    return changes
+
+
+def checkpoints(path) -> list:
+    """
+    Retourne les TTL à sonder pour vérifier rapidement un chemin connu.
+
+    PRE : `path` est un chemin (voir path_of)
+    POST : Retourne le TTL du dernier saut connu et celui du saut connu
+        qui le précède (liste vide si aucun saut n'a répondu)
+    RAISES : Aucune
+    """
+    known = [ttl for ttl, address in enumerate(path, 1) if address is not None]
+    return known[-2:]
+
+
+class _ProbeCounter:
+    """Socket de sondes qui compte les sondes réellement envoyées."""
+
+    def __init__(self, probe_socket) -> None:
+        self.probe_socket = probe_socket
+        self.sent = 0
+
+    def send(self, ttl: int, probe: int) -> None:
+        self.sent += 1
+        self.probe_socket.send(ttl, probe)
+
+    def receive(self):
+        return self.probe_socket.receive()
+
+    def fileno(self) -> int:
+        return self.probe_socket.fileno()
+
+    def close(self) -> None:
+        self.probe_socket.close()
+
+
+def _sent(sockets) -> int:
+    return sum(probe_socket.sent for probe_socket in sockets)
+
+
+class PathMonitor:
+    """Dernier chemin connu de chaque cible et vérification incrémentale."""
+
+    def __init__(self, state_file: str = None, max_hops: int = MAX_HOPS, queries: int = QUERIES,
+                 timeout: float = TIMEOUT, protocol: str = "udp",
+                 max_concurrent: int = MAX_CONCURRENT, rate: float = PROBE_RATE,
+                 per_target: int = PER_TARGET, max_age: float = MAX_AGE, open_probe_socket=None,
+                 clock=time.time) -> None:
+        """
+        Initialise le moniteur et charge les chemins de `state_file` s'il existe.
+
+        PRE :
+        - max_hops, queries, timeout et protocol : voir traceroute.iter_hops.
+        - max_concurrent, rate et per_target : voir traceroute.trace_many.
+        - `max_age` (> 0) est l'âge en secondes, selon `clock`, au-delà
+          duquel un chemin est retracé en entier au lieu d'être vérifié.
+        - `open_probe_socket` (optionnel) est une fonction cible -> socket
+          de sondes, appelée pour chaque vérification ou trace.
+
+        POST : Le moniteur est prêt
+        RAISES : Aucune (un fichier d'état illisible est ignoré)
+        """
+        self.state_file = state_file
+        self.max_hops = max_hops
+        self.queries = queries
+        self.timeout = timeout
+        self.protocol = protocol
+        self.max_concurrent = max_concurrent
+        self.rate = rate
+        self.per_target = per_target
+        self.max_age = max_age
+        self.open_probe_socket = open_probe_socket
+        self.clock = clock
+        self.paths = {}
+        self.reached = {}
+        self.traced = {}   # cible -> date de la dernière trace complète
+        if state_file:
+            self.load()
+
+    def check(self, target: str) -> PathEvent:
+        """
+        Vérifie le chemin vers `target` (voir check_async), hors de toute
+        boucle asyncio.
+        """
+        return asyncio.run(self.check_async(target))
+
+    async def check_async(self, target: str, limiter: RateLimiter = None) -> PathEvent:
+        """
+        Vérifie le chemin vers `target` et met à jour le chemin connu.
+
+        PRE : `target` est un nom d'hôte ou une adresse IPv4 ; `limiter`
+            (optionnel) est partagé par les vérifications d'un passage
+        POST : Retourne un PathEvent NEW, UNCHANGED, CHANGED ou ERROR ;
+            `probes` est le nombre de sondes réellement envoyées
+        RAISES : Aucune (les erreurs réseau donnent un événement ERROR)
+        """
+        now = self.clock()
+        old = self.paths.get(target)
+        sockets = []
+        try:
+            fresh = now - self.traced.get(target, float("-inf")) < self.max_age
+            if old is not None and fresh:
+                ttls = checkpoints(old)
+                if ttls:
+                    probe_socket = await self._socket(target, sockets)
+                    if await self._still_valid(target, old, ttls, limiter, probe_socket):
+                        return PathEvent(now, target, UNCHANGED, old, probes=_sent(sockets))
+            hops = await traceroute.trace_async(
+                target, max_hops=self.max_hops, queries=self.queries, timeout=self.timeout,
+                protocol=self.protocol, limiter=limiter, per_target=self.per_target,
+                probe_socket=await self._socket(target, sockets))
+        except (OSError, ValueError) as error:
+            return PathEvent(now, target, ERROR, old or (), probes=_sent(sockets), error=str(error))
+
+        probes = _sent(sockets)
+        path = path_of(hops)
+        reached = any(hop.reached for hop in hops)
+        old_reached = self.reached.get(target, False)
+        self.paths[target] = path
+        self.reached[target] = reached
+        self.traced[target] = now
+        if old is None:
+            return PathEvent(now, target, NEW, path, probes=probes)
+        changes = tuple(diff_paths(old, path, reached or old_reached))
+        return PathEvent(now, target, CHANGED if changes else UNCHANGED, path, changes, probes)
+
+    async def _still_valid(self, target: str, path: tuple, ttls: list, limiter: RateLimiter,
+                           probe_socket) -> bool:
+        """
+        Sonde les TTL de contrôle : chaque saut qui répond doit avoir la même
+        adresse, et seul le dernier saut d'un chemin qui atteignait la cible
+        peut être la cible. Un saut muet (limitation des réponses ICMP) est
+        ignoré ; si aucun ne répond, la vérification n'est pas concluante.
+        """
+        hops = await traceroute.probe_ttls_async(target, ttls, self.queries, self.timeout,
+                                                 self.protocol, limiter, probe_socket)
+        reached = self.reached.get(target, False)
+        answered = [hops[ttl] for ttl in ttls if hops[ttl].address is not None]
+        return bool(answered) and all(
+            hop.address == path[hop.ttl - 1] and hop.reached == (reached and hop.ttl == len(path))
+            for hop in answered)
+
+    async def _socket(self, target: str, sockets: list) -> _ProbeCounter:
+        if self.open_probe_socket:
+            probe_socket = self.open_probe_socket(target)
+        else:
+            probe_socket = await traceroute.open_probe_socket_async(target, self.protocol)
+        sockets.append(_ProbeCounter(probe_socket))
+        return sockets[-1]
+
+    async def check_many(self, targets):
+        """
+        Générateur asynchrone qui vérifie toutes les cibles en parallèle.
+
+        Les vérifications partagent un limiteur de débit de `rate` sondes
+        par seconde ; au plus `max_concurrent` sont actives à la fois.
+
+        PRE : `targets` est un itérable de cibles
+        POST : Produit un PathEvent par cible, dès que sa vérification se
+            termine
+        RAISES : Aucune (voir check_async)
+        """
+        limiter = RateLimiter(self.rate)
+        slots = asyncio.Semaphore(self.max_concurrent)
+
+        async def run(target):
+            async with slots:
+                return await self.check_async(target, limiter)
+
+        tasks = [asyncio.ensure_future(run(target)) for target in targets]
+        try:
+            for finished in asyncio.as_completed(tasks):
+                yield await finished
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    def run(self, targets, interval: float = CHECK_INTERVAL, rounds: int = None, emit=print,
+            verbose: bool = False) -> None:
+        """
+        Vérifie toutes les cibles toutes les `interval` secondes.
+
+        PRE : `targets` est une liste de cibles ; `emit` est appelée avec
+            chaque PathEvent à signaler ; rounds vaut None (sans fin) ou >= 1
+        POST : Les événements NEW, CHANGED et ERROR sont transmis à `emit`
+            (ainsi que UNCHANGED si `verbose`) dès que la vérification de
+            leur cible se termine ; l'état est sauvegardé après chaque passage
+        RAISES : OSError si le fichier d'état ne peut pas être écrit
+        """
+        asyncio.run(self._run(targets, interval, rounds, emit, verbose))
+
+    async def _run(self, targets, interval, rounds, emit, verbose) -> None:
+        done = 0
+        while rounds is None or done < rounds:
+            start = time.monotonic()
+            async for event in self.check_many(targets):
+                if verbose or event.kind != UNCHANGED:
+                    emit(event)
+            if self.state_file:
+                self.save()
+            done += 1
+            if rounds is None or done < rounds:
+                await asyncio.sleep(max(0.0, interval - (time.monotonic() - start)))
+
+# ------------------ Persistent state ------------------
+
+    def load(self) -> None:
+        """
+        Charge les chemins connus depuis `state_file`.
+
+        PRE : Aucune
+        POST : Les chemins du fichier remplacent ceux en mémoire
+        RAISES : Aucune (un fichier absent ou illisible est ignoré)
+        """
+        try:
+            with open(self.state_file, encoding="utf-8") as file:
+                state = json.load(file)
+            paths = {target: tuple(entry["path"]) for target, entry in state.items()}
+            reached = {target: bool(entry["reached"]) for target, entry in state.items()}
+            # Fichier d'un ancien format : chemins retracés au prochain passage
+            traced = {target: float(entry.get("traced", 0.0))
+                      for target, entry in state.items()}
+        except (OSError, ValueError, TypeError, KeyError, AttributeError):
+            return
+        self.paths, self.reached, self.traced = paths, reached, traced
+
+    def save(self) -> None:
+        """
+        Écrit les chemins connus dans `state_file` (remplacé d'un coup).
+
+        PRE : `state_file` est défini
+        POST : Le fichier contient {cible: {"path": [...], "reached": bool,
+            "traced": date de la dernière trace complète}}
+        RAISES : OSError si le fichier ne peut pas être écrit
+        """
+        state = {target: {"path": list(path), "reached": self.reached.get(target, False),
+                          "traced": self.traced.get(target, 0.0)}
+                 for target, path in self.paths.items()}
+        temporary = f"{self.state_file}.tmp"
+        with open(temporary, "w", encoding="utf-8") as file:
+            json.dump(state, file)
+        os.replace(temporary, self.state_file)
+
+
+# ------------------ Events output ------------------
+
+def event_record(event: PathEvent) -> dict:
+    """
+    Convertit un événement en enregistrement JSON.
+
+    PRE : Aucune
+    POST : Retourne un dictionnaire avec `time`, `target`, `event`, `path`,
+        `changes` (liste de {hop, old, new}), `probes` et `error`
+    RAISES : Aucune
+    """
+    return {
+        "time": event.time,
+        "target": event.target,
+        "event": event.kind,
+        "path": list(event.path),
+        "changes": [{"hop": c.ttl, "old": c.old, "new": c.new} for c in event.changes],
+        "probes": event.probes,
+        "error": event.error,
+    }
+
+
+def format_event(event: PathEvent) -> str:
+    stamp = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(event.time))
+    if event.kind == ERROR:
+        return f"[{stamp}] {event.target} : Erreur : {event.error}"
+    if event.kind == NEW:
+        return f"[{stamp}] {event.target} : nouveau chemin ({len(event.path)} sauts)"
+    if event.kind == UNCHANGED:
+        return f"[{stamp}] {event.target} : chemin inchangé ({event.probes} sondes)"
+    changes = ", ".join(f"saut {c.ttl} : {c.old or '*'} -> {c.new or '*'}" for c in event.changes)
+    return f"[{stamp}] {event.target} : chemin modifié ({changes})"
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Surveillance des changements de chemin")
+    parser.add_argument("targets", type=str, nargs="*", help="URL ou Adresses IP à surveiller")
+    parser.add_argument("-f", "--targets-file", type=str, help="Fichier de cibles (une par ligne)")
+    parser.add_argument("-i", "--interval", type=float, default=CHECK_INTERVAL, help="Secondes entre deux passages")
+    parser.add_argument("--rounds", type=int, help="Nombre de passages (par défaut : sans fin)")
+    parser.add_argument("--state-file", type=str, help="Fichier JSON des derniers chemins connus")
+    parser.add_argument("--format", choices=("jsonl", "text"), default="text", help="Format des événements")
+    parser.add_argument("-v", "--verbose", action="store_true", help="Signaler aussi les chemins inchangés")
+    parser.add_argument("-m", "--max-hops", type=int, default=MAX_HOPS, help="Nombre maximal de sauts")
+    parser.add_argument("-q", "--queries", type=int, default=QUERIES, help="Nombre de sondes par saut")
+    parser.add_argument("-w", "--timeout", type=float, default=TIMEOUT, help="Délai d'attente des réponses (secondes)")
+    parser.add_argument("-I", "--icmp", action="store_true", help="Sondes ICMP echo au lieu de UDP")
+    parser.add_argument("--rate", type=float, default=PROBE_RATE, help="Sondes par seconde, toutes cibles confondues")
+    parser.add_argument("--max-concurrent", type=int, default=MAX_CONCURRENT, help="Nombre maximal de vérifications simultanées")
+    parser.add_argument("--per-target", type=int, default=PER_TARGET, help="Sondes en vol par cible (0 : toutes)")
+    parser.add_argument("--max-age", type=float, default=MAX_AGE, help="Secondes après lesquelles un chemin est retracé en entier")
+
+    args = parser.parse_args()
+    targets = list(args.targets)
+    if args.targets_file:
+        targets += traceroute.read_targets(args.targets_file)
+    if not targets:
+        parser.error("indiquer au moins une cible ou --targets-file")
+    if min(args.max_hops, args.queries, args.max_concurrent) < 1:
+        parser.error("--max-hops, --queries et --max-concurrent doivent valoir au moins 1")
+    if args.per_target < 0:
+        parser.error("--per-target ne peut pas être négatif")
+    if args.timeout <= 0 or args.rate <= 0 or args.max_age <= 0 or args.interval < 0:
+        parser.error("--timeout, --rate et --max-age doivent être strictement positifs, --interval positif")
+
+    if args.format == "jsonl":
+        def emit(event):
+            print(json.dumps(event_record(event), ensure_ascii=False), flush=True)
+    else:
+        def emit(event):
+            print(format_event(event), flush=True)
+
+    monitor = PathMonitor(args.state_file, args.max_hops, args.queries, args.timeout,
+                          "icmp" if args.icmp else "udp", args.max_concurrent, args.rate,
+                          args.per_target, args.max_age)
+    try:
+        monitor.run(targets, args.interval, args.rounds, emit, args.verbose)
+    except KeyboardInterrupt:
+        if args.state_file:
+            monitor.save()
@@ -0,0 +1,212 @@
+import unittest
+import sys
+import os
+import asyncio
+import socket
+import struct
+import tempfile
+import threading
+import time
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../")))
+import hop_resolver
+from hop_resolver import HopInfo, Resolver
+
+
+class StubDnsServer:
+    """Serveur DNS local : répond aux requêtes PTR et TXT à partir de
+    dictionnaires (NXDOMAIN pour les noms inconnus), après `delay` secondes."""
+
+    def __init__(self, ptr=None, txt=None, delay=0.0):
+        self.ptr = ptr or {}
+        self.txt = txt or {}
+        self.delay = delay
+        self.queries = []
+        self.sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self.sock.bind(("127.0.0.1", 0))
+        self.address = self.sock.getsockname()
+        self.thread = threading.Thread(target=self._serve, daemon=True)
+        self.thread.start()
+
+    def _serve(self):
+        while True:
+            try:
+                request, client = self.sock.recvfrom(512)
+            except OSError:
+                return
+            name, end = hop_resolver._read_name(request, 12)
+            qtype = struct.unpack_from("!H", request, end)[0]
+            self.queries.append((name, qtype))
+            records = {12: self.ptr, 16: self.txt}[qtype]
+            answer = b""
+            if name in records:
+                value = records[name].encode()
+                data = (hop_resolver._encode_name(records[name]) if qtype == 12
+                        else bytes((len(value),)) + value)
+                answer = struct.pack("!HHHIH", 0xC00C, qtype, 1, 300, len(data)) + data
+            flags = 0x8180 if answer else 0x8183
+            header = struct.pack("!HHHHHH", struct.unpack_from("!H", request)[0], flags,
+                                 1, 1 if answer else 0, 0, 0)
+            time.sleep(self.delay)
+            self.sock.sendto(header + request[12:end + 4] + answer, client)
+
+    def close(self):
+        self.sock.close()
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestHopResolver(unittest.TestCase):
+
+    def setUp(self):
+        self.server = StubDnsServer(
+            ptr={"8.8.8.8.in-addr.arpa": "dns.google", "1.0.0.10.in-addr.arpa": "routeur.local"},
+            txt={"8.8.8.8.origin.asn.cymru.com": "15169 | 8.8.8.0/24 | US | arin | 2014-03-14"})
+
+    def tearDown(self):
+        self.server.close()
+
+    # Test de la résolution du nom et du numéro d'AS, puis du cache
+    def test_resolve(self):
+        clock = FakeClock()
+        resolver = Resolver(self.server.address, clock=clock)
+
+        async def run():
+            first = await resolver.resolve("8.8.8.8")
+            second = await resolver.resolve("8.8.8.8")
+            private = await resolver.resolve("10.0.0.1")
+            unknown = await resolver.resolve("192.0.2.7")
+            return first, second, private, unknown
+
+        first, second, private, unknown = asyncio.run(run())
+        self.assertEqual(first, HopInfo("dns.google", 15169))
+        self.assertEqual(second, first)
+        # Pas de numéro d'AS demandé pour une adresse privée
+        self.assertEqual(private, HopInfo("routeur.local", None))
+        self.assertEqual(unknown, HopInfo(None, None))
+        # 192.0.2.0/24 est réservée : seule la requête PTR est envoyée
+        self.assertEqual(len(self.server.queries), 4)
+        self.assertEqual(resolver.cached("8.8.8.8"), first)
+
+        # Les échecs expirent plus tôt que les réussites
+        clock.now += hop_resolver.NEGATIVE_TTL + 1
+        self.assertIsNone(resolver.cached("192.0.2.7"))
+        self.assertEqual(resolver.cached("8.8.8.8"), first)
+        clock.now += hop_resolver.CACHE_TTL
+        self.assertIsNone(resolver.cached("8.8.8.8"))
+
+    # Test du partage d'une requête entre résolutions simultanées
+    def test_concurrent_lookups(self):
+        self.server.delay = 0.05
+        resolver = Resolver(self.server.address)
+
+        async def run():
+            return await asyncio.gather(*(resolver.resolve("8.8.8.8") for _ in range(20)))
+
+        start = time.perf_counter()
+        results = asyncio.run(run())
+        self.assertLess(time.perf_counter() - start, 0.5)
+        self.assertEqual(set(results), {HopInfo("dns.google", 15169)})
+        self.assertEqual(len(self.server.queries), 2)
+
+    # Test de l'éviction du moins récemment utilisé
+    def test_lru(self):
+        resolver = Resolver(self.server.address, max_entries=2)
+        for address in ("192.0.2.1", "192.0.2.2"):
+            resolver._store(address, HopInfo(address, None), 60)
+        resolver.cached("192.0.2.1")
+        resolver._store("192.0.2.3", HopInfo("c", None), 60)
+        self.assertEqual(len(resolver), 2)
+        self.assertIsNone(resolver.cached("192.0.2.2"))
+        self.assertIsNotNone(resolver.cached("192.0.2.1"))
+
+    # Test de la limite de requêtes en vol et des erreurs locales
+    def test_query_limit(self):
+        from unittest import mock
+        active = [0, 0]
+
+        async def fake_query(name, qtype, nameserver, timeout):
+            active[0] += 1
+            active[1] = max(active)
+            await asyncio.sleep(0.01)
+            active[0] -= 1
+            if name.startswith("9."):
+                raise OSError(24, "Too many open files")
+            return []
+
+        resolver = Resolver(self.server.address, max_queries=5)
+
+        async def run():
+            return await asyncio.gather(*(resolver.resolve(f"192.0.2.{i}") for i in range(1, 41)))
+
+        with mock.patch("hop_resolver.dns_query", fake_query):
+            infos = asyncio.run(run())
+        self.assertEqual(active[1], 5)
+        self.assertEqual(set(infos), {HopInfo(None, None)})
+        # Un échec local n'est pas gardé comme « pas de nom »
+        self.assertEqual(resolver.cached("192.0.2.1"), HopInfo(None, None))
+        self.assertIsNone(resolver.cached("192.0.2.9"))
+        self.assertEqual(len(resolver), 39)
+
+    # Test du délai dépassé : le serveur ne répond pas
+    def test_timeout(self):
+        silent = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        silent.bind(("127.0.0.1", 0))
+        try:
+            resolver = Resolver(silent.getsockname(), timeout=0.1)
+            start = time.perf_counter()
+            info = asyncio.run(resolver.resolve("8.8.8.8"))
+            self.assertEqual(info, HopInfo(None, None))
+            self.assertLess(time.perf_counter() - start, 1)
+        finally:
+            silent.close()
+
+    # Test du cache sur disque et de submit() depuis du code synchrone
+    def test_persistent_cache(self):
+        path = os.path.join(tempfile.mkdtemp(), "noms.json")
+        with Resolver(self.server.address, cache_file=path) as resolver:
+            self.assertEqual(resolver.submit("8.8.8.8").result(2), HopInfo("dns.google", 15169))
+        self.server.queries.clear()
+
+        # Le serveur n'est plus interrogé : le résultat vient du fichier
+        with Resolver(self.server.address, cache_file=path) as resolver:
+            self.assertEqual(resolver.submit("8.8.8.8").result(2), HopInfo("dns.google", 15169))
+        self.assertEqual(self.server.queries, [])
+
+        # Un fichier corrompu est ignoré
+        with open(path, "w") as file:
+            file.write("{pas du json")
+        self.assertEqual(len(Resolver(self.server.address, cache_file=path)), 0)
+        os.remove(path)
+
+    # Test du repli sur le résolveur du système sans /etc/resolv.conf
+    def test_system_resolver(self):
+        from unittest import mock
+        with mock.patch("hop_resolver.default_nameserver", return_value=None):
+            resolver = Resolver(timeout=2)
+        self.assertIsNone(resolver.nameserver)
+        info = asyncio.run(resolver.resolve("127.0.0.1"))
+        self.assertEqual(info, HopInfo(socket.getnameinfo(("127.0.0.1", 0), 0)[0], None))
+        self.assertEqual((resolver.queries, self.server.queries), (1, []))
+
+    # Test d'une réponse tronquée sur un pointeur de compression
+    def test_truncated_pointer(self):
+        header = struct.pack("!HHHHHH", 1, 0x8180, 1, 0, 0, 0)
+        with self.assertRaises(ValueError):
+            hop_resolver._parse_answers(header + b"\xc0", 12)
+        with self.assertRaises(ValueError):
+            hop_resolver._read_name(b"\x01a\xc0", 0)
+
+    def test_asn_query_name(self):
+        self.assertEqual(hop_resolver.asn_query_name("8.8.4.4"), "4.4.8.8.origin.asn.cymru.com")
+        self.assertTrue(hop_resolver.asn_query_name("2001:db8::1").startswith("1.0.0.0."))
+        self.assertTrue(hop_resolver.asn_query_name("2001:db8::1").endswith("8.b.d.0.1.0.0.2.origin6.asn.cymru.com"))
+
+
+if __name__ == "__main__":
+    unittest.main()
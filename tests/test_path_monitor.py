@@ -0,0 +1,159 @@
+import unittest
+import sys
+import os
+import socket
+import tempfile
+import time
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../")))
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+import path_monitor
+from path_monitor import PathChange, PathMonitor, NEW, UNCHANGED, CHANGED, ERROR
+from test_traceroute import SimulatedPath
+
+
+class SimulatedNetwork:
+    """Fabrique de chemins simulés : `routers` peut être modifié entre deux
+    vérifications ; les TTL de toutes les sondes envoyées sont gardés. Les
+    noms en .invalid ne peuvent pas être résolus."""
+
+    def __init__(self, routers, delays=None):
+        self.routers = list(routers)
+        self.delays = delays
+        self.sent = []
+
+    def __call__(self, target):
+        if target.endswith(".invalid"):
+            raise socket.gaierror(f"{target} : nom inconnu")
+        network = self
+
+        class Path(SimulatedPath):
+            def send(self, ttl, probe):
+                network.sent.append(ttl)
+                super().send(ttl, probe)
+
+        return Path(list(self.routers), target=f"cible-{target}", delays=self.delays)
+
+
+class TestPathMonitor(unittest.TestCase):
+
+    def monitor(self, network, **options):
+        return PathMonitor(max_hops=10, queries=2, timeout=0.3, open_probe_socket=network, **options)
+
+    # Test de la vérification rapide d'un chemin stable
+    def test_unchanged(self):
+        network = SimulatedNetwork(["10.0.0.1", "10.0.0.2", "10.0.0.3"])
+        monitor = self.monitor(network)
+        event = monitor.check("a")
+        self.assertEqual(event.kind, NEW)
+        self.assertEqual(event.path, ("10.0.0.1", "10.0.0.2", "10.0.0.3", "cible-a"))
+        self.assertEqual(event.probes, 20)
+
+        network.sent.clear()
+        event = monitor.check("a")
+        self.assertEqual(event.kind, UNCHANGED)
+        # Seuls le dernier saut et celui qui le précède sont sondés
+        self.assertEqual(sorted(network.sent), [3, 3, 4, 4])
+        self.assertEqual(event.probes, 4)
+
+    # Test de la détection d'un changement de routeur, puis de longueur
+    def test_changed(self):
+        network = SimulatedNetwork(["10.0.0.1", "10.0.0.2", "10.0.0.3"])
+        monitor = self.monitor(network)
+        monitor.check("a")
+
+        network.routers[2] = "10.9.9.9"
+        event = monitor.check("a")
+        self.assertEqual(event.kind, CHANGED)
+        self.assertEqual(event.changes, (PathChange(3, "10.0.0.3", "10.9.9.9"),))
+        self.assertEqual(event.probes, 4 + 20)
+        self.assertEqual(monitor.check("a").kind, UNCHANGED)
+
+        # Un saut de plus : la cible ne répond plus au TTL 4
+        network.routers.append("10.0.0.4")
+        event = monitor.check("a")
+        self.assertEqual(event.changes, (PathChange(4, "cible-a", "10.0.0.4"),
+                                         PathChange(5, None, "cible-a")))
+
+        # Un saut de moins : la cible répond dès le TTL 4
+        del network.routers[1]
+        event = monitor.check("a")
+        self.assertEqual(event.kind, CHANGED)
+        self.assertEqual(event.path, ("10.0.0.1", "10.9.9.9", "10.0.0.4", "cible-a"))
+
+    # Test de la trace complète périodique : un changement au milieu du
+    # chemin échappe à la vérification rapide
+    def test_full_retrace(self):
+        network = SimulatedNetwork(["10.0.0.1", "10.0.0.2", "10.0.0.3"])
+        now = [0.0]
+        monitor = self.monitor(network, max_age=100.0, clock=lambda: now[0])
+        monitor.check("a")
+
+        network.routers[0] = "10.9.9.9"
+        now[0] = 99.0
+        self.assertEqual(monitor.check("a").kind, UNCHANGED)
+        now[0] = 100.0
+        event = monitor.check("a")
+        self.assertEqual(event.kind, CHANGED)
+        self.assertEqual(event.changes, (PathChange(1, "10.0.0.1", "10.9.9.9"),))
+        self.assertEqual(event.probes, 20)
+        # L'âge repart de la dernière trace complète
+        now[0] = 199.0
+        self.assertEqual(monitor.check("a").probes, 4)
+
+    # Test du nombre de sondes : seules les sondes envoyées sont comptées
+    def test_probe_count(self):
+        network = SimulatedNetwork(["10.0.0.1", "10.0.0.2", "10.0.0.3"])
+        event = self.monitor(network, per_target=2).check("a")
+        self.assertEqual(event.kind, NEW)
+        self.assertEqual(event.probes, len(network.sent))
+        self.assertLess(event.probes, 20)
+
+    # Test d'un passage : les cibles sont vérifiées en parallèle
+    def test_concurrent_round(self):
+        network = SimulatedNetwork(["10.0.0.1", "10.0.0.2"], delays=[0.1, 0.15, 0.2])
+        targets = [f"cible{i}" for i in range(10)]
+        monitor = self.monitor(network)
+        for kind in (NEW, UNCHANGED):
+            events = []
+            start = time.perf_counter()
+            monitor.run(targets, interval=0, rounds=1, emit=events.append, verbose=True)
+            # 10 x 0.2 s si les cibles étaient vérifiées l'une après l'autre
+            self.assertLess(time.perf_counter() - start, 1.0)
+            self.assertEqual(sorted(e.target for e in events), targets)
+            self.assertEqual({e.kind for e in events}, {kind})
+
+    def test_diff_paths(self):
+        old = ("a", None, "c", "d")
+        self.assertEqual(path_monitor.diff_paths(old, ("a", "b", None, "d")), [])
+        self.assertEqual(path_monitor.diff_paths(old, ("a", "b", "x", "d")), [PathChange(3, "c", "x")])
+        self.assertEqual(path_monitor.diff_paths(old, ("a",)), [PathChange(3, "c", None),
+                                                                PathChange(4, "d", None)])
+        # Sans la cible, des sauts muets en fin de trace ne sont pas un changement
+        self.assertEqual(path_monitor.diff_paths(old, ("a",), exact_length=False), [])
+        self.assertEqual(path_monitor.checkpoints(("a", "b", None)), [1, 2])
+        self.assertEqual(path_monitor.checkpoints((None,)), [])
+
+    # Test du mode surveillance et de l'état sur disque
+    def test_run_and_state(self):
+        network = SimulatedNetwork(["10.0.0.1"])
+        path = os.path.join(tempfile.mkdtemp(), "chemins.json")
+        events = []
+        self.monitor(network, state_file=path).run(["a", "b", "nope.invalid"], interval=0,
+                                                   rounds=2, emit=events.append)
+        # Les événements d'un passage arrivent dans l'ordre de fin des vérifications
+        self.assertEqual(sorted((e.target, e.kind) for e in events[:3]),
+                         [("a", NEW), ("b", NEW), ("nope.invalid", ERROR)])
+        self.assertEqual([(e.target, e.kind) for e in events[3:]], [("nope.invalid", ERROR)])
+
+        # Au redémarrage, les chemins connus évitent une nouvelle trace complète
+        network.sent.clear()
+        monitor = self.monitor(network, state_file=path)
+        self.assertEqual(monitor.check("a").kind, UNCHANGED)
+        self.assertEqual(len(network.sent), 4)
+        record = path_monitor.event_record(monitor.check("b"))
+        self.assertEqual((record["event"], record["path"]), ("unchanged", ["10.0.0.1", "cible-b"]))
+        os.remove(path)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,394 @@
+import unittest
+import sys
+import os
+import asyncio
+import heapq
+import csv
+import io
+import json
+import socket
+import threading
+import time
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../")))
+import traceroute
+from traceroute import Hop, REACHED, TRANSIT, UNREACHABLE
+
+
+class SimulatedPath:
+    """Chemin réseau simulé : chaque routeur répond à une sonde de TTL n
+    après delays[n - 1] secondes, par une socketpair locale. Les réponses
+    sont envoyées par un seul fil d'exécution, dans l'ordre de leur heure."""
+
+    def __init__(self, routers, target="10.0.0.99", delays=None, unreachable=False):
+        self.routers = routers
+        self.target = target
+        self.delays = delays or [0.01] * (len(routers) + 1)
+        self.unreachable = unreachable
+        self.reader, self.writer = socket.socketpair()
+        self.reader.setblocking(False)
+        self.sent = []
+        self.outstanding = 0
+        self.max_outstanding = 0
+        self.replies = []
+        self.condition = threading.Condition()
+        self.closed = False
+        self.thread = threading.Thread(target=self._reply_loop, daemon=True)
+        self.thread.start()
+
+    def fileno(self):
+        return self.reader.fileno()
+
+    def send(self, ttl, probe):
+        self.sent.append((ttl, probe))
+        if ttl <= len(self.routers):
+            address, status = self.routers[ttl - 1], TRANSIT
+        else:
+            address = self.target
+            status = UNREACHABLE if self.unreachable else REACHED
+        if address is None:
+            return
+        delay = self.delays[min(ttl, len(self.delays)) - 1]
+        message = f"{probe} {address} {status}\n".encode()
+        with self.condition:
+            self.outstanding += 1
+            self.max_outstanding = max(self.max_outstanding, self.outstanding)
+            heapq.heappush(self.replies, (time.perf_counter() + delay, len(self.sent), message))
+            self.condition.notify()
+
+    def _reply_loop(self):
+        with self.condition:
+            while not self.closed:
+                now = time.perf_counter()
+                if not self.replies:
+                    self.condition.wait()
+                elif self.replies[0][0] > now:
+                    self.condition.wait(self.replies[0][0] - now)
+                else:
+                    message = heapq.heappop(self.replies)[2]
+                    self.outstanding -= 1
+                    self.writer.send(message)
+
+    def receive(self):
+        try:
+            data = self.reader.recv(65536).decode()
+        except BlockingIOError:
+            return []
+        replies = []
+        for line in data.strip().split("\n"):
+            probe, address, status = line.split()
+            replies.append((int(probe), address, status))
+        return replies
+
+    def close(self):
+        with self.condition:
+            self.closed = True
+            self.condition.notify()
+        self.thread.join()
+        self.reader.close()
+        self.writer.close()
+
+
+class TestTraceroute(unittest.TestCase):
+
+    # Test d'une trace complète sur un chemin simulé
+    def test_simulated_path(self):
+        routers = [f"10.0.0.{i}" for i in range(1, 6)]
+        path = SimulatedPath(routers)
+        hops = traceroute.trace("cible", max_hops=30, timeout=1, probe_socket=path)
+        self.assertEqual([h.address for h in hops], routers + ["10.0.0.99"])
+        self.assertEqual([h.ttl for h in hops], list(range(1, 7)))
+        self.assertTrue(hops[-1].reached)
+        self.assertFalse(any(h.reached for h in hops[:-1]))
+        self.assertTrue(all(len(h.rtts) == 3 and None not in h.rtts for h in hops))
+        # Toutes les sondes sont envoyées avant la première réponse
+        self.assertEqual(len(path.sent), 30 * 3)
+
+    # Test de la concurrence : 30 sauts en un seul délai d'attente
+    def test_concurrent_timeout(self):
+        routers = [f"10.0.1.{i}" for i in range(1, 30)]
+        routers[4] = None
+        path = SimulatedPath(routers, delays=[0.05] * 30)
+        start = time.perf_counter()
+        hops = traceroute.trace("cible", timeout=0.3, probe_socket=path)
+        elapsed = time.perf_counter() - start
+        self.assertLess(elapsed, 0.6)
+        self.assertEqual(len(hops), 30)
+        self.assertEqual(hops[4], Hop(5, None, (None, None, None), False))
+        self.assertTrue(hops[-1].reached)
+
+    # Test de l'ordre de production et de l'arrêt sur « inaccessible »
+    def test_order_and_unreachable(self):
+        routers = ["10.0.2.1", "10.0.2.2", "10.0.2.3"]
+        # Les réponses des sauts lointains arrivent en premier
+        path = SimulatedPath(routers, delays=[0.2, 0.15, 0.1, 0.05], unreachable=True)
+        produced = [hop.ttl for hop in traceroute.iter_hops(
+            "cible", max_hops=10, queries=1, timeout=1, probe_socket=path)]
+        self.assertEqual(produced, [1, 2, 3, 4])
+        self.assertFalse(traceroute.trace("cible", max_hops=10, queries=1, timeout=1,
+                                          probe_socket=SimulatedPath(routers, unreachable=True))[-1].reached)
+
+    # Test du mode par lots : durée de la cible la plus lente, pas de la somme
+    def test_trace_many(self):
+        paths = {f"cible{i}": SimulatedPath([f"10.1.{i}.1", f"10.1.{i}.2"],
+                                            delays=[0.1, 0.15, 0.2])
+                 for i in range(40)}
+
+        def open_probe_socket(target):
+            if target == "erreur":
+                raise OSError("socket indisponible")
+            return paths[target]
+
+        async def collect():
+            results = []
+            async for result in traceroute.trace_many(
+                    list(paths) + ["erreur"], max_concurrent=50, rate=100_000,
+                    open_probe_socket=open_probe_socket, timeout=1):
+                results.append(result)
+            return results
+
+        start = time.perf_counter()
+        results = asyncio.run(collect())
+        elapsed = time.perf_counter() - start
+        self.assertLess(elapsed, 1.0)
+        self.assertEqual(len(results), 41)
+        # L'erreur est produite en premier (la trace échoue immédiatement)
+        target, hops, error = results[0]
+        self.assertEqual((target, hops), ("erreur", None))
+        self.assertIsInstance(error, OSError)
+        for target, hops, error in results[1:]:
+            self.assertIsNone(error)
+            self.assertEqual(len(hops), 3)
+            self.assertTrue(hops[-1].reached)
+
+    # Test du limiteur de débit et de la limite de sondes en vol par cible
+    def test_rate_and_per_target(self):
+        path = SimulatedPath([None] * 29)
+        limiter = traceroute.RateLimiter(300, burst=30)
+        start = time.perf_counter()
+        asyncio.run(traceroute.trace_async("cible", timeout=0.05, limiter=limiter,
+                                           probe_socket=path))
+        # 90 sondes : 30 en rafale, puis 60 au rythme de 300 par seconde
+        self.assertGreaterEqual(time.perf_counter() - start, 0.18)
+
+        # Les créneaux sont servis dans l'ordre d'arrivée
+        limiter = traceroute.RateLimiter(200, burst=1)
+        served = []
+
+        async def wait(i):
+            await limiter.acquire()
+            served.append(i)
+
+        async def gather():
+            await asyncio.gather(*(wait(i) for i in range(20)))
+
+        start = time.perf_counter()
+        asyncio.run(gather())
+        self.assertGreaterEqual(time.perf_counter() - start, 0.09)
+        self.assertEqual(served, list(range(20)))
+
+        routers = [f"10.2.0.{i}" for i in range(1, 10)]
+        path = SimulatedPath(routers, delays=[0.01] * 10)
+        hops = asyncio.run(traceroute.trace_async("cible", timeout=1, per_target=4,
+                                                  probe_socket=path))
+        self.assertLessEqual(path.max_outstanding, 4)
+        self.assertEqual([h.address for h in hops], routers + ["10.0.0.99"])
+        # Aucune sonde au-delà de la cible une fois celle-ci atteinte
+        self.assertLessEqual(max(ttl for ttl, _ in path.sent), 11)
+
+    # Test du sondage de quelques TTL seulement (vérification de path_monitor)
+    def test_probe_ttls(self):
+        path = SimulatedPath(["10.5.0.1", None, "10.5.0.3"])
+        hops = asyncio.run(traceroute.probe_ttls_async("cible", [4, 2, 4], queries=2, timeout=0.2,
+                                                       probe_socket=path))
+        self.assertEqual(sorted(ttl for ttl, _ in path.sent), [2, 2, 4, 4])
+        self.assertEqual(hops[2], Hop(2, None, (None, None), False))
+        self.assertEqual((hops[4].address, hops[4].reached), ("10.0.0.99", True))
+
+    # Test des options hors limites : erreur plutôt que boucle sans fin
+    def test_invalid_options(self):
+        path = SimulatedPath(["10.2.0.1"])
+        with self.assertRaises(ValueError):
+            asyncio.run(traceroute.trace_async("cible", per_target=-1, probe_socket=path))
+        with self.assertRaises(ValueError):
+            traceroute.trace("cible", queries=0, probe_socket=SimulatedPath(["10.2.0.1"]))
+        with self.assertRaises(ValueError):
+            traceroute.RateLimiter(0)
+
+        async def collect(**options):
+            return [result async for result in traceroute.trace_many(["cible"], **options)]
+
+        for options in ({"rate": 0}, {"max_concurrent": 0}):
+            with self.assertRaises(ValueError):
+                asyncio.run(collect(**options))
+
+    # Test de la lecture d'un fichier de cibles
+    def test_read_targets(self):
+        import tempfile
+        with tempfile.NamedTemporaryFile("w", suffix=".txt", delete=False) as file:
+            file.write("10.0.0.1\n\n# commentaire\nexemple.org  # routeur\n")
+        try:
+            self.assertEqual(traceroute.read_targets(file.name), ["10.0.0.1", "exemple.org"])
+        finally:
+            os.remove(file.name)
+
+    # Test réel sur l'interface de bouclage (sondes UDP, file d'erreurs Linux)
+    @unittest.skipUnless(sys.platform.startswith("linux"), "IP_RECVERR est propre à Linux")
+    def test_loopback(self):
+        hops = traceroute.trace("127.0.0.1", max_hops=5, timeout=1)
+        self.assertEqual(len(hops), 1)
+        self.assertEqual(hops[0].address, "127.0.0.1")
+        self.assertTrue(hops[0].reached)
+        self.assertNotIn(None, hops[0].rtts)
+        hops = asyncio.run(traceroute.trace_async("localhost", max_hops=5, timeout=1))
+        self.assertEqual([(h.address, h.reached) for h in hops], [("127.0.0.1", True)])
+
+    # Test du repli sur tracert (Windows) : options transmises ou refusées
+    def test_tracert_options(self):
+        from unittest import mock
+        output = ("\nDétermination de l'itinéraire vers 127.0.0.1\n"
+                  "  1    <1 ms    <1 ms    <1 ms  127.0.0.1\n")
+        process = mock.Mock(stdout=io.StringIO(output))
+        with mock.patch("traceroute.subprocess.Popen", return_value=process) as popen:
+            hops = list(traceroute._tracert_hops("127.0.0.1", max_hops=7, timeout=1.5))
+        self.assertEqual(popen.call_args[0][0], ["tracert", "-h", "7", "-w", "1500", "127.0.0.1"])
+        self.assertEqual(hops, [Hop(1, "127.0.0.1", (0.001,) * 3, True)])
+        with self.assertRaises(ValueError):
+            list(traceroute._tracert_hops("127.0.0.1", queries=5))
+        with self.assertRaises(ValueError):
+            list(traceroute._tracert_hops("127.0.0.1", protocol="udp"))
+        process.stdout = io.StringIO(output)
+        with mock.patch("traceroute.subprocess.Popen", return_value=process) as popen:
+            list(traceroute._tracert_hops("127.0.0.1", resolve=False))
+        self.assertEqual(popen.call_args[0][0][:2], ["tracert", "-d"])
+        # Sans protocole indiqué, run_traceroute choisit ICMP sous Windows
+        process.stdout = io.StringIO(output)
+        with mock.patch("traceroute.subprocess.Popen", return_value=process), \
+                mock.patch("traceroute.sys.platform", "win32"), \
+                mock.patch("sys.stdout", io.StringIO()) as stdout:
+            traceroute.run_traceroute("127.0.0.1", False, None)
+        self.assertIn("127.0.0.1", stdout.getvalue())
+        # Le mode lot est refusé d'emblée sous Windows, avant toute sonde
+        with mock.patch("traceroute.sys.platform", "win32"), \
+                mock.patch("traceroute.read_targets") as read_targets:
+            with self.assertRaisesRegex(ValueError, "Windows"):
+                traceroute.run_batch("cibles.txt", None)
+        read_targets.assert_not_called()
+
+    # Test du format d'affichage d'un saut
+    def test_format_hop(self):
+        line = traceroute.format_hop(Hop(3, "10.0.0.3", (0.0012, None), False))
+        self.assertEqual(line, "  3     1.200 ms            *  10.0.0.3")
+        self.assertIn("Délai d'attente dépassé.", traceroute.format_hop(Hop(4, None, (None,), False)))
+
+    # Test de l'analyse des lignes de tracert et de format_hop
+    def test_parse_hop_line(self):
+        hop = traceroute.parse_hop_line("  2    12 ms    <1 ms     *     routeur.fai.net [10.1.2.3]", "10.1.2.3")
+        self.assertEqual(hop, Hop(2, "10.1.2.3", (0.012, 0.001, None), True, "routeur.fai.net"))
+        hop = traceroute.parse_hop_line("  5     *        *        *     Délai d'attente de la demande dépassé.")
+        self.assertEqual(hop, Hop(5, None, (None, None, None), False))
+        hop = traceroute.parse_hop_line(" 11     1 ms     1 ms     2 ms  192.0.2.1")
+        self.assertEqual(hop.address, "192.0.2.1")
+        self.assertIsNone(traceroute.parse_hop_line("Détermination de l'itinéraire vers exemple.org [93.184.216.34]"))
+        self.assertIsNone(traceroute.parse_hop_line(""))
+        # Aller-retour avec format_hop
+        original = Hop(7, "2001:db8::1", (0.0015, None, 0.0025), False)
+        self.assertEqual(traceroute.parse_hop_line(traceroute.format_hop(original)), original)
+        original = original._replace(hostname="r1.exemple.net", asn=64500)
+        self.assertEqual(traceroute.parse_hop_line(traceroute.format_hop(original)), original)
+
+    # Test des sorties JSONL et CSV
+    def test_structured_output(self):
+        hops = [Hop(1, "10.0.0.1", (0.001, None), False), Hop(2, "10.0.0.99", (0.002, 0.004), True)]
+        record = traceroute.hop_record(hops[0], "cible")
+        self.assertEqual(record, {"target": "cible", "hop": 1, "address": "10.0.0.1",
+                                  "hostname": None, "asn": None, "rtts_ms": [1.0, None], "sent": 2, "lost": 1,
+                                  "loss": 0.5, "reached": False})
+
+        stream = io.StringIO()
+        writer = traceroute.JsonlWriter(stream)
+        for hop in hops:
+            writer.write(hop, "cible")
+        writer.write_error("autre", OSError("introuvable"))
+        lines = [json.loads(line) for line in stream.getvalue().splitlines()]
+        self.assertEqual([line.get("hop") for line in lines], [1, 2, None])
+        self.assertEqual(lines[2], {"target": "autre", "error": "introuvable"})
+
+        stream = io.StringIO()
+        writer = traceroute.CsvWriter(stream)
+        for hop in hops:
+            writer.write(hop, "cible")
+        rows = list(csv.DictReader(io.StringIO(stream.getvalue())))
+        self.assertEqual(rows[0]["rtts_ms"], "1.000 *")
+        self.assertEqual((rows[1]["rtt_min_ms"], rows[1]["rtt_avg_ms"], rows[1]["rtt_max_ms"]),
+                         ("2.000", "3.000", "4.000"))
+        self.assertEqual(rows[1]["reached"], "True")
+
+    # Test de l'écriture au fil de l'eau : chaque saut est vidé dès sa réception
+    def test_streaming_output(self):
+        class Recorder(io.StringIO):
+            flushed = []
+
+            def flush(self):
+                self.flushed.append(self.getvalue().count("\n"))
+
+        stream = Recorder()
+        writer = traceroute.JsonlWriter(stream, flush=True)
+        for ttl in range(1, 4):
+            writer.write(Hop(ttl, None, (None,), False), "cible")
+        self.assertEqual(stream.flushed, [1, 2, 3])
+
+    # Test de la résolution des noms hors du chemin critique de la trace
+    def test_annotate(self):
+        from hop_resolver import HopInfo
+
+        class SlowResolver:
+            """Résolveur factice : chaque recherche prend 50 ms."""
+
+            def __init__(self):
+                from concurrent.futures import ThreadPoolExecutor
+                self.pool = ThreadPoolExecutor(8)
+
+            def submit(self, address):
+                return self.pool.submit(lambda: time.sleep(0.05) or HopInfo(f"r-{address}", 64500))
+
+            async def resolve(self, address):
+                await asyncio.sleep(0.05)
+                return HopInfo(f"r-{address}", 64500)
+
+        routers = [f"10.3.0.{i}" for i in range(1, 9)]
+        hops = [Hop(ttl, address, (0.001,), False) for ttl, address in enumerate(routers, 1)]
+        hops.append(Hop(9, None, (None,), False))
+        start = time.perf_counter()
+        annotated = list(traceroute.annotate(iter(hops), SlowResolver()))
+        # Les recherches se recouvrent : bien moins que 8 x 50 ms
+        self.assertLess(time.perf_counter() - start, 0.3)
+        self.assertEqual([h.ttl for h in annotated], list(range(1, 10)))
+        self.assertEqual(annotated[0].hostname, "r-10.3.0.1")
+        self.assertEqual(annotated[0].asn, 64500)
+        self.assertEqual(annotated[8], hops[8])
+        annotated = asyncio.run(traceroute.annotate_async(hops, SlowResolver()))
+        self.assertEqual([h.hostname for h in annotated], [f"r-{a}" for a in routers] + [None])
+
+        # En mode par lots, chaque trace est résolue dans sa propre tâche
+        paths = {f"cible{i}": SimulatedPath([f"10.4.{i}.1"]) for i in range(10)}
+
+        class SlowerResolver(SlowResolver):
+            async def resolve(self, address):
+                await asyncio.sleep(0.2)
+                return HopInfo(f"r-{address}", 64500)
+
+        async def collect():
+            return [result async for result in traceroute.trace_many(
+                list(paths), rate=100_000, open_probe_socket=paths.get,
+                resolver=SlowerResolver(), timeout=1)]
+
+        start = time.perf_counter()
+        results = asyncio.run(collect())
+        # 10 traces x 0.2 s si les résolutions s'enchaînaient
+        self.assertLess(time.perf_counter() - start, 1.0)
+        self.assertEqual(sorted(hops[0].hostname for _, hops, _ in results),
+                         sorted(f"r-10.4.{i}.1" for i in range(10)))
+
+
+if __name__ == "__main__":
+    unittest.main()
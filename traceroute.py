@@ -1,33 +1,932 @@
 import argparse
+import asyncio
+import csv
+import errno
+import ipaddress
+import json
+import re
+import selectors
+import socket
+import struct
 import subprocess
+import sys
+import time
+from collections import deque
+from typing import NamedTuple
 
-def run_traceroute(target, progressive, output_file):
-    traceroute_cmd = ["tracert", target]
+from hop_resolver import Resolver
 
-    if progressive:
-        print("\n--- Mode Progressif Activé ---\n")
-        process = subprocess.Popen(traceroute_cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
-        for line in iter(process.stdout.readline, ""):
-            print(line.strip())
+# Ports de destination des sondes UDP (convention de traceroute) :
+# la sonde n° i est envoyée au port BASE_PORT + i
+BASE_PORT = 33434
+MAX_HOPS = 30
+QUERIES = 3
+TIMEOUT = 2.0
 
+# Mode par lots : sondes par seconde (toutes cibles confondues), traces
+# simultanées, sondes en vol par cible (0 : toutes d'un coup)
+PROBE_RATE = 2000
+MAX_CONCURRENT = 256
+PER_TARGET = 0
+
+# Constantes Linux absentes du module socket de certaines versions de Python
+IP_RECVERR = getattr(socket, "IP_RECVERR", 11)
+MSG_ERRQUEUE = getattr(socket, "MSG_ERRQUEUE", 0x2000)
+# struct sock_extended_err, suivie de l'adresse (sockaddr_in) du routeur
+_EXTENDED_ERR = struct.Struct("=IBBBBII")
+_SO_EE_ORIGIN_ICMP = 2
+_ICMP_ECHO_REQUEST = 8
+_ICMP_ECHO_REPLY = 0
+_ICMP_TIME_EXCEEDED = 11
+_ICMP_DEST_UNREACH = 3
+_ICMP_PORT_UNREACH = 3
+
+# Nature d'une réponse à une sonde
+TRANSIT = "transit"          # « time exceeded » : routeur intermédiaire
+REACHED = "reached"          # la cible a répondu
+UNREACHABLE = "unreachable"  # « destination unreachable » (!N, !H, !X...) : fin de la trace
+
+
+class Hop(NamedTuple):
+    """Résultat d'un saut : adresse du routeur et temps de réponse (en
+    secondes, None pour une sonde sans réponse). Le nom inverse et le
+    numéro d'AS ne sont connus qu'après résolution (voir annotate)."""
+    ttl: int
+    address: str
+    rtts: tuple
+    reached: bool
+    hostname: str = None
+    asn: int = None
+
+
+# ------------------ Probe sockets ------------------
+
+class UdpProbeSocket:
+    """Sondes UDP à TTL limité, sans privilège particulier.
+
+    Avec l'option IP_RECVERR, le noyau place les messages ICMP reçus en
+    réponse (« time exceeded » d'un routeur, « port unreachable » de la
+    cible) dans la file d'erreurs du socket, avec l'adresse de destination
+    de la sonde d'origine : son port identifie la sonde.
+    """
+
+    def __init__(self, address: str, base_port: int = BASE_PORT) -> None:
+        self.address = address
+        self.base_port = base_port
+        self.sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self.sock.setsockopt(socket.SOL_IP, IP_RECVERR, 1)
+        self.sock.setblocking(False)
+
+    def fileno(self) -> int:
+        return self.sock.fileno()
+
+    def send(self, ttl: int, probe: int) -> None:
+        self.sock.setsockopt(socket.SOL_IP, socket.IP_TTL, ttl)
+        _send(self.sock, b"\0" * 32, (self.address, self.base_port + probe))
+
+    def receive(self) -> list:
+        """
+        Retourne les réponses disponibles, sans attendre.
+
+        PRE : Aucune
+        POST : Retourne une liste de triplets (sonde, adresse du routeur,
+            TRANSIT, REACHED ou UNREACHABLE)
+        RAISES : Aucune
+        """
+        replies = []
+        for _, origin_port, router, icmp_type, code in _read_errors(self.sock):
+            if icmp_type == _ICMP_TIME_EXCEEDED:
+                status = TRANSIT
+            elif code == _ICMP_PORT_UNREACH and router == self.address:
+                status = REACHED
+            else:
+                status = UNREACHABLE
+            replies.append((origin_port - self.base_port, router, status))
+        return replies
+
+    def close(self) -> None:
+        self.sock.close()
+
+
+class IcmpProbeSocket:
+    """Sondes ICMP « echo request » à TTL limité (socket ICMP datagramme).
+
+    La sonde est identifiée par le numéro de séquence ICMP ; la réponse de
+    la cible arrive normalement, celles des routeurs dans la file d'erreurs
+    (qui contient l'en-tête ICMP de la sonde d'origine). Sous Linux, le
+    groupe de l'utilisateur doit figurer dans net.ipv4.ping_group_range.
+    """
+
+    def __init__(self, address: str) -> None:
+        self.address = address
+        try:
+            self.sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM, socket.IPPROTO_ICMP)
+        except PermissionError:
+            raise PermissionError(
+                "Sondes ICMP non autorisées (voir net.ipv4.ping_group_range).") from None
+        self.sock.setsockopt(socket.SOL_IP, IP_RECVERR, 1)
+        self.sock.setblocking(False)
+
+    def fileno(self) -> int:
+        return self.sock.fileno()
+
+    def send(self, ttl: int, probe: int) -> None:
+        # Le noyau calcule la somme de contrôle et choisit l'identifiant
+        packet = struct.pack("!BBHHH", _ICMP_ECHO_REQUEST, 0, 0, 0, probe) + b"\0" * 24
+        self.sock.setsockopt(socket.SOL_IP, socket.IP_TTL, ttl)
+        _send(self.sock, packet, (self.address, 0))
+
+    def receive(self) -> list:
+        """
+        Retourne les réponses disponibles, sans attendre : erreurs ICMP de
+        la file d'erreurs et réponses echo de la cible.
+
+        PRE : Aucune
+        POST : Retourne une liste de triplets (sonde, adresse du routeur,
+            TRANSIT, REACHED ou UNREACHABLE)
+        RAISES : Aucune
+        """
+        replies = []
+        for data, _, router, icmp_type, _ in _read_errors(self.sock):
+            if len(data) >= 8:
+                status = TRANSIT if icmp_type == _ICMP_TIME_EXCEEDED else UNREACHABLE
+                replies.append((struct.unpack_from("!H", data, 6)[0], router, status))
+        while True:
+            try:
+                data, (sender, _) = self.sock.recvfrom(512)
+            except (BlockingIOError, InterruptedError):
+                break
+            if len(data) >= 8 and data[0] == _ICMP_ECHO_REPLY:
+                replies.append((struct.unpack_from("!H", data, 6)[0], sender, REACHED))
+        return replies
+
+    def close(self) -> None:
+        self.sock.close()
+
+
+def _send(sock: socket.socket, payload: bytes, destination: tuple) -> None:
+    """Envoie une sonde. Une erreur ICMP en attente (IP_RECVERR) fait
+    échouer l'envoi suivant sans rien envoyer : on recommence."""
+    for _ in range(3):
+        try:
+            sock.sendto(payload, destination)
+            return
+        except OSError as error:
+            if error.errno not in (errno.ECONNREFUSED, errno.EHOSTUNREACH,
+                                   errno.ENETUNREACH, errno.EPROTO):
+                raise
+
+
+def _read_errors(sock: socket.socket):
+    """Générateur des erreurs ICMP de la file d'erreurs du socket :
+    (données d'origine, port d'origine, adresse du routeur, type et code ICMP)."""
+    while True:
+        try:
+            data, ancillary, _, origin = sock.recvmsg(512, 512, MSG_ERRQUEUE)
+        except (BlockingIOError, InterruptedError):
+            return
+        for level, kind, value in ancillary:
+            if level != socket.SOL_IP or kind != IP_RECVERR:
+                continue
+            _, source, icmp_type, code, _, _, _ = _EXTENDED_ERR.unpack_from(value)
+            if source != _SO_EE_ORIGIN_ICMP:
+                continue
+            router = socket.inet_ntoa(value[_EXTENDED_ERR.size + 4:_EXTENDED_ERR.size + 8])
+            yield data, origin[1], router, icmp_type, code
+
+
+# ------------------ Concurrent trace engine ------------------
+
+class _TraceState:
+    """État d'une trace : heure d'envoi, réponse et routeur de chaque sonde.
+
+    La sonde n° i porte le TTL i // queries + 1. Une sonde est terminée
+    quand elle a une réponse ou que son délai d'attente est écoulé ; un saut
+    est terminé quand toutes ses sondes le sont.
+    """
+
+    def __init__(self, max_hops: int, queries: int, timeout: float) -> None:
+        if max_hops < 1 or queries < 1:
+            raise ValueError("Le nombre de sauts et de sondes par saut doit être au moins 1.")
+        if timeout <= 0:
+            raise ValueError("Le délai d'attente doit être strictement positif.")
+        self.max_hops = max_hops
+        self.queries = queries
+        self.timeout = timeout
+        self.count = max_hops * queries
+        self.sent = [None] * self.count
+        self.rtts = [None] * self.count
+        self.routers = [None] * self.count
+        self.statuses = [None] * self.count
+        # Premier TTL ayant reçu une réponse finale (cible ou inaccessible)
+        self.destination = max_hops + 1
+        self.reached = False
+        self.next_ttl = 1
+
+    @property
+    def last_ttl(self) -> int:
+        return min(self.destination, self.max_hops)
+
+    @property
+    def finished(self) -> bool:
+        return self.next_ttl > self.last_ttl
+
+    def send(self, probe_socket, probe: int) -> None:
+        self.sent[probe] = time.perf_counter()
+        probe_socket.send(probe // self.queries + 1, probe)
+
+    def record(self, replies, now: float) -> None:
+        """Enregistre des triplets (sonde, adresse, nature) reçus à l'instant `now`."""
+        for probe, router, status in replies:
+            if 0 <= probe < self.count and self.sent[probe] is not None \
+                    and self.rtts[probe] is None:
+                self.rtts[probe] = now - self.sent[probe]
+                self.routers[probe] = router
+                self.statuses[probe] = status
+                if status != TRANSIT:
+                    ttl = probe // self.queries + 1
+                    if ttl < self.destination:
+                        self.destination, self.reached = ttl, status == REACHED
+
+    def pending(self, now: float) -> list:
+        """Heures d'expiration des sondes envoyées, sans réponse et non expirées."""
+        return [sent + self.timeout for sent, rtt in zip(self.sent, self.rtts)
+                if sent is not None and rtt is None and now < sent + self.timeout]
+
+    def completed(self, now: float) -> list:
+        """Retire et retourne les sauts terminés, dans l'ordre des TTL."""
+        hops = []
+        while not self.finished:
+            first = (self.next_ttl - 1) * self.queries
+            probes = range(first, first + self.queries)
+            if any(self.rtts[i] is None and (self.sent[i] is None
+                                             or now < self.sent[i] + self.timeout)
+                   for i in probes):
+                break
+            address = next((self.routers[i] for i in probes if self.routers[i]), None)
+            hops.append(Hop(self.next_ttl, address, tuple(self.rtts[first:first + self.queries]),
+                            self.reached and self.next_ttl == self.destination))
+            self.next_ttl += 1
+        return hops
+
+
+def _open_probe_socket(address: str, protocol: str):
+    return (IcmpProbeSocket if protocol == "icmp" else UdpProbeSocket)(address)
+
+
+def iter_hops(target: str, max_hops: int = MAX_HOPS, queries: int = QUERIES,
+              timeout: float = TIMEOUT, protocol: str = "udp", probe_socket=None):
+    """
+    Générateur des sauts vers `target`, toutes les sondes étant envoyées
+    en même temps.
+
+    Les sondes de tous les TTL partent d'un coup ; les réponses sont
+    associées à leur sonde (port ou numéro de séquence). Un saut est
+    produit dès que ses sondes et celles des sauts précédents ont toutes
+    une réponse, ou à l'expiration du délai : une trace complète dure au
+    plus `timeout` secondes, quel que soit le nombre de sauts.
+
+    PRE :
+    - `target` est un nom d'hôte ou une adresse IPv4.
+    - max_hops >= 1, queries >= 1, timeout > 0, protocol vaut "udp" ou "icmp".
+    - `probe_socket` (optionnel) remplace le socket de sondes : il fournit
+      send(ttl, sonde), receive() (liste de triplets (sonde, adresse,
+      TRANSIT/REACHED/UNREACHABLE)), fileno() et close().
+
+    POST : Produit des Hop dans l'ordre des TTL, jusqu'à la cible (incluse),
+        jusqu'au premier routeur signalant la destination inaccessible,
+        ou jusqu'à max_hops
+    RAISES :
+    - socket.gaierror si le nom d'hôte ne peut pas être résolu
+    - PermissionError si les sondes ICMP ne sont pas autorisées
+    - ValueError si max_hops, queries ou timeout sont hors limites
+    """
+    if probe_socket is None:
+        probe_socket = _open_probe_socket(socket.gethostbyname(target), protocol)
+    selector = selectors.DefaultSelector()
+    try:
+        state = _TraceState(max_hops, queries, timeout)
+        for probe in range(state.count):
+            state.send(probe_socket, probe)
+        selector.register(probe_socket, selectors.EVENT_READ)
+        while not state.finished:
+            now = time.perf_counter()
+            pending = state.pending(now)
+            if pending:
+                selector.select(min(pending) - now)
+            now = time.perf_counter()
+            state.record(probe_socket.receive(), now)
+            yield from state.completed(now)
+    finally:
+        selector.close()
+        probe_socket.close()
+
+
+def trace(target: str, **options) -> list:
+    """
+    Retourne la liste complète des sauts vers `target` (voir iter_hops).
+
+    PRE : voir iter_hops
+    POST : Retourne une liste de Hop
+    RAISES : voir iter_hops
+    """
+    return list(iter_hops(target, **options))
+
+
+def format_hop(hop: Hop) -> str:
+    times = "  ".join(f"{rtt * 1000:8.3f} ms" if rtt is not None else f"{'*':>11}"
+                      for rtt in hop.rtts)
+    address = hop.address or "Délai d'attente dépassé."
+    if hop.hostname:
+        address = f"{hop.hostname} [{address}]"
+    if hop.asn is not None:
+        address += f"  AS{hop.asn}"
+    return f"{hop.ttl:>3}  {times}  {address}"
+
+
+# ------------------ Name resolution ------------------
+
+def annotate(hops, resolver: Resolver):
+    """
+    Ajoute le nom inverse et le numéro d'AS aux sauts, sans ralentir la trace.
+
+    La résolution de chaque saut est lancée dès qu'il arrive et se fait
+    pendant que les sauts suivants sont sondés ; un saut est produit dès
+    que sa résolution (et celle des sauts précédents) est terminée.
+
+    PRE : `hops` est un itérable de Hop dans l'ordre des TTL
+    POST : Produit les mêmes sauts, dans le même ordre, avec `hostname` et
+        `asn` renseignés quand ils sont connus
+    RAISES : Aucune
+    """
+    waiting = deque()
+    for hop in hops:
+        waiting.append((hop, resolver.submit(hop.address) if hop.address else None))
+        while waiting and (waiting[0][1] is None or waiting[0][1].done()):
+            yield _with_info(*waiting.popleft())
+    while waiting:
+        yield _with_info(*waiting.popleft())
+
+
+async def annotate_async(hops: list, resolver: Resolver) -> list:
+    """
+    Version asynchrone d'annotate pour une trace complète (mode par lots).
+
+    PRE : `resolver` n'est utilisé que depuis la boucle courante
+    POST : Retourne la liste des sauts avec `hostname` et `asn` renseignés
+    RAISES : Aucune
+    """
+    async def resolve(hop):
+        return await resolver.resolve(hop.address) if hop.address else None
+
+    infos = await asyncio.gather(*(resolve(hop) for hop in hops))
+    return [_add_info(hop, info) for hop, info in zip(hops, infos)]
+
+
+def _with_info(hop: Hop, future) -> Hop:
+    return _add_info(hop, future.result() if future is not None else None)
+
+
+def _add_info(hop: Hop, info) -> Hop:
+    if info is None:
+        return hop
+    # tracert donne parfois déjà le nom : il est conservé
+    return hop._replace(hostname=hop.hostname or info.hostname, asn=info.asn)
+
+
+# ------------------ Batch mode (asyncio) ------------------
+
+class RateLimiter:
+    """Limiteur de débit partagé par toutes les traces d'un lot : au plus
+    `rate` sondes par seconde, avec des rafales d'au plus `burst` sondes.
+
+    Chaque appel reçoit le créneau suivant, dans l'ordre d'arrivée, et
+    n'attend qu'une fois : les traces en attente ne sont pas toutes
+    réveillées à chaque sonde envoyée.
+    """
+
+    def __init__(self, rate: float, burst: int = None) -> None:
+        if rate <= 0:
+            raise ValueError("Le débit de sondes doit être strictement positif.")
+        self.rate = rate
+        self.burst = burst or max(1, int(rate // 10))
+        self.interval = 1 / rate
+        # Heure du prochain créneau libre ; la rafale initiale est disponible
+        self.next_slot = time.perf_counter() - (self.burst - 1) * self.interval
+
+    async def acquire(self) -> None:
+        """
+        Attend qu'une sonde puisse être envoyée.
+
+        PRE : Appelée depuis une boucle asyncio
+        POST : Un créneau est réservé et son heure est atteinte
+        RAISES : Aucune
+        """
+        now = time.perf_counter()
+        # Un limiteur inactif n'accumule pas plus de `burst` créneaux
+        slot = max(self.next_slot, now - (self.burst - 1) * self.interval)
+        self.next_slot = slot + self.interval
+        if slot > now:
+            await asyncio.sleep(slot - now)
+
+
+async def trace_async(target: str, max_hops: int = MAX_HOPS, queries: int = QUERIES,
+                      timeout: float = TIMEOUT, protocol: str = "udp",
+                      limiter: RateLimiter = None, per_target: int = PER_TARGET,
+                      probe_socket=None) -> list:
+    """
+    Trace `target` sans bloquer la boucle asyncio.
+
+    Les réponses sont lues par un lecteur enregistré sur la boucle ; les
+    sondes sont envoyées au rythme autorisé par `limiter`, avec au plus
+    `per_target` sondes sans réponse à la fois (0 : aucune limite). Chaque
+    sonde a son propre délai d'attente.
+
+    PRE : voir iter_hops ; per_target >= 0
+    POST : Retourne la liste des Hop (voir iter_hops)
+    RAISES : voir iter_hops (ValueError aussi si per_target < 0)
+    """
+    if per_target < 0:
+        raise ValueError("Le nombre de sondes en vol par cible ne peut pas être négatif.")
+    loop = asyncio.get_running_loop()
+    state = _TraceState(max_hops, queries, timeout)
+    if probe_socket is None:
+        probe_socket = await open_probe_socket_async(target, protocol)
+    wakeup = asyncio.Event()
+
+    def on_readable():
+        state.record(probe_socket.receive(), time.perf_counter())
+        wakeup.set()
+
+    hops = []
+    fd = probe_socket.fileno()
+    loop.add_reader(fd, on_readable)
+    try:
+        window = per_target or state.count
+        probe = 0
+        while not state.finished:
+            # Inutile de sonder au-delà de la destination déjà connue
+            while probe < state.last_ttl * queries \
+                    and len(state.pending(time.perf_counter())) < window:
+                if limiter is not None:
+                    await limiter.acquire()
+                state.send(probe_socket, probe)
+                probe += 1
+            now = time.perf_counter()
+            hops += state.completed(now)
+            pending = state.pending(now)
+            if state.finished or not pending:
+                continue
+            wakeup.clear()
+            try:
+                await asyncio.wait_for(wakeup.wait(), min(pending) - now)
+            except asyncio.TimeoutError:
+                pass
+    finally:
+        loop.remove_reader(fd)
+        probe_socket.close()
+    return hops
+
+
+async def probe_ttls_async(target: str, ttls, queries: int = QUERIES, timeout: float = TIMEOUT,
+                           protocol: str = "udp", limiter: RateLimiter = None,
+                           probe_socket=None) -> dict:
+    """
+    Sonde seulement quelques TTL vers `target`, sans tracer tout le chemin.
+
+    Sert à vérifier rapidement qu'un chemin connu n'a pas changé (voir
+    path_monitor) : queries sondes par TTL demandé au lieu de
+    max_hops * queries pour une trace complète. Les sondes partent au
+    rythme de `limiter` (voir trace_async) et l'attente des réponses ne
+    bloque pas la boucle.
+
+    PRE : `ttls` est un itérable non vide d'entiers >= 1 ; pour le reste,
+        voir iter_hops
+    POST : Retourne un dictionnaire TTL -> Hop (reached est vrai si la
+        cible elle-même a répondu à ce TTL)
+    RAISES : voir iter_hops
+    """
+    loop = asyncio.get_running_loop()
+    ttls = sorted(set(ttls))
+    state = _TraceState(ttls[-1], queries, timeout)
+    if probe_socket is None:
+        probe_socket = await open_probe_socket_async(target, protocol)
+    wakeup = asyncio.Event()
+
+    def on_readable():
+        state.record(probe_socket.receive(), time.perf_counter())
+        wakeup.set()
+
+    fd = probe_socket.fileno()
+    loop.add_reader(fd, on_readable)
+    try:
+        for ttl in ttls:
+            for probe in range((ttl - 1) * queries, ttl * queries):
+                if limiter is not None:
+                    await limiter.acquire()
+                state.send(probe_socket, probe)
+        while True:
+            now = time.perf_counter()
+            pending = state.pending(now)
+            if not pending:
+                break
+            wakeup.clear()
+            try:
+                await asyncio.wait_for(wakeup.wait(), min(pending) - now)
+            except asyncio.TimeoutError:
+                pass
+    finally:
+        loop.remove_reader(fd)
+        probe_socket.close()
+    hops = {}
+    for ttl in ttls:
+        probes = range((ttl - 1) * queries, ttl * queries)
+        hops[ttl] = Hop(ttl, next((state.routers[i] for i in probes if state.routers[i]), None),
+                        tuple(state.rtts[i] for i in probes),
+                        any(state.statuses[i] == REACHED for i in probes))
+    return hops
+
+
+async def open_probe_socket_async(target: str, protocol: str = "udp"):
+    """
+    Ouvre un socket de sondes vers `target` sans bloquer la boucle asyncio.
+
+    PRE : `target` est un nom d'hôte ou une adresse IPv4 ; `protocol` vaut
+        "udp" ou "icmp"
+    POST : Retourne le socket de sondes (voir UdpProbeSocket, IcmpProbeSocket)
+    RAISES : OSError si le nom ne peut pas être résolu ou le socket ouvert
+    """
+    infos = await asyncio.get_running_loop().getaddrinfo(
+        target, None, family=socket.AF_INET, type=socket.SOCK_DGRAM)
+    return _open_probe_socket(infos[0][4][0], protocol)
+
+
+async def trace_many(targets, max_concurrent: int = MAX_CONCURRENT, rate: float = PROBE_RATE,
+                     open_probe_socket=None, resolver=None, **options):
+    """
+    Générateur asynchrone qui trace de nombreuses cibles en parallèle.
+
+    Toutes les traces partagent un limiteur de débit de `rate` sondes par
+    seconde ; au plus `max_concurrent` traces (et donc sockets) sont
+    actives à la fois. Les résultats sont produits dès qu'une trace se
+    termine : la durée totale dépend de la cible la plus lente, pas de la
+    somme des traces.
+
+    PRE :
+    - `targets` est un itérable de noms d'hôtes ou d'adresses IPv4.
+    - max_concurrent >= 1, rate > 0.
+    - `open_probe_socket` (optionnel) est une fonction cible -> socket de
+      sondes (voir iter_hops) ; `options` est passé à trace_async.
+    - `resolver` (optionnel) : les sauts de chaque trace sont annotés
+      (annotate_async) dans la tâche de la cible, sans bloquer les autres.
+
+    POST : Produit des triplets (cible, liste de Hop, None) ou
+        (cible, None, exception) si la trace a échoué
+    RAISES : ValueError si max_concurrent < 1 ou rate <= 0 (les erreurs
+        des traces sont produites avec la cible concernée)
+    """
+    if max_concurrent < 1:
+        raise ValueError("Le nombre de traces simultanées doit être au moins 1.")
+    limiter = RateLimiter(rate)
+    slots = asyncio.Semaphore(max_concurrent)
+
+    async def run(target):
+        async with slots:
+            try:
+                probe_socket = open_probe_socket(target) if open_probe_socket else None
+                hops = await trace_async(target, limiter=limiter,
+                                         probe_socket=probe_socket, **options)
+            except (OSError, ValueError) as error:
+                return target, None, error
+        # La résolution ne garde pas de place : la trace est déjà terminée
+        if resolver is not None:
+            hops = await annotate_async(hops, resolver)
+        return target, hops, None
+
+    tasks = [asyncio.ensure_future(run(target)) for target in targets]
+    try:
+        for finished in asyncio.as_completed(tasks):
+            yield await finished
+    finally:
+        for task in tasks:
+            task.cancel()
+
+
+def read_targets(path: str) -> list:
+    """
+    Lit un fichier de cibles : une par ligne, lignes vides et commentaires
+    (#) ignorés.
+
+    PRE : `path` est un fichier texte lisible
+    POST : Retourne la liste des cibles, dans l'ordre du fichier
+    RAISES : OSError si le fichier ne peut pas être lu
+    """
+    with open(path, encoding="utf-8") as file:
+        lines = (line.split("#", 1)[0].strip() for line in file)
+        return [line for line in lines if line]
+
+
+# ------------------ Structured output ------------------
+
+# Ligne de saut de tracert (Windows) ou de format_hop : numéro, colonnes
+# de temps ("12 ms", "<1 ms", "1.234 ms" ou "*"), puis adresse ou message
+_HOP_LINE = re.compile(r"^\s*(\d+)\s+((?:(?:<?\d+(?:\.\d+)?\s*ms|\*)\s*)+)(.*)$")
+_RTT = re.compile(r"(<)?(\d+(?:\.\d+)?)\s*ms|\*")
+_BRACKETED = re.compile(r"\[([0-9A-Fa-f.:]+)\]")
+_ASN = re.compile(r"\s+AS(\d+)\s*$")
+
+CSV_FIELDS = ("target", "hop", "address", "hostname", "asn", "rtts_ms", "rtt_min_ms", "rtt_avg_ms",
+              "rtt_max_ms", "sent", "lost", "loss", "reached", "error")
+
+
+def parse_hop_line(line: str, destination: str = None):
+    """
+    Analyse une ligne de saut produite par tracert ou par format_hop.
+
+    Un temps « <1 ms » de tracert est compté comme 1 ms (borne supérieure).
+
+    PRE : `destination` est l'adresse IP de la cible, si elle est connue
+    POST : Retourne un Hop (address vaut None si aucun routeur n'a répondu,
+        reached est vrai si l'adresse est `destination` ; le nom et le
+        numéro d'AS sont repris s'ils figurent sur la ligne), ou None si la
+        ligne ne décrit pas un saut (en-tête, ligne vide...)
+    RAISES : Aucune
+    """
+    match = _HOP_LINE.match(line)
+    if match is None:
+        return None
+    ttl, times, rest = match.groups()
+    rtts = tuple(None if rtt.group(0) == "*" else float(rtt.group(2)) / 1000
+                 for rtt in _RTT.finditer(times))
+    asn = _ASN.search(rest)
+    if asn is not None:
+        rest = rest[:asn.start()]
+    bracketed = _BRACKETED.search(rest)
+    candidate = bracketed.group(1) if bracketed else (rest.split() or [""])[0]
+    try:
+        address = str(ipaddress.ip_address(candidate))
+    except ValueError:
+        address = None
+    hostname = (rest[:bracketed.start()].strip() or None) if bracketed else None
+    return Hop(int(ttl), address, rtts, address is not None and address == destination,
+               hostname, int(asn.group(1)) if asn else None)
+
+
+def hop_record(hop: Hop, target: str = None) -> dict:
+    """
+    Convertit un saut en enregistrement structuré.
+
+    PRE : Aucune
+    POST : Retourne un dictionnaire avec `target`, `hop`, `address`,
+        `hostname`, `asn`, `rtts_ms` (None pour une sonde perdue), `sent`, `lost`, `loss`
+        (proportion de sondes perdues) et `reached`
+    RAISES : Aucune
+    """
+    rtts = [None if rtt is None else round(rtt * 1000, 3) for rtt in hop.rtts]
+    lost = rtts.count(None)
+    return {
+        "target": target,
+        "hop": hop.ttl,
+        "address": hop.address,
+        "hostname": hop.hostname,
+        "asn": hop.asn,
+        "rtts_ms": rtts,
+        "sent": len(rtts),
+        "lost": lost,
+        "loss": round(lost / len(rtts), 3) if rtts else 0.0,
+        "reached": hop.reached,
+    }
+
+
+class TextWriter:
+    """Écrit les sauts au format texte de format_hop, une ligne par saut.
+
+    Les écrivains reçoivent les sauts un par un et n'en gardent aucun en
+    mémoire ; avec flush=True, chaque saut est écrit dans le fichier
+    dès qu'il est connu.
+    """
+
+    def __init__(self, file, flush: bool = False) -> None:
+        self.file = file
+        self.flush_each = flush
+
+    def begin(self, target: str) -> None:
+        """Marque le début des résultats de `target` (mode par lots)."""
+        self._emit(f"# {target}")
+
+    def write(self, hop: Hop, target: str = None) -> None:
+        self._emit(format_hop(hop))
+
+    def write_error(self, target: str, error: Exception) -> None:
+        self._emit(f"Erreur : {error}")
+
+    def flush(self) -> None:
+        self.file.flush()
+
+    def _emit(self, line: str) -> None:
+        self.file.write(line + "\n")
+        if self.flush_each:
+            self.file.flush()
+
+
+class JsonlWriter(TextWriter):
+    """Écrit un objet JSON par saut (voir hop_record)."""
+
+    def begin(self, target: str) -> None:
+        pass
+
+    def write(self, hop: Hop, target: str = None) -> None:
+        self._emit(json.dumps(hop_record(hop, target), ensure_ascii=False))
+
+    def write_error(self, target: str, error: Exception) -> None:
+        self._emit(json.dumps({"target": target, "error": str(error)}, ensure_ascii=False))
+
+
+class CsvWriter(TextWriter):
+    """Écrit une ligne CSV par saut, colonnes CSV_FIELDS (en-tête compris).
+
+    `rtts_ms` contient les temps séparés par des espaces, « * » pour une
+    sonde perdue. Tous les temps (y compris min, moyenne et max) sont en
+    millisecondes avec trois décimales.
+    """
+
+    def __init__(self, file, flush: bool = False) -> None:
+        super().__init__(file, flush)
+        self.csv = csv.writer(file, lineterminator="\n")
+        self._row(CSV_FIELDS)
+
+    def begin(self, target: str) -> None:
+        pass
+
+    def write(self, hop: Hop, target: str = None) -> None:
+        record = hop_record(hop, target)
+        times = [rtt for rtt in record["rtts_ms"] if rtt is not None]
+        if times:
+            stats = [f"{rtt:.3f}" for rtt in (min(times), sum(times) / len(times), max(times))]
+        else:
+            stats = [None] * 3
+        self._row((target, hop.ttl, hop.address, hop.hostname, hop.asn,
+                   " ".join("*" if rtt is None else f"{rtt:.3f}" for rtt in record["rtts_ms"]),
+                   *stats, record["sent"], record["lost"], record["loss"], hop.reached, None))
+
+    def write_error(self, target: str, error: Exception) -> None:
+        self._row((target,) + (None,) * (len(CSV_FIELDS) - 2) + (str(error),))
+
+    def _row(self, values) -> None:
+        self.csv.writerow(values)
+        if self.flush_each:
+            self.file.flush()
+
+
+WRITERS = {"text": TextWriter, "jsonl": JsonlWriter, "csv": CsvWriter}
+
+
+def _open_writers(output_file, output_format, flush):
+    """
+    Retourne (fichier ouvert ou None, liste d'écrivains) : le texte va à
+    l'écran, le format demandé au fichier ; sans fichier, un format
+    structuré remplace le texte sur la sortie standard.
+    """
+    file = open(output_file, "w", encoding="utf-8", newline="") if output_file else None
+    writers = []
+    if file is not None or output_format == "text":
+        writers.append(TextWriter(sys.stdout, flush))
+    if file is not None or output_format != "text":
+        writers.append(WRITERS[output_format](file or sys.stdout, flush))
+    return file, writers
+
+
+# ------------------ Command line ------------------
+
+def run_traceroute(target, progressive, output_file, max_hops=MAX_HOPS,
+                   queries=QUERIES, timeout=TIMEOUT, protocol=None, output_format="text",
+                   resolver=None):
+    if protocol is None:
+        # Sous Windows, tracert sonde toujours en ICMP
+        protocol = "icmp" if sys.platform == "win32" else "udp"
+    if output_format == "text" or output_file:
+        print("\n--- Mode Progressif Activé ---\n" if progressive else "\n--- Mode Standard ---\n")
+    if sys.platform == "win32":
+        # Pas de file d'erreurs ICMP sous Windows : on analyse la sortie de
+        # tracert, qui résout déjà les noms (-d quand la résolution est coupée)
+        hops = _tracert_hops(target, max_hops, queries, timeout, protocol,
+                             resolve=resolver is not None)
     else:
-        print("\n--- Mode Standard ---\n")
-        result = subprocess.run(traceroute_cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
-        print(result.stdout)
+        hops = iter_hops(target, max_hops, queries, timeout, protocol)
+        if resolver is not None:
+            hops = annotate(hops, resolver)
+
+    file, writers = _open_writers(output_file, output_format, progressive)
+    try:
+        for hop in hops:
+            for writer in writers:
+                writer.write(hop, target)
+    finally:
+        for writer in writers:
+            writer.flush()
+        if file:
+            file.close()
+
+
+def run_batch(targets_file, output_file, max_concurrent=MAX_CONCURRENT, rate=PROBE_RATE,
+              per_target=PER_TARGET, output_format="text", resolver=None, **options):
+    # Les sondes du mode lot passent par des sockets bruts et loop.add_reader,
+    # que ni Windows ni sa boucle asyncio par défaut ne fournissent
+    if sys.platform == "win32":
+        raise ValueError("Le mode lot (--targets-file) n'est pas supporté sous Windows : tracer les cibles une par une")
+    targets = read_targets(targets_file)
+    if output_format == "text" or output_file:
+        print(f"\n--- Mode Lot : {len(targets)} cibles ---\n")
+    return asyncio.run(_run_batch(targets, output_file, output_format, max_concurrent, rate,
+                                  resolver, per_target=per_target, **options))
+
+
+async def _run_batch(targets, output_file, output_format, max_concurrent, rate, resolver, **options):
+    file, writers = _open_writers(output_file, output_format, False)
+    try:
+        async for target, hops, error in trace_many(targets, max_concurrent, rate,
+                                                    resolver=resolver, **options):
+            # Chaque trace est écrite et vidée dès qu'elle se termine
+            for writer in writers:
+                writer.begin(target)
+                if error is not None:
+                    writer.write_error(target, error)
+                else:
+                    for hop in hops:
+                        writer.write(hop, target)
+                writer.flush()
+    finally:
+        if file:
+            file.close()
+
+
+def _tracert_hops(target, max_hops=MAX_HOPS, queries=QUERIES, timeout=TIMEOUT, protocol="icmp",
+                  resolve=True):
+    # tracert envoie toujours 3 sondes ICMP echo par saut : ces options ne
+    # peuvent pas être transmises, elles sont refusées plutôt qu'ignorées
+    if queries != QUERIES:
+        raise ValueError(f"tracert envoie toujours {QUERIES} sondes par saut (--queries non supporté sous Windows)")
+    if protocol != "icmp":
+        raise ValueError("tracert n'utilise que des sondes ICMP (pas de sondes UDP sous Windows)")
+    try:
+        destination = socket.gethostbyname(target)
+    except OSError:
+        destination = None
+    command = ["tracert", "-h", str(max_hops), "-w", str(max(1, round(timeout * 1000))), target]
+    if not resolve:
+        command.insert(1, "-d")
+    process = subprocess.Popen(command, stdout=subprocess.PIPE,
+                               stderr=subprocess.PIPE, text=True)
+    for line in iter(process.stdout.readline, ""):
+        hop = parse_hop_line(line, destination)
+        if hop is not None:
+            yield hop
+    process.wait()
 
-        if output_file:
-            with open(output_file, "w", encoding="utf-8") as file:
-                file.write(result.stdout)
 
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="Traceroute Tool")
-    parser.add_argument("target", type=str, help="URL ou Adresse IP à tracer")
+    parser.add_argument("target", type=str, nargs="?", help="URL ou Adresse IP à tracer")
     parser.add_argument("-p", "--progressive", action="store_true", help="Afficher le traceroute en temps réel")
     parser.add_argument("-o", "--output-file", type=str, help="Nom du fichier de sortie pour enregistrer le traceroute")
+    parser.add_argument("-m", "--max-hops", type=int, default=MAX_HOPS, help="Nombre maximal de sauts")
+    parser.add_argument("-q", "--queries", type=int, default=QUERIES, help="Nombre de sondes par saut")
+    parser.add_argument("-w", "--timeout", type=float, default=TIMEOUT, help="Délai d'attente des réponses (secondes)")
+    parser.add_argument("-I", "--icmp", action="store_true", help="Sondes ICMP echo au lieu de UDP")
+    parser.add_argument("-f", "--targets-file", type=str, help="Fichier de cibles (une par ligne) à tracer en parallèle")
+    parser.add_argument("--rate", type=float, default=PROBE_RATE, help="Sondes par seconde, toutes cibles confondues")
+    parser.add_argument("--max-concurrent", type=int, default=MAX_CONCURRENT, help="Nombre maximal de traces simultanées")
+    parser.add_argument("--per-target", type=int, default=PER_TARGET, help="Sondes en vol par cible (0 : toutes)")
+    parser.add_argument("--format", choices=sorted(WRITERS), default="text", help="Format de sortie (fichier, ou écran sans --output-file)")
+    parser.add_argument("-n", "--no-resolve", action="store_true", help="Ne pas résoudre les noms ni les numéros d'AS des sauts")
+    parser.add_argument("--resolve-cache", type=str, help="Fichier JSON où garder les noms résolus d'une exécution à l'autre")
+    parser.add_argument("--nameserver", type=str, help="Serveur DNS à interroger (par défaut : /etc/resolv.conf, sinon résolveur du système)")
 
     args = parser.parse_args()
+    if (args.target is None) == (args.targets_file is None):
+        parser.error("indiquer une cible ou --targets-file (mais pas les deux)")
+    if args.targets_file and sys.platform == "win32":
+        parser.error("--targets-file n'est pas supporté sous Windows : tracer les cibles une par une")
+    if min(args.max_hops, args.queries, args.max_concurrent) < 1:
+        parser.error("--max-hops, --queries et --max-concurrent doivent valoir au moins 1")
+    if args.per_target < 0:
+        parser.error("--per-target ne peut pas être négatif")
+    if args.timeout <= 0 or args.rate <= 0:
+        parser.error("--timeout et --rate doivent être strictement positifs")
+    # Sous Windows, tracert sonde toujours en ICMP
+    protocol = "icmp" if args.icmp or sys.platform == "win32" else "udp"
+    resolver = None if args.no_resolve else Resolver(args.nameserver, cache_file=args.resolve_cache)
 
     try:
-        run_traceroute(args.target, args.progressive, args.output_file)
+        if args.targets_file:
+            run_batch(args.targets_file, args.output_file, args.max_concurrent, args.rate,
+                      args.per_target, args.format, resolver, max_hops=args.max_hops,
+                      queries=args.queries, timeout=args.timeout, protocol=protocol)
+        else:
+            run_traceroute(args.target, args.progressive, args.output_file, args.max_hops,
+                           args.queries, args.timeout, protocol, args.format, resolver)
     except Exception as e:
         print(f"Erreur lors de l'exécution du traceroute : {e}")
+    finally:
+        if resolver is not None:
+            resolver.close()